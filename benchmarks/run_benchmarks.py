@@ -0,0 +1,160 @@
+"""
+Sustainability Communications Framework - Benchmark Suite
+
+Measures throughput and peak memory of the ContentAnalyzer methods over
+synthetic regulatory corpora, writes the results as JSON and compares them
+against a stored baseline, failing on regressions.
+
+Usage:
+    python benchmarks/run_benchmarks.py --sizes 1KB 100KB 1MB --output results.json
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json --threshold 0.25
+
+Author: Begoña Penón
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from content_analyzer import ContentAnalyzer  # noqa: E402
+from synthetic_corpus import CorpusGenerator  # noqa: E402
+
+
+METHODS = [
+    'detect_keywords',
+    'scan_keywords',
+    'analyze_text_complexity',
+    'extract_key_concepts',
+    'assess_translation_readiness',
+    'generate_communication_recommendations'
+]
+
+UNITS = {'KB': 1 << 10, 'MB': 1 << 20, 'GB': 1 << 30}
+
+
+def parse_size(value: str) -> int:
+    """'100KB' -> 102400; plain integers are bytes."""
+    value = value.strip().upper()
+    for unit, factor in UNITS.items():
+        if value.endswith(unit):
+            return int(float(value[:-len(unit)]) * factor)
+    return int(value)
+
+
+def method_runner(method: str, segments: List[str], text: str) -> Callable[[], object]:
+    """Zero-argument callable running one method on a fresh analyser."""
+    if method == 'detect_keywords':
+        return lambda: ContentAnalyzer(segments).detect_keywords()
+    return lambda: getattr(ContentAnalyzer([]), method)(text)
+
+
+def measure(run: Callable[[], object], repeat: int) -> Dict:
+    """Best wall time over `repeat` runs, then peak traced memory of one more run."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'seconds': min(timings), 'peak_bytes': peak}
+
+
+def run_suite(sizes: List[int], methods: List[str], keyword_density: float,
+              legalese_density: float, repeat: int) -> Dict:
+    generator = CorpusGenerator(keyword_density=keyword_density, legalese_density=legalese_density)
+    results = {}
+    for size in sizes:
+        segments = generator.segments(size)
+        text = '\n'.join(segments)
+        actual = len(text.encode('utf-8'))
+        for method in methods:
+            # Big corpora are slow enough that a single timed run is representative
+            timing = measure(method_runner(method, segments, text), repeat if actual < (10 << 20) else 1)
+            results[f'{method}@{size}'] = {
+                'method': method,
+                'size_bytes': actual,
+                'seconds': round(timing['seconds'], 6),
+                'mb_per_second': round(actual / (1 << 20) / timing['seconds'], 4) if timing['seconds'] else None,
+                'peak_bytes': timing['peak_bytes']
+            }
+            print(f"{method:<40} {actual:>12,d} B  {results[f'{method}@{size}']['mb_per_second']:>10} MB/s"
+                  f"  peak {timing['peak_bytes'] / (1 << 20):8.2f} MB", file=sys.stderr)
+
+    return {
+        'environment': {'python': platform.python_version(), 'platform': platform.platform()},
+        'corpus': {'keyword_density': keyword_density, 'legalese_density': legalese_density},
+        'results': results
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Regressions of `current` against `baseline`.
+
+    A benchmark regresses when its throughput drops, or its peak memory grows,
+    by more than `threshold` (a fraction, e.g. 0.2 for 20%).
+    """
+    regressions = []
+    for key, base in baseline.get('results', {}).items():
+        result = current['results'].get(key)
+        if result is None:
+            continue
+        if base.get('mb_per_second') and result['mb_per_second'] is not None:
+            if result['mb_per_second'] < base['mb_per_second'] * (1 - threshold):
+                regressions.append(
+                    f"{key}: throughput {result['mb_per_second']} MB/s < baseline {base['mb_per_second']} MB/s"
+                )
+        if base.get('peak_bytes') and result['peak_bytes'] > base['peak_bytes'] * (1 + threshold):
+            regressions.append(f"{key}: peak memory {result['peak_bytes']} B > baseline {base['peak_bytes']} B")
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the ContentAnalyzer on synthetic regulatory corpora.')
+    parser.add_argument('--sizes', nargs='+', default=['1KB', '100KB', '1MB'],
+                        help='corpus sizes, e.g. 1KB 1MB 100MB')
+    parser.add_argument('--methods', nargs='+', default=METHODS, choices=METHODS)
+    parser.add_argument('--keyword-density', type=float, default=0.05)
+    parser.add_argument('--legalese-density', type=float, default=0.01)
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per benchmark (best is kept)')
+    parser.add_argument('--output', help='write results JSON here')
+    parser.add_argument('--baseline', help='baseline JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed regression as a fraction')
+    parser.add_argument('--save-baseline', help='write results as the new baseline')
+    args = parser.parse_args(argv)
+
+    results = run_suite([parse_size(size) for size in args.sizes], args.methods,
+                        args.keyword_density, args.legalese_density, args.repeat)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as handle:
+                json.dump(results, handle, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as handle:
+            regressions = compare(results, json.load(handle), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    if not args.output and not args.save_baseline:
+        print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
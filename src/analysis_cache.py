@@ -0,0 +1,193 @@
+"""
+Sustainability Communications Framework - Analysis Result Cache
+
+Content-addressed cache for ContentAnalyzer results. Entries are keyed on a
+hash of the normalised text plus a fingerprint of the analyser configuration,
+kept in an in-memory LRU tier and optionally persisted to an SQLite file so
+boilerplate texts are analysed once across runs and processes.
+
+Author: Begoña Penón
+"""
+
+import functools
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from text_profile import TextProfile
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalisation applied before hashing.
+
+    Only changes that cannot affect any analysis result: line endings and
+    surrounding whitespace.
+    """
+    return text.replace('\r\n', '\n').strip()
+
+
+def cache_key(method: str, text: str, config_fingerprint: str, params: tuple = ()) -> str:
+    """Content address for one analysis call."""
+    digest = hashlib.sha256()
+    for part in (method, repr(params), config_fingerprint, normalize_text(text)):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    Two-tier (memory LRU + SQLite) cache of JSON-serialisable analysis results.
+
+    Both tiers are bounded by the total size of the stored JSON; the least
+    recently used entries are evicted first. Results are stored serialised, so
+    callers always receive a fresh copy they are free to mutate.
+    """
+
+    def __init__(self, max_memory_bytes: int = 64 << 20, path: Optional[str] = None,
+                 max_disk_bytes: int = 512 << 20):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.path = path
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._memory: 'OrderedDict[str, str]' = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self._db = None
+        self._disk_bytes = 0
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+            self._db.commit()
+            self._disk_bytes = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached result for a key, or None on a miss."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return json.loads(value)
+
+            if self._db is not None:
+                row = self._db.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+                if row is not None:
+                    self._db.execute('UPDATE results SET accessed = ? WHERE key = ?', (time.time(), key))
+                    self._db.commit()
+                    self.disk_hits += 1
+                    self._remember(key, row[0])
+                    return json.loads(row[0])
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, result: Dict):
+        """Store a result in every tier."""
+        value = json.dumps(result)
+        with self._lock:
+            self._remember(key, value)
+            if self._db is not None:
+                self._persist(key, value)
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and tier sizes."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0,
+            'evictions': self.evictions,
+            'memory_entries': len(self._memory),
+            'memory_bytes': self._memory_bytes,
+            'disk_bytes': self._disk_bytes
+        }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self._db is not None:
+                self._db.execute('DELETE FROM results')
+                self._db.commit()
+                self._disk_bytes = 0
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _remember(self, key: str, value: str):
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = value
+        self._memory_bytes += len(value)
+
+        while self._memory_bytes > self.max_memory_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+
+    def _persist(self, key: str, value: str):
+        db = self._db
+        row = db.execute('SELECT size FROM results WHERE key = ?', (key,)).fetchone()
+        if row is not None:
+            self._disk_bytes -= row[0]
+        db.execute('INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)',
+                   (key, value, len(value), time.time()))
+        self._disk_bytes += len(value)
+
+        # Evict least recently accessed rows until back under budget
+        while self._disk_bytes > self.max_disk_bytes:
+            rows = db.execute('SELECT key, size FROM results ORDER BY accessed LIMIT 64').fetchall()
+            if not rows:
+                break
+            for evicted_key, size in rows:
+                db.execute('DELETE FROM results WHERE key = ?', (evicted_key,))
+                self._disk_bytes -= size
+                self.evictions += 1
+                if self._disk_bytes <= self.max_disk_bytes:
+                    break
+        db.commit()
+
+
+def cached_analysis(method: Callable) -> Callable:
+    """
+    Route a ContentAnalyzer text analysis through the analyser's cache, if one is set.
+
+    Profiles are passed straight through: they come from pipelines that are
+    themselves cached at the top level.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, text, *args, **kwargs):
+        cache = self.cache
+        if cache is None or isinstance(text, TextProfile):
+            return method(self, text, *args, **kwargs)
+
+        key = cache_key(name, text, self.config_fingerprint(), (args, tuple(sorted(kwargs.items()))))
+        result = cache.get(key)
+        if result is None:
+            result = method(self, text, *args, **kwargs)
+            cache.put(key, result)
+        return result
+
+    return wrapper
@@ -0,0 +1,239 @@
+"""
+Sustainability Communications Framework - Analysis Metrics
+
+Per-stage instrumentation for the ContentAnalyzer pipeline: wall-time
+histograms for tokenisation, syllable counting, keyword scanning, phrase
+n-grams, regex extraction and recommendation rules, plus document and byte
+counters. Snapshots are plain dicts and can be exported in the Prometheus
+text exposition format for batch jobs to scrape.
+
+Author: Begoña Penón
+"""
+
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional
+
+
+# Histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+STAGES = ('tokenize', 'syllables', 'keyword_scan', 'phrase_ngrams', 'regex_extraction', 'recommendations')
+
+_NO_OP = nullcontext()
+
+
+class StageHistogram:
+    """Wall-time distribution of one pipeline stage."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float):
+        index = 0
+        for bound in self.buckets:
+            if seconds <= bound:
+                break
+            index += 1
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.total += seconds
+
+    def cumulative(self) -> List[int]:
+        running = 0
+        counts = []
+        for count in self.bucket_counts:
+            running += count
+            counts.append(running)
+        return counts
+
+
+class AnalysisMetrics:
+    """Thread-safe stage timings and counters for an instrumented analyser."""
+
+    enabled = True
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.stages: Dict[str, StageHistogram] = {}
+        self.documents = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one observation of `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            histogram = self.stages.get(name)
+            if histogram is None:
+                histogram = self.stages[name] = StageHistogram(self.buckets)
+            histogram.observe(seconds)
+
+    def document(self) -> 'DocumentStages':
+        """A collector for one document's stage times, recorded together when it is done."""
+        return DocumentStages(self)
+
+    def count_document(self, size_bytes: int):
+        with self._lock:
+            self.documents += 1
+            self.bytes += size_bytes
+
+    def merge(self, other: 'AnalysisMetrics'):
+        """Add another collector's observations (e.g. from a worker process) to this one."""
+        with self._lock:
+            for name, theirs in other.stages.items():
+                histogram = self.stages.get(name)
+                if histogram is None:
+                    histogram = self.stages[name] = StageHistogram(self.buckets)
+                if histogram.buckets != theirs.buckets:
+                    raise ValueError(f"Cannot merge stage {name!r} with different histogram buckets")
+                histogram.bucket_counts = [mine + count for mine, count
+                                           in zip(histogram.bucket_counts, theirs.bucket_counts)]
+                histogram.count += theirs.count
+                histogram.total += theirs.total
+            self.documents += other.documents
+            self.bytes += other.bytes
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+            self.documents = 0
+            self.bytes = 0
+
+    def snapshot(self, cache_stats: Optional[Dict] = None) -> Dict:
+        """Current metrics as a plain dict."""
+        with self._lock:
+            snapshot = {
+                'documents_total': self.documents,
+                'bytes_total': self.bytes,
+                'stages': {
+                    name: {
+                        'count': histogram.count,
+                        'seconds_total': round(histogram.total, 6),
+                        'mean_seconds': round(histogram.total / histogram.count, 6) if histogram.count else 0,
+                        'buckets': dict(zip([*map(str, histogram.buckets), '+Inf'], histogram.cumulative()))
+                    }
+                    for name, histogram in self.stages.items()
+                }
+            }
+        if cache_stats is not None:
+            snapshot['cache'] = cache_stats
+        return snapshot
+
+    def to_prometheus(self, cache_stats: Optional[Dict] = None, prefix: str = 'content_analyzer') -> str:
+        """Metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot(cache_stats)
+        lines = [
+            f'# HELP {prefix}_stage_seconds Wall time spent in each analysis stage.',
+            f'# TYPE {prefix}_stage_seconds histogram'
+        ]
+        for name, stage in snapshot['stages'].items():
+            for bound, count in stage['buckets'].items():
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {count}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {stage["seconds_total"]}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {stage["count"]}')
+
+        lines += [
+            f'# HELP {prefix}_documents_total Documents analysed.',
+            f'# TYPE {prefix}_documents_total counter',
+            f'{prefix}_documents_total {snapshot["documents_total"]}',
+            f'# HELP {prefix}_bytes_total UTF-8 bytes of text analysed.',
+            f'# TYPE {prefix}_bytes_total counter',
+            f'{prefix}_bytes_total {snapshot["bytes_total"]}'
+        ]
+
+        cache = snapshot.get('cache')
+        if cache is not None:
+            lines += [
+                f'# HELP {prefix}_cache_lookups_total Result cache lookups by outcome.',
+                f'# TYPE {prefix}_cache_lookups_total counter',
+                f'{prefix}_cache_lookups_total{{outcome="memory_hit"}} {cache["memory_hits"]}',
+                f'{prefix}_cache_lookups_total{{outcome="disk_hit"}} {cache["disk_hits"]}',
+                f'{prefix}_cache_lookups_total{{outcome="miss"}} {cache["misses"]}',
+                f'# HELP {prefix}_cache_hit_ratio Fraction of cache lookups served from a cache tier.',
+                f'# TYPE {prefix}_cache_hit_ratio gauge',
+                f'{prefix}_cache_hit_ratio {cache["hit_rate"]}'
+            ]
+        return '\n'.join(lines) + '\n'
+
+
+class DocumentStages:
+    """
+    Stage times of one document.
+
+    A stage may run in several pieces (tokenisation is split across lazily
+    built profile fields, a stream is scanned chunk by chunk); the pieces are
+    summed and `record` adds one observation per stage to the histograms.
+    """
+
+    def __init__(self, metrics: AnalysisMetrics):
+        self.metrics = metrics
+        self.seconds: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - start
+
+    def record(self):
+        """Observe the accumulated time of every stage run so far, then start over."""
+        for name, seconds in self.seconds.items():
+            self.metrics.observe(name, seconds)
+        self.seconds.clear()
+
+
+class NullStages:
+    """Per-document stand-in when instrumentation is off."""
+
+    def stage(self, name: str):
+        return _NO_OP
+
+    def record(self):
+        pass
+
+
+NULL_STAGES = NullStages()
+
+
+class NullMetrics:
+    """Stand-in used when instrumentation is off; every hook is a no-op."""
+
+    enabled = False
+
+    def stage(self, name: str):
+        return _NO_OP
+
+    def observe(self, name: str, seconds: float):
+        pass
+
+    def document(self) -> NullStages:
+        return NULL_STAGES
+
+    def count_document(self, size_bytes: int):
+        pass
+
+
+NULL_METRICS = NullMetrics()
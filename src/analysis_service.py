@@ -0,0 +1,426 @@
+"""
+Sustainability Communications Framework - Local Analysis Service
+
+Small asyncio server that lets many editors share one warm analyser instead
+of each CMS process analysing synchronously on every save. Requests and
+responses are JSON lines over a Unix socket (or a localhost TCP port):
+
+    -> {"id": 1, "text": "...", "fields": ["flesch_reading_ease"]}
+    <- {"id": 1, "ok": true, "result": {...}, "latency_ms": 3.2}
+    -> {"id": 2, "op": "stats"}
+    <- {"id": 2, "ok": true, "result": {"latency_ms": {"p50": ..., "p99": ...}, ...}}
+
+Concurrent requests are micro-batched: the dispatcher collects up to
+`max_batch` requests or waits at most `batch_window` seconds, then sends the
+batch to a pool of pre-warmed worker processes in one call. Identical
+requests within a batch (the same draft saved twice) are analysed once. The
+request queue is bounded, so when it is full a connection stops being read
+until there is room, pushing back on clients instead of growing memory.
+Malformed requests get an error reply and leave the connection open.
+
+Author: Begoña Penón
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from analysis_cache import cache_key
+from analysis_metrics import AnalysisMetrics
+from content_analyzer import ContentAnalyzer, worker_analyzer
+
+
+DEFAULT_SOCKET_PATH = '/tmp/content-analyzer.sock'
+
+# Latency samples kept for the percentiles (a sliding window of recent requests)
+LATENCY_WINDOW = 10000
+
+PERCENTILES = (50, 90, 95, 99)
+
+# Longest request line accepted (asyncio's default is 64 KiB, less than a long regulation)
+MAX_REQUEST_BYTES = 16 << 20
+
+_SERVICE_ANALYZER: Optional[ContentAnalyzer] = None
+
+
+def _init_service_worker(config: Dict):
+    """Build the per-process analyser from the service analyser's configuration."""
+    global _SERVICE_ANALYZER
+    _SERVICE_ANALYZER = worker_analyzer(config)
+
+
+def _analyze_batch(batch: Sequence[Tuple[str, Optional[Tuple[str, ...]]]],
+                   analyzer: Optional[ContentAnalyzer] = None) -> Tuple[List[Dict], Optional[AnalysisMetrics]]:
+    """
+    Analyse a batch of (text, fields) requests, capturing failures per request.
+
+    Uses the worker process's analyser unless one is given. Returns the
+    records and, from an instrumented worker process, the batch's metrics.
+    """
+    metrics = None
+    if analyzer is None:
+        analyzer = _SERVICE_ANALYZER
+        if analyzer.metrics.enabled:
+            metrics = analyzer.metrics = AnalysisMetrics(analyzer.metrics.buckets)
+
+    results = []
+    for text, fields in batch:
+        try:
+            result = analyzer.generate_communication_recommendations(text, fields=fields)
+        except Exception as exc:
+            results.append({'ok': False, 'error': f"{type(exc).__name__}: {exc}"})
+        else:
+            results.append({'ok': True, 'result': result})
+    return results, metrics
+
+
+def request_fields(fields) -> Optional[Tuple[str, ...]]:
+    """`fields` as a tuple of field names; ValueError unless it is None or a list of strings."""
+    if fields is None:
+        return None
+    if not isinstance(fields, (list, tuple)) or not all(isinstance(field, str) for field in fields):
+        raise ValueError("'fields' must be a list of field names")
+    return tuple(fields)
+
+
+def percentile(ordered: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+class AnalysisService:
+    """
+    Micro-batching front end to a pool of warm analysers.
+
+    `workers` processes analyse batches in parallel (all cores by default),
+    each with a copy of `analyzer`'s configuration; their stage metrics are
+    merged into the analyser's, and the analyser's result cache is consulted
+    and filled before and after each batch. With 0 workers the analyser
+    itself runs in a single background thread. At most `max_queue` requests
+    wait for dispatch.
+    """
+
+    def __init__(self, analyzer: Optional[ContentAnalyzer] = None, workers: Optional[int] = None,
+                 max_batch: int = 32, batch_window: float = 0.005, max_queue: int = 1024):
+        self.analyzer = analyzer or ContentAnalyzer([])
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.max_queue = max_queue
+
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.analyses = 0
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self._queue: Optional[asyncio.Queue] = None
+        self._executor: Optional[Executor] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._batches = set()
+
+    async def start(self):
+        if self.workers == 0:
+            self._executor = ThreadPoolExecutor(1)
+        else:
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_init_service_worker,
+                                                 initargs=(self.analyzer._worker_config(),))
+        self._queue = asyncio.Queue(self.max_queue)
+        # One batch per worker in flight; further requests keep batching in the queue meanwhile
+        self._in_flight = asyncio.Semaphore(max(1, self.workers))
+        self._dispatcher = asyncio.ensure_future(self._dispatch())
+
+    async def stop(self):
+        """Answer every queued request, then shut the workers down without blocking the event loop."""
+        if self._dispatcher is not None:
+            # Queued requests count as done once dispatched; then wait for their batches
+            await self._queue.join()
+            if self._batches:
+                await asyncio.gather(*self._batches, return_exceptions=True)
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+            # Anything queued after the drain is failed rather than left waiting
+            while not self._queue.empty():
+                _, _, future, _ = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError('analysis service stopped'))
+        if self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown)
+            self._executor = None
+
+    async def __aenter__(self) -> 'AnalysisService':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def submit(self, text: str, fields: Optional[Sequence[str]] = None) -> asyncio.Future:
+        """
+        Queue one analysis, waiting for queue space when the queue is full.
+
+        Returns a future for its {'ok', 'result' | 'error', 'latency_ms'} record.
+        Raises ValueError for malformed `fields`.
+        """
+        fields = request_fields(fields)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, fields, future, time.perf_counter()))
+        return future
+
+    async def analyze(self, text: str, fields: Optional[Sequence[str]] = None) -> Dict:
+        """Queue one analysis and wait for its record."""
+        return await (await self.submit(text, fields))
+
+    def stats(self) -> Dict:
+        """Request, batching and queue counters with latency percentiles over recent requests."""
+        ordered = sorted(self._latencies)
+        latency = {f'p{q}': round(percentile(ordered, q), 3) for q in PERCENTILES}
+        latency['max'] = round(ordered[-1], 3) if ordered else 0.0
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'batches': self.batches,
+            'analyses': self.analyses,
+            'avg_batch_size': round(self.requests / self.batches, 2) if self.batches else 0.0,
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'max_queue': self.max_queue,
+            'workers': self.workers,
+            'latency_ms': latency
+        }
+
+    async def _dispatch(self):
+        queue = self._queue
+        while True:
+            # While every worker is busy, new requests keep accumulating into the next batch
+            await self._in_flight.acquire()
+            batch = [await queue.get()]
+            if self.batch_window > 0 and queue.qsize() < self.max_batch - 1:
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+            for _ in batch:
+                queue.task_done()
+
+    async def _run_batch(self, batch: List[Tuple]):
+        try:
+            await self._analyze(batch)
+        except Exception as exc:
+            # Whatever went wrong, no client is left waiting on this batch
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        finally:
+            self._in_flight.release()
+
+    async def _analyze(self, batch: List[Tuple]):
+        # Identical requests in a batch are analysed once
+        unique: Dict[Tuple, List[Tuple[asyncio.Future, float]]] = {}
+        for text, fields, future, started in batch:
+            unique.setdefault((text, fields), []).append((future, started))
+        requests = list(unique)
+        self.batches += 1
+
+        records, keys = self._cached_records(requests)
+        missing = [request for request in requests if request not in records]
+        self.analyses += len(missing)
+        if missing:
+            records.update(zip(missing, await self._analyze_requests(missing)))
+        for request, key in keys.items():
+            if records[request]['ok']:
+                self.analyzer.cache.put(key, records[request]['result'])
+
+        finished = time.perf_counter()
+        for request in requests:
+            result = records[request]
+            for future, started in unique[request]:
+                latency = (finished - started) * 1000
+                self.requests += 1
+                self.errors += not result['ok']
+                self._latencies.append(latency)
+                if not future.done():
+                    future.set_result(dict(result, latency_ms=round(latency, 3)))
+
+    def _cached_records(self, requests: List[Tuple]) -> Tuple[Dict[Tuple, Dict], Dict[Tuple, str]]:
+        """
+        Records of the requests found in the analyser's cache, and the cache keys of the rest.
+
+        Worker processes have no access to the cache, so it is consulted (and
+        later filled) here; in-process analysis goes through it by itself.
+        """
+        cache = self.analyzer.cache
+        if cache is None or self.workers == 0:
+            return {}, {}
+        fingerprint = self.analyzer.config_fingerprint()
+        records, keys = {}, {}
+        for text, fields in requests:
+            # The key generate_communication_recommendations(text, fields=fields) is cached under
+            key = cache_key('generate_communication_recommendations', text, fingerprint, ((), (('fields', fields),)))
+            result = cache.get(key)
+            if result is None:
+                keys[text, fields] = key
+            else:
+                records[text, fields] = {'ok': True, 'result': result}
+        return records, keys
+
+    async def _analyze_requests(self, requests: List[Tuple]) -> List[Dict]:
+        """Records of `requests` from the executor; worker metrics are merged into the analyser's."""
+        # In-process analysis uses the service's analyser itself
+        analyzer = self.analyzer if self.workers == 0 else None
+        try:
+            results, metrics = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _analyze_batch, requests, analyzer
+            )
+        except Exception as exc:  # a worker died; fail this batch, keep serving
+            results, metrics = [{'ok': False, 'error': f"{type(exc).__name__}: {exc}"}] * len(requests), None
+        if metrics is not None:
+            self.analyzer.metrics.merge(metrics)
+        return results
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one client: requests may be pipelined, responses come back as they finish."""
+        lock = asyncio.Lock()
+        pending = set()
+
+        async def respond(message: Dict):
+            async with lock:
+                writer.write((json.dumps(message, ensure_ascii=False) + '\n').encode('utf-8'))
+                await writer.drain()
+
+        try:
+            while True:
+                line = await _read_request_line(reader)
+                if line is None:
+                    await respond({'id': None, 'ok': False, 'error': 'Bad request: request line too long'})
+                    continue
+                if not line:
+                    break
+                task = await self._handle_request(line, respond)
+                if task is not None:
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def _handle_request(self, line: bytes,
+                              respond: Callable[[Dict], Awaitable[None]]) -> Optional[asyncio.Task]:
+        """
+        Answer one request line.
+
+        Stats and malformed requests are answered here; an analysis is queued
+        and the returned task replies once it finishes.
+        """
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('request must be a JSON object')
+            request_id = request.get('id')
+            op = request.get('op', 'analyze')
+            if op == 'stats':
+                await respond({'id': request_id, 'ok': True, 'result': self.stats()})
+                return None
+            if op != 'analyze':
+                raise ValueError(f"unknown op {op!r}")
+            if not isinstance(request.get('text'), str):
+                raise ValueError("request needs a 'text' string")
+            # Not reading on until the request is queued lets a full queue push back on the client
+            future = await self.submit(request['text'], request.get('fields'))
+        except ValueError as exc:
+            await respond({'id': request_id, 'ok': False, 'error': f"Bad request: {exc}"})
+            return None
+        return asyncio.ensure_future(_reply(request_id, future, respond))
+
+
+async def _read_request_line(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    The next request line, b'' at end of stream, or None for a line over the
+    reader's limit; the whole of such a line is skipped.
+    """
+    try:
+        return await reader.readuntil(b'\n')
+    except asyncio.IncompleteReadError as exc:
+        return exc.partial  # a last line without its newline
+    except asyncio.LimitOverrunError as exc:
+        consumed = exc.consumed
+    while True:
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b'\n')
+        except asyncio.LimitOverrunError as exc:
+            consumed = exc.consumed
+            continue
+        except asyncio.IncompleteReadError:
+            pass  # the stream ended mid-line
+        return None
+
+
+async def _reply(request_id, future: asyncio.Future, respond: Callable[[Dict], Awaitable[None]]):
+    """Send a queued request's record (or its failure) back to the client."""
+    try:
+        record = await future
+    except Exception as exc:
+        record = {'ok': False, 'error': f"{type(exc).__name__}: {exc}"}
+    try:
+        await respond(dict(id=request_id, **record))
+    except ConnectionError:
+        pass  # the client went away; its result is dropped
+
+
+async def serve(service: AnalysisService, socket_path: Optional[str] = DEFAULT_SOCKET_PATH,
+                host: str = '127.0.0.1', port: Optional[int] = None, limit: int = MAX_REQUEST_BYTES):
+    """
+    Run the service until cancelled, on a Unix socket or (with `port`) on localhost TCP.
+
+    Request lines longer than `limit` bytes get an error reply.
+    """
+    async with service:
+        if port is not None:
+            server = await asyncio.start_server(service.handle_connection, host, port, limit=limit)
+        else:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            server = await asyncio.start_unix_server(service.handle_connection, socket_path, limit=limit)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Serve ContentAnalyzer recommendations to local clients.')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH, help='Unix socket path')
+    parser.add_argument('--port', type=int, help='listen on this localhost TCP port instead of a Unix socket')
+    parser.add_argument('--workers', type=int, help='analysis processes (default: all cores; 0 = in-process)')
+    parser.add_argument('--max-batch', type=int, default=32, help='requests per worker call')
+    parser.add_argument('--batch-window-ms', type=float, default=5.0, help='max wait to fill a batch')
+    parser.add_argument('--max-queue', type=int, default=1024, help='requests waiting before clients are held back')
+    args = parser.parse_args(argv)
+
+    service = AnalysisService(workers=args.workers, max_batch=args.max_batch,
+                              batch_window=args.batch_window_ms / 1000, max_queue=args.max_queue)
+    try:
+        asyncio.run(serve(service, args.socket, port=args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
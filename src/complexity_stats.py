@@ -0,0 +1,83 @@
+"""
+Sustainability Communications Framework - Complexity Statistics
+
+Additive counts behind the complexity analysis. Statistics for separate parts
+of a document (segments, shards, files) can be computed independently, even on
+different machines, and merged into exact document- or corpus-level metrics
+without re-reading any text.
+
+Author: Begoña Penón
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass
+class ComplexityStats:
+    """
+    Mergeable partial statistics for analyze_text_complexity.
+
+    `a + b` describes a's text followed by b's text. Parts must be split on a
+    line break (as between content segments) so no word or multi-word keyword
+    straddles the join; sentences may straddle it and are counted once.
+    """
+
+    total_words: int = 0
+    total_sentences: int = 0
+    syllables: int = 0
+    legal_terms: int = 0
+    epr_term_counts: Dict[str, int] = field(default_factory=dict)
+
+    # Sentence boundary state, needed to merge sentence counts exactly
+    has_terminator: bool = False
+    leading_fragment: bool = False
+    trailing_fragment: bool = False
+
+    def merge(self, other: 'ComplexityStats') -> 'ComplexityStats':
+        """Statistics of this part followed by `other`."""
+        epr_term_counts = dict(self.epr_term_counts)
+        for category, count in other.epr_term_counts.items():
+            epr_term_counts[category] = epr_term_counts.get(category, 0) + count
+
+        # A sentence left open by this part continues into the other's leading fragment
+        joined = 1 if self.trailing_fragment and other.leading_fragment else 0
+
+        return ComplexityStats(
+            total_words=self.total_words + other.total_words,
+            total_sentences=self.total_sentences + other.total_sentences - joined,
+            syllables=self.syllables + other.syllables,
+            legal_terms=self.legal_terms + other.legal_terms,
+            epr_term_counts=epr_term_counts,
+            has_terminator=self.has_terminator or other.has_terminator,
+            leading_fragment=self.leading_fragment or (not self.has_terminator and other.leading_fragment),
+            trailing_fragment=other.trailing_fragment or (not other.has_terminator and self.trailing_fragment)
+        )
+
+    def __add__(self, other: 'ComplexityStats') -> 'ComplexityStats':
+        if not isinstance(other, ComplexityStats):
+            return NotImplemented
+        return self.merge(other)
+
+    def __radd__(self, other):
+        # Lets sum() start from its default 0
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def to_dict(self) -> Dict:
+        """Plain JSON-serialisable form, for shipping partial results between nodes."""
+        return {
+            'total_words': self.total_words,
+            'total_sentences': self.total_sentences,
+            'syllables': self.syllables,
+            'legal_terms': self.legal_terms,
+            'epr_term_counts': dict(self.epr_term_counts),
+            'has_terminator': self.has_terminator,
+            'leading_fragment': self.leading_fragment,
+            'trailing_fragment': self.trailing_fragment
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ComplexityStats':
+        return cls(**data)
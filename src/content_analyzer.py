@@ -7,11 +7,85 @@ for an effective seller communication strategy.
 Author: Begoña Penón
 """
 
-import re
+import argparse
+import functools
 import json
-from typing import Dict, List, Tuple
-from collections import Counter
-import statistics
+import hashlib
+import os
+import threading
+from datetime import date
+from multiprocessing import Pool
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from collections import OrderedDict, deque
+
+from analysis_cache import AnalysisCache, cache_key, cached_analysis
+from analysis_metrics import NULL_METRICS, AnalysisMetrics
+from complexity_stats import ComplexityStats
+from incremental_session import IncrementalAnalysisSession
+from keyword_automaton import KeywordAutomaton, KeywordHits
+from lazy_result import LazyResult, merge_selected
+from lexicon import Lexicon, active_lexicon
+from near_duplicates import NearDuplicateIndex
+from pattern_matcher import PatternMatcher
+from persona_matrix import PersonaMatrix, PersonaScores, SellerPersona
+from phrase_extractor import CorpusPhraseRanker, PhraseExtractor
+from readability_table import ReadabilityTable
+from segment_index import INDEXED_METRICS, SegmentIndex, parse_deadline
+from streaming_analysis import StreamingAnalysis
+from syllable_counter import SyllableCounter
+from text_profile import TextProfile
+
+
+# Bump whenever scoring thresholds or recommendation rules change, so cached results expire
+ANALYSIS_RULES_VERSION = 2
+
+# Compiled automata (and matchers) kept per process; beyond this many distinct
+# lexicons or pattern lists, the least recently used is evicted
+COMPILED_CACHE_SIZE = 32
+
+# Fields a near-duplicate member may recompute from its own text: they need only
+# the pattern scan, and everything derived from them is re-derived from the record
+NEAR_DUPLICATE_FIELDS = ('action_items', 'critical_deadlines')
+
+# Compiled automata shared by every analyser, keyed by lexicon contents
+_AUTOMATON_CACHE: 'OrderedDict[Tuple, KeywordAutomaton]' = OrderedDict()
+
+# Compiled action/deadline matchers, keyed by pattern lists
+_MATCHER_CACHE: 'OrderedDict[Tuple, PatternMatcher]' = OrderedDict()
+
+_COMPILED_CACHE_LOCK = threading.Lock()
+
+# Persisted syllable counts for common EPR vocabulary, pre-seeding the memo table
+SYLLABLE_LEXICON_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'syllable_lexicon.json'
+)
+
+# Memoised syllable counter shared by every analyser, loaded on first use
+_SYLLABLE_COUNTER: Optional[SyllableCounter] = None
+
+# Analyser owned by a corpus worker process, built once by _init_corpus_worker
+_WORKER_ANALYZER = None
+
+
+def _records_stages(method):
+    """
+    Record the stage times of a text analysis once per document.
+
+    A text is profiled here and the profile passed on, so every stage the
+    analysis runs, however many pieces it takes, is one observation when the
+    call returns. Profiles passed in are recorded by whoever built them.
+    """
+    @functools.wraps(method)
+    def wrapper(self, text, *args, **kwargs):
+        if isinstance(text, TextProfile) or not self.metrics.enabled:
+            return method(self, text, *args, **kwargs)
+        profile = self.build_profile(text)
+        try:
+            return method(self, profile, *args, **kwargs)
+        finally:
+            profile.record_stages()
+
+    return wrapper
 
 
 class ContentAnalyzer:
@@ -24,80 +98,302 @@ class ContentAnalyzer:
     - Translation readiness assessment for multilingual campaigns
     """
     
-    def __init__(self, content_segments):
+    # Phrasings that signal an action sellers need to complete
+    action_patterns = [
+        r'must\s+\w+',
+        r'shall\s+\w+',
+        r'required\s+to\s+\w+',
+        r'obligation\s+to\s+\w+',
+        r'need\s+to\s+\w+'
+    ]
+
+    # Date and deadline phrasings
+    deadline_patterns = [
+        r'\d{1,2}/\d{1,2}/\d{4}',
+        r'\d{1,2}\s+\w+\s+\d{4}',
+        r'by\s+\w+\s+\d{1,2}',
+        r'before\s+\w+\s+\d{1,2}'
+    ]
+    
+    def __init__(self, content_segments, cache: Optional[AnalysisCache] = None, instrument: bool = False,
+                 lexicon: Optional[Lexicon] = None):
         # Save segments received from class instantiation
         self.content_segments = content_segments
         self.sustainability_elements = []
 
+        # Optional result cache for the text analysis methods
+        self.cache = cache
+
+        # Per-stage timings and counters; a no-op stand-in unless instrumented
+        self.metrics = AnalysisMetrics() if instrument else NULL_METRICS
+
+        # Shared compiled term lists (data/lexicon.json). The instance gets its own
+        # list copies, so editing them never affects other analysers.
+        self.lexicon = lexicon if lexicon is not None else active_lexicon()
+
         # Common sustainability/EPR terminology for enhanced analysis
-        self.epr_keywords = {
-            'high_priority': [
-                'extended producer responsibility', 'epr', 'compliance', 'liability',
-                'packaging waste', 'recycling targets', 'producer obligations',
-                'registration requirements', 'reporting deadlines', 'penalties'
-            ],
-            'medium_priority': [
-                'circular economy', 'waste prevention', 'environmental impact',
-                'product lifecycle', 'take-back programs', 'eco-design',
-                'material recovery', 'producer register'
-            ],
-            'process_terms': [
-                'register', 'report', 'submit', 'comply', 'deadline', 'requirement',
-                'obligation', 'documentation', 'evidence', 'certification'
-            ]
-        }
-        
+        self.epr_keywords = {priority: list(terms) for priority, terms in self.lexicon.epr_keywords.items()}
+
         # Complexity indicators that may confuse sellers
-        self.complexity_indicators = [
-            'notwithstanding', 'pursuant to', 'aforementioned', 'whereas',
-            'hereinafter', 'thereof', 'whereby', 'insofar as', 'provided that'
-        ]
+        self.complexity_indicators = list(self.lexicon.complexity_indicators)
+
+        # Cultural-specific terms that may not translate well
+        self.cultural_terms = list(self.lexicon.cultural_terms)
+
+        # Key phrase n-gram settings (trigrams by default)
+        self.phrase_extractor = PhraseExtractor(ngram_range=(3, 3))
+
+        # Bounded per-word syllable memo, shared between instances
+        self.syllable_counter = shared_syllable_counter()
     
+    def keyword_automaton(self) -> KeywordAutomaton:
+        """
+        Compiled matcher over the EPR keywords, complexity indicators and cultural terms.
+
+        Built once per distinct lexicon and shared between instances; unedited
+        term lists reuse the shared Lexicon's precompiled automaton, and editing
+        any of them makes the next call compile a fresh one.
+        """
+        lexicon = dict(self.epr_keywords)
+        lexicon['complexity_indicators'] = self.complexity_indicators
+        lexicon['cultural_terms'] = self.cultural_terms
+        key = tuple((category, tuple(terms)) for category, terms in lexicon.items())
+
+        if key == self.lexicon.key:
+            return _compiled(_AUTOMATON_CACHE, key, lambda: self.lexicon.automaton)
+        return _compiled(_AUTOMATON_CACHE, key, lambda: KeywordAutomaton(lexicon))
+
+    def config_fingerprint(self) -> str:
+        """
+        Hash of everything besides the text that determines analysis results.
+
+        Covers the lexicons, extraction patterns and rules version, so editing
+        epr_keywords or complexity_indicators invalidates cached results.
+        """
+        config = dict(self._lexicon_config())
+        config['action_patterns'] = self.action_patterns
+        config['deadline_patterns'] = self.deadline_patterns
+        config['phrases'] = self.phrase_extractor.config()
+        config['rules_version'] = ANALYSIS_RULES_VERSION
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def scan_keywords(self, text: str) -> KeywordHits:
+        """Scan of a text for every lexicon term (counts, categories, offsets)."""
+        return self.keyword_automaton().scan(text.lower())
+
+    def build_profile(self, text: Union[str, TextProfile], stages=None) -> TextProfile:
+        """
+        Build the shared per-document profile that every analysis method accepts.
+
+        Passing an existing profile returns it unchanged. When instrumented,
+        the profile's stage times are collected in `stages` (a fresh
+        per-document collector by default) until `profile.record_stages()`.
+        """
+        if isinstance(text, TextProfile):
+            return text
+        if self.metrics.enabled:
+            self.metrics.count_document(len(text.encode('utf-8')))
+        return self._new_profile(text, stages)
+
+    def _new_profile(self, text: str, stages=None) -> TextProfile:
+        return TextProfile(text, self.keyword_automaton(), self.syllable_counter.count_batch,
+                           self.pattern_matcher(), stages if stages is not None else self.metrics.document())
+
+    def metrics_snapshot(self) -> Dict:
+        """
+        Stage timings, document and byte counters, and result cache hit rates.
+
+        Empty unless the analyser was created with `instrument=True`.
+        """
+        if not self.metrics.enabled:
+            return {}
+        return self.metrics.snapshot(self.cache.stats() if self.cache is not None else None)
+
+    def metrics_prometheus(self) -> str:
+        """The metrics snapshot in the Prometheus text exposition format."""
+        if not self.metrics.enabled:
+            return ''
+        return self.metrics.to_prometheus(self.cache.stats() if self.cache is not None else None)
+
+    def pattern_matcher(self) -> PatternMatcher:
+        """
+        Single precompiled regex over the action item and deadline patterns.
+
+        Shared by every instance using the same pattern lists.
+        """
+        key = (tuple(self.action_patterns), tuple(self.deadline_patterns))
+        return _compiled(_MATCHER_CACHE, key, lambda: PatternMatcher({
+            'action_item': self.action_patterns,
+            'deadline': self.deadline_patterns
+        }))
+
+    @_records_stages
+    def find_actionable_spans(self, text: Union[str, TextProfile]) -> List[Dict]:
+        """
+        Action items and deadlines with their positions, for highlighting.
+
+        Returns {'type', 'text', 'start', 'end'} dicts in document order, where
+        type is 'action_item' or 'deadline' and offsets index the original text.
+        """
+        return [dict(match) for match in self.build_profile(text).pattern_matches]
     
-    def detect_keywords(self):
+    def detect_keywords(self, segments: Optional[Iterable[str]] = None) -> List[Tuple[str, str]]:
         """
-        Search keywords inside the segments and adds them to sustainability_elements.
+        Search keywords inside the segments and return (keyword, category) pairs.
+
+        Each segment contributes every EPR keyword it mentions once. The result
+        is rebuilt on each call, so repeated calls don't accumulate earlier hits;
+        sustainability_elements holds the latest result.
         """
-        for segment in self.content_segments:
-            lower_segment = segment.lower()
+        elements = []
+        for segment in self.content_segments if segments is None else segments:
+            hits = self.scan_keywords(segment)
             for category, keywords in self.epr_keywords.items():
                 for kw in keywords:
-                    if kw in lower_segment:
-                        self.sustainability_elements.append((kw, category))
-        return self.sustainability_elements
+                    if hits.found(kw):
+                        elements.append((kw, category))
+        self.sustainability_elements = elements
+        return elements
 
+    def iter_keyword_hits(self, segments: Optional[Iterable[str]] = None) -> Iterator[Tuple[int, int, str, str]]:
+        """
+        Yield (segment_index, offset, term, category) for every EPR keyword occurrence.
 
+        Segments are consumed lazily, one at a time, so any iterable works: a
+        generator over a file, or `iter(queue.get, None)` over a work queue.
+        Hits come in document order with the same non-overlapping semantics as
+        scan_keywords, and nothing is kept on the instance. Defaults to the
+        analyser's own segments.
+        """
+        automaton = self.keyword_automaton()
+        categories = automaton.categories
+        epr_categories = set(self.epr_keywords)
+        for position, segment in enumerate(self.content_segments if segments is None else segments):
+            for offset, term in automaton.iter_hits(segment.lower()):
+                for category in categories[term]:
+                    if category in epr_categories:
+                        yield position, offset, term, category
 
-    def analyze_text_complexity(self, text: str) -> Dict:
+    @cached_analysis
+    @_records_stages
+    def analyze_text_complexity(self, text: Union[str, TextProfile], fields: Optional[Iterable[str]] = None) -> Dict:
         """
         Comprehensive text complexity analysis for communication strategy planning.
         
         Returns complexity metrics essential for stakeholder-appropriate messaging.
+        With `fields`, only those metrics (and the stages they need) are computed.
         """
-        words = text.lower().split()
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
+        if fields is not None:
+            return self._lazy_complexity(self.build_profile(text)).select(fields)
+        return self.complexity_report(self.complexity_stats(text))
+
+    @_records_stages
+    def complexity_stats(self, text: Union[str, TextProfile]) -> ComplexityStats:
+        """
+        Additive counts behind analyze_text_complexity.
+
+        Stats for separate segments or shards can be merged with `+` and turned
+        into exact document-level metrics with complexity_report.
+        """
+        profile = self.build_profile(text)
+        hits = profile.keyword_hits
+        stats = self._readability_stats(profile)
+        stats.legal_terms = sum(hits.count(term) for term in self.complexity_indicators)
+        stats.epr_term_counts = self._epr_term_counts(hits)
+        return stats
+
+    def analyze_complexity_batch(self, texts: Iterable[Union[str, TextProfile]]) -> ReadabilityTable:
+        """
+        Complexity analysis of many documents as one columnar table (requires numpy).
+
+        Each document is reduced to its counts; the scores and the readability
+        and adaptation bucketing are then computed vectorised over the batch.
+        `table.row(i)` matches analyze_text_complexity on the i-th document.
+        """
+        return ReadabilityTable.from_stats([self.complexity_stats(text) for text in texts], list(self.epr_keywords))
+
+    def score_personas(self, texts: Union[ReadabilityTable, Iterable[Union[str, TextProfile]]],
+                       personas: Optional[Union[PersonaMatrix, Sequence[SellerPersona]]] = None) -> PersonaScores:
+        """
+        Fit and adaptation priority of every draft for every seller persona (requires numpy).
+
+        Drafts are analysed once into a ReadabilityTable (or pass one already
+        built) and scored against all personas as threshold matrices. Personas
+        default to data/seller_personas.json.
+        """
+        table = texts if isinstance(texts, ReadabilityTable) else self.analyze_complexity_batch(texts)
+        if personas is None:
+            personas = PersonaMatrix.from_file()
+        elif not isinstance(personas, PersonaMatrix):
+            personas = PersonaMatrix(personas)
+        return personas.score(table)
+
+    def segment_complexity_stats(self) -> List[ComplexityStats]:
+        """Per-segment stats for content_segments (the document is the segments joined by line breaks)."""
+        return [self.complexity_stats(segment) for segment in self.content_segments]
+
+    def analyze_segments_complexity(self) -> Dict:
+        """Complexity analysis of content_segments, reduced from per-segment stats."""
+        return self.complexity_report(sum(self.segment_complexity_stats(), ComplexityStats()))
+
+    def incremental_session(self, top_n: int = 10) -> IncrementalAnalysisSession:
+        """
+        Start an incremental re-analysis session primed with content_segments.
+
+        After an edit, `session.update(segments)` re-profiles only the changed
+        segments and returns the same result as
+        generate_communication_recommendations over the joined draft.
+        """
+        session = IncrementalAnalysisSession(self, top_n)
+        session.update(self.content_segments)
+        return session
+
+    def analyze_stream(self, chunks: Iterable[str], holdback: int = 256) -> Dict:
+        """
+        Bounded-memory analysis of a document delivered as successive text chunks.
+
+        Chunks may be split anywhere (mid-word, mid-sentence, mid-keyword); the
+        complexity analysis, EPR density, action items and deadlines match what
+        analyze_text_complexity and extract_key_concepts report for the whole
+        text. `holdback` bounds the length of a single action/deadline match.
+        """
+        analysis = StreamingAnalysis(self, holdback=holdback)
+        for chunk in chunks:
+            analysis.feed(chunk)
+        return analysis.finish()
+
+    def analyze_file(self, path: str, chunk_size: int = 1 << 20, encoding: str = 'utf-8') -> Dict:
+        """Stream a (possibly very large) text file through analyze_stream in fixed-size reads."""
+        with open(path, encoding=encoding) as handle:
+            return self.analyze_stream(iter(lambda: handle.read(chunk_size), ''))
+
+    def complexity_report(self, stats: ComplexityStats) -> Dict:
+        """Derive the complexity analysis from (possibly merged) document counts."""
+        total_words = stats.total_words
+        total_sentences = stats.total_sentences
+        syllables = stats.syllables
+        legal_terms = stats.legal_terms
+
         # Basic readability metrics
-        avg_words_per_sentence = len(words) / len(sentences) if sentences else 0
+        avg_words_per_sentence = total_words / total_sentences if total_sentences else 0
         
         # Syllable estimation (simplified)
-        syllables = sum([self._count_syllables(word) for word in words])
-        avg_syllables_per_word = syllables / len(words) if words else 0
+        avg_syllables_per_word = syllables / total_words if total_words else 0
         
         # Flesch Reading Ease Score (adapted for regulatory content)
         flesch_score = 206.835 - (1.015 * avg_words_per_sentence) - (84.6 * avg_syllables_per_word)
         
         # Legal/regulatory complexity indicators
-        legal_complexity = len([word for word in words if word in self.complexity_indicators])
-        legal_complexity_ratio = legal_complexity / len(words) if words else 0
+        legal_complexity_ratio = legal_terms / total_words if total_words else 0
         
         # EPR-specific terminology density
-        epr_density = self._calculate_epr_density(text.lower())
+        epr_density = self._density_from_counts(
+            {priority: stats.epr_term_counts.get(priority, 0) for priority in self.epr_keywords}, total_words
+        )
         
         return {
-            'total_words': len(words),
-            'total_sentences': len(sentences),
+            'total_words': total_words,
+            'total_sentences': total_sentences,
             'avg_words_per_sentence': round(avg_words_per_sentence, 2),
             'avg_syllables_per_word': round(avg_syllables_per_word, 2),
             'flesch_reading_ease': round(flesch_score, 2),
@@ -108,14 +404,44 @@ class ContentAnalyzer:
             'adaptation_priority': self._assess_adaptation_priority(flesch_score, legal_complexity_ratio, epr_density)
         }
     
-    def extract_key_concepts(self, text: str, top_n: int = 10) -> Dict:
+    @cached_analysis
+    @_records_stages
+    def extract_key_concepts(self, text: Union[str, TextProfile], top_n: int = 10,
+                             fields: Optional[Iterable[str]] = None) -> Dict:
         """
         Extract priority concepts for strategic message development.
         
         Essential for creating targeted seller communications and training materials.
+        With `fields`, only those concepts (and the stages they need) are computed.
         """
-        text_lower = text.lower()
+        profile = self.build_profile(text)
+        if fields is not None:
+            return self._lazy_concepts(profile, top_n).select(fields)
+        
+        return self._key_concepts(
+            term_counts=profile.keyword_hits.counts,
+            # Extract general important phrases (2-4 words)
+            phrases=self._extract_important_phrases(profile, top_n),
+            # Identify action items and deadlines
+            action_items=self._identify_action_items(profile),
+            deadlines=self._identify_deadlines(profile)
+        )
+
+    def _key_concepts(self, term_counts: Dict[str, int], phrases: List[Dict],
+                      action_items: List[str], deadlines: List[str]) -> Dict:
+        """Assemble the key concept analysis from per-term keyword counts and extracted items."""
+        found_concepts = self._found_concepts(term_counts)
         
+        return {
+            'epr_concepts': found_concepts,
+            'key_phrases': phrases,
+            'action_items': action_items,
+            'critical_deadlines': deadlines,
+            'communication_priorities': self._rank_communication_priorities(found_concepts, action_items)
+        }
+
+    def _found_concepts(self, term_counts: Dict[str, int]) -> Dict[str, List[Dict]]:
+        """EPR keywords present in the text, by priority, with importance weighting."""
         # Find EPR-specific concepts
         found_concepts = {
             'high_priority': [],
@@ -125,51 +451,46 @@ class ContentAnalyzer:
         
         for priority_level, keywords in self.epr_keywords.items():
             for keyword in keywords:
-                if keyword in text_lower:
+                if term_counts.get(keyword):
                     # Count occurrences for importance weighting
-                    count = text_lower.count(keyword)
+                    count = term_counts[keyword]
                     found_concepts[priority_level].append({
                         'term': keyword,
                         'frequency': count,
                         'importance_score': count * self._get_priority_weight(priority_level)
                     })
         
-        # Extract general important phrases (2-4 words)
-        phrases = self._extract_important_phrases(text, top_n)
-        
-        # Identify action items and deadlines
-        action_items = self._identify_action_items(text)
-        deadlines = self._identify_deadlines(text)
-        
-        return {
-            'epr_concepts': found_concepts,
-            'key_phrases': phrases,
-            'action_items': action_items,
-            'critical_deadlines': deadlines,
-            'communication_priorities': self._rank_communication_priorities(found_concepts, action_items)
-        }
+        return found_concepts
     
-    def assess_translation_readiness(self, text: str) -> Dict:
+    @cached_analysis
+    @_records_stages
+    def assess_translation_readiness(self, text: Union[str, TextProfile],
+                                     fields: Optional[Iterable[str]] = None) -> Dict:
         """
         Evaluate text suitability for multilingual seller communications.
         
         Critical for EU marketplace communication strategy.
+        With `fields`, only those assessments (and the stages they need) are computed.
         """
-        # Cultural-specific terms that may not translate well
-        cultural_terms = [
-            'due diligence', 'good faith', 'reasonable care', 'best efforts',
-            'state of the art', 'common practice', 'industry standard'
-        ]
-        
-        # Technical terms requiring glossary
-        technical_density = len(re.findall(r'\b[A-Z]{2,}\b', text))  # Acronyms
-        
-        cultural_issues = [term for term in cultural_terms if term.lower() in text.lower()]
+        profile = self.build_profile(text)
+        if fields is not None:
+            return self._lazy_translation(profile).select(fields)
+        
+        return self._translation_readiness(
+            term_counts=profile.keyword_hits.counts,
+            # Technical terms requiring glossary
+            technical_density=profile.acronym_count,  # Acronyms
+            sentence_words=sum(profile.sentence_word_counts),
+            sentence_count=len(profile.sentence_word_counts)
+        )
+
+    def _translation_readiness(self, term_counts: Dict[str, int], technical_density: int,
+                               sentence_words: int, sentence_count: int) -> Dict:
+        """Assemble the translation readiness assessment from additive document counts."""
+        cultural_issues = self._cultural_issues(term_counts)
         
         # Sentence complexity for translation
-        sentences = re.split(r'[.!?]+', text)
-        sentence_lengths = [len(sentence.split()) for sentence in sentences if sentence.strip()]
-        avg_sentence_length = statistics.mean(sentence_lengths) if sentence_lengths else 0
+        avg_sentence_length = sentence_words / sentence_count if sentence_count else 0
         
         return {
             'cultural_adaptation_needed': len(cultural_issues) > 0,
@@ -184,16 +505,154 @@ class ContentAnalyzer:
             )
         }
     
-    def generate_communication_recommendations(self, text: str) -> Dict:
+    def _cultural_issues(self, term_counts: Dict[str, int]) -> List[str]:
+        """Cultural terms present in the text, which may not translate well."""
+        return [term for term in self.cultural_terms if term_counts.get(term.lower())]
+    
+    @cached_analysis
+    @_records_stages
+    def generate_communication_recommendations(self, text: Union[str, TextProfile],
+                                               fields: Optional[Iterable[str]] = None) -> Dict:
         """
         Strategic recommendations for seller communication campaigns.
         
         Combines all analysis elements into an actionable communication strategy.
+        The text is profiled once and the profile is shared by every analysis.
+        With `fields` (e.g. ['flesch_reading_ease']), only those fields are
+        returned, in the same nested layout, and only the stages they depend
+        on are run.
         """
-        complexity = self.analyze_text_complexity(text)
-        concepts = self.extract_key_concepts(text)
-        translation = self.assess_translation_readiness(text)
-        
+        if fields is not None:
+            return self.lazy_analysis(text).select(fields)
+        profile = self.build_profile(text)
+        return self._compose_recommendations(
+            complexity=self.analyze_text_complexity(profile),
+            concepts=self.extract_key_concepts(profile),
+            translation=self.assess_translation_readiness(profile)
+        )
+
+    def lazy_analysis(self, text: Union[str, TextProfile], top_n: int = 10) -> LazyResult:
+        """
+        Communication recommendations computed on demand.
+
+        Same layout as generate_communication_recommendations, but every field is
+        computed on first access and memoised, pulling in only the fields and
+        profile stages listed for it in lazy_result.FIELD_DEPENDENCIES.
+        Nothing marks a lazy result as finished, so when instrumented, the
+        stages of a text analysed this way are recorded as each piece runs.
+        """
+        profile = self.build_profile(text, stages=self.metrics)
+        complexity = self._lazy_complexity(profile)
+        concepts = self._lazy_concepts(profile, top_n)
+        translation = self._lazy_translation(profile)
+
+        recommendations = LazyResult({
+            'primary_message_focus': lambda: self._determine_primary_focus(concepts),
+            'audience_segmentation': lambda: self._recommend_segmentation(complexity),
+            'channel_strategy': lambda: self._recommend_channels(complexity, concepts),
+            'content_adaptation_needs': lambda: self._identify_adaptation_needs(complexity, translation),
+            'crisis_communication_risk': lambda: self._assess_crisis_risk(concepts, complexity),
+            'success_metrics_focus': lambda: self._recommend_success_metrics(concepts, complexity)
+        })
+        summary = LazyResult({
+            'complexity_analysis': lambda: complexity,
+            'key_concepts': lambda: concepts,
+            'translation_readiness': lambda: translation
+        })
+        return LazyResult({
+            'analysis_summary': lambda: summary,
+            'strategic_recommendations': lambda: recommendations,
+            'implementation_priority': lambda: self._calculate_implementation_priority(
+                complexity, concepts, translation
+            )
+        })
+
+    def _lazy_complexity(self, profile: TextProfile) -> LazyResult:
+        """analyze_text_complexity over a profile, one field at a time."""
+        def avg_words_per_sentence():
+            sentences = complexity['total_sentences']
+            return complexity['total_words'] / sentences if sentences else 0
+
+        def avg_syllables_per_word():
+            words = complexity['total_words']
+            return sum(profile.syllable_counts) / words if words else 0
+
+        def flesch_score():
+            return 206.835 - (1.015 * exact['avg_words_per_sentence']) - (84.6 * exact['avg_syllables_per_word'])
+
+        def legal_complexity_ratio():
+            words = complexity['total_words']
+            hits = profile.keyword_hits
+            return sum(hits.count(term) for term in self.complexity_indicators) / words if words else 0
+
+        # Unrounded values the bucketing rules compare against
+        exact = LazyResult({
+            'avg_words_per_sentence': avg_words_per_sentence,
+            'avg_syllables_per_word': avg_syllables_per_word,
+            'flesch_reading_ease': flesch_score,
+            'legal_complexity_ratio': legal_complexity_ratio
+        })
+        complexity = LazyResult({
+            'total_words': lambda: len(profile.words),
+            'total_sentences': lambda: profile.segmentation.sentence_count,
+            'avg_words_per_sentence': lambda: round(exact['avg_words_per_sentence'], 2),
+            'avg_syllables_per_word': lambda: round(exact['avg_syllables_per_word'], 2),
+            'flesch_reading_ease': lambda: round(exact['flesch_reading_ease'], 2),
+            'readability_level': lambda: self._interpret_flesch_score(exact['flesch_reading_ease']),
+            'legal_complexity_ratio': lambda: round(exact['legal_complexity_ratio'], 4),
+            'epr_terminology_density': lambda: self._density_from_counts(
+                self._epr_term_counts(profile.keyword_hits), complexity['total_words']
+            ),
+            'recommended_audience': lambda: self._recommend_audience_segment(
+                exact['flesch_reading_ease'], exact['legal_complexity_ratio']
+            ),
+            'adaptation_priority': lambda: self._assess_adaptation_priority(
+                exact['flesch_reading_ease'], exact['legal_complexity_ratio'], complexity['epr_terminology_density']
+            )
+        })
+        return complexity
+
+    def _lazy_concepts(self, profile: TextProfile, top_n: int) -> LazyResult:
+        """extract_key_concepts over a profile, one field at a time."""
+        concepts = LazyResult({
+            'epr_concepts': lambda: self._found_concepts(profile.keyword_hits.counts),
+            'key_phrases': lambda: self._extract_important_phrases(profile, top_n),
+            'action_items': lambda: self._identify_action_items(profile),
+            'critical_deadlines': lambda: self._identify_deadlines(profile),
+            'communication_priorities': lambda: self._rank_communication_priorities(
+                concepts['epr_concepts'], concepts['action_items']
+            )
+        })
+        return concepts
+
+    def _lazy_translation(self, profile: TextProfile) -> LazyResult:
+        """assess_translation_readiness over a profile, one field at a time."""
+        def avg_sentence_length():
+            counts = profile.sentence_word_counts
+            return sum(counts) / len(counts) if counts else 0
+
+        exact = LazyResult({'avg_sentence_length': avg_sentence_length})
+        translation = LazyResult({
+            'cultural_adaptation_needed': lambda: len(translation['cultural_terms_found']) > 0,
+            'cultural_terms_found': lambda: self._cultural_issues(profile.keyword_hits.counts),
+            'technical_density_score': lambda: profile.acronym_count,
+            'avg_sentence_length': lambda: round(exact['avg_sentence_length'], 2),
+            'translation_difficulty': lambda: self._assess_translation_difficulty(
+                len(translation['cultural_terms_found']), translation['technical_density_score'],
+                exact['avg_sentence_length']
+            ),
+            'recommended_localization_strategy': lambda: self._recommend_localization_strategy(
+                len(translation['cultural_terms_found']), translation['technical_density_score']
+            )
+        })
+        return translation
+
+    def _compose_recommendations(self, complexity: Dict, concepts: Dict, translation: Dict) -> Dict:
+        """Combine the three base analyses into the full communication strategy."""
+        with self.metrics.stage('recommendations'):
+            return self._recommendations(complexity, concepts, translation)
+
+    def _recommendations(self, complexity: Dict, concepts: Dict, translation: Dict) -> Dict:
         # Strategic recommendations based on analysis
         recommendations = {
             'primary_message_focus': self._determine_primary_focus(concepts),
@@ -216,34 +675,234 @@ class ContentAnalyzer:
             )
         }
     
+    def analyze_corpus(self, texts: Iterable[str], workers: Optional[int] = None,
+                       chunksize: int = 8, ordered: bool = True) -> Iterator[Dict]:
+        """
+        Run generate_communication_recommendations over many documents in parallel.
+
+        Documents are fanned out to a pool of `workers` processes (all cores by
+        default; 1 runs in-process). Each worker builds its analyser and lexicon
+        once, then receives documents in batches of `chunksize`. Results are
+        yielded as they finish, in input order unless `ordered` is False.
+
+        Workers analyse with this analyser's full configuration. The result
+        cache is consulted and filled here: cached documents are yielded
+        without going through the pool, and worker stage metrics are merged
+        into this analyser's.
+
+        Each yielded record is {'index', 'ok', 'result', 'error'}; a failing
+        document is reported with ok=False and does not abort the batch.
+        """
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1:
+            for index, text in enumerate(texts):
+                yield _corpus_record(self, index, text)
+            return
+
+        yield from self._pooled_corpus(texts, workers, chunksize, ordered)
+
+    def _pooled_corpus(self, texts: Iterable[str], workers: int, chunksize: int, ordered: bool) -> Iterator[Dict]:
+        """analyze_corpus over a pool of `workers` processes."""
+        missed: Dict[int, str] = {}
+        # Cached records, in input order; filled by the pool's task feeder thread
+        hits: deque = deque()
+
+        def cached_before(index: float) -> Iterator[Dict]:
+            while hits and (not ordered or hits[0]['index'] < index):
+                yield hits.popleft()
+
+        with Pool(workers, initializer=_init_corpus_worker, initargs=(self._worker_config(),)) as pool:
+            mapper = pool.imap if ordered else pool.imap_unordered
+            for record in mapper(_analyze_corpus_document, self._uncached_documents(texts, hits, missed), chunksize):
+                yield from cached_before(record['index'])
+                metrics = record.pop('metrics', None)
+                if metrics is not None:
+                    self.metrics.merge(metrics)
+                key = missed.pop(record['index'], None)
+                if key is not None and record['ok']:
+                    self.cache.put(key, record['result'])
+                yield record
+        yield from cached_before(float('inf'))
+
+    def _uncached_documents(self, texts: Iterable[str], hits: deque, missed: Dict[int, str]) -> Iterator[Tuple[int, str]]:
+        """
+        (index, text) of each document not in the result cache.
+
+        Records of cached documents are appended to `hits`, and the cache keys
+        of the others are kept in `missed`.
+        """
+        cache = self.cache
+        fingerprint = self.config_fingerprint() if cache is not None else None
+        for index, text in enumerate(texts):
+            if cache is not None and isinstance(text, str):
+                # The key generate_communication_recommendations(text) is cached under
+                key = cache_key('generate_communication_recommendations', text, fingerprint, ((), ()))
+                cached = cache.get(key)
+                if cached is not None:
+                    hits.append({'index': index, 'ok': True, 'result': cached, 'error': None})
+                    continue
+                missed[index] = key
+            yield index, text
+
+    def analyze_segments_deduplicated(self, threshold: float = 0.8,
+                                      adjust_fields: Iterable[str] = ('action_items', 'critical_deadlines'),
+                                      workers: Optional[int] = None, num_perm: int = 64) -> Dict:
+        """
+        Analyse content_segments, running the full analysis once per near-duplicate cluster.
+
+        Segments are clustered by MinHash/LSH over word shingles: a segment joins
+        the cluster of the most similar representative whose shingle Jaccard
+        similarity is at least `threshold`. Only representatives go through
+        analyze_corpus; other members reuse their representative's result, with
+        `adjust_fields` (a subset of NEAR_DUPLICATE_FIELDS: action items and
+        deadlines, found by the pattern scan alone) taken from the member's own
+        text. The priorities and recommendations derived from them are then
+        re-derived from the member's record, so each record is consistent with
+        itself. Exact duplicates (equal up to surrounding whitespace) are reused
+        unchanged. Records share the parts they do not change with their
+        representative's result, so treat them as read-only.
+
+        Returns {'records', 'clusters', 'stats'}: one analyze_corpus style record
+        per segment (plus its 'representative' index), the member indices of each
+        cluster, and counts of the work skipped.
+        """
+        adjust_fields = list(adjust_fields)
+        unsupported = sorted(set(adjust_fields) - set(NEAR_DUPLICATE_FIELDS))
+        if unsupported:
+            raise ValueError(f"Cannot adjust {', '.join(unsupported)} per near duplicate; "
+                             f"expected a subset of {', '.join(NEAR_DUPLICATE_FIELDS)}")
+
+        segments = list(self.content_segments)
+        index = NearDuplicateIndex(threshold, num_perm)
+        representatives = []
+        exact = []
+        for position, segment in enumerate(segments):
+            representative, is_exact = index.assign(position, segment)
+            representatives.append(representative)
+            exact.append(is_exact)
+
+        unique = [position for position, representative in enumerate(representatives) if position == representative]
+        analysed = {}
+        for record in self.analyze_corpus((segments[position] for position in unique), workers=workers):
+            analysed[unique[record['index']]] = record
+
+        records = []
+        clusters: Dict[int, List[int]] = {}
+        for position, representative in enumerate(representatives):
+            clusters.setdefault(representative, []).append(position)
+            source = analysed[representative]
+            record = {'index': position, 'ok': source['ok'], 'result': source['result'],
+                      'error': source['error'], 'representative': representative}
+            if position != representative and source['ok'] and adjust_fields and not exact[position]:
+                record['result'] = self._adjusted_result(source['result'], segments[position], adjust_fields)
+            records.append(record)
+
+        duplicates = len(segments) - len(unique)
+        return {
+            'records': records,
+            'clusters': list(clusters.values()),
+            'stats': {
+                'segments': len(segments),
+                'representatives': len(unique),
+                'exact_duplicates': sum(exact),
+                'near_duplicates': duplicates - sum(exact),
+                'analyses_skipped': duplicates,
+                'skip_ratio': round(duplicates / len(segments), 4) if segments else 0
+            }
+        }
+
+    def _adjusted_result(self, result: Dict, text: str, adjust_fields: List[str]) -> Dict:
+        """A representative's result with `text`'s own adjust_fields and everything derived from them."""
+        # Copy only the dicts that change; the rest stays shared with the representative's result
+        summary = dict(result['analysis_summary'])
+        concepts = summary['key_concepts'] = dict(summary['key_concepts'])
+        merge_selected({'analysis_summary': summary},
+                       self.generate_communication_recommendations(text, fields=adjust_fields))
+        concepts['communication_priorities'] = self._rank_communication_priorities(
+            concepts['epr_concepts'], concepts['action_items']
+        )
+        return self._recommendations(summary['complexity_analysis'], concepts, summary['translation_readiness'])
+
+    def index_segments(self, segments: Optional[Iterable] = None, index: Optional[SegmentIndex] = None,
+                       default_year: Optional[int] = None) -> SegmentIndex:
+        """
+        Build (or extend) a queryable SegmentIndex from analysis output.
+
+        `segments` is an iterable of texts, indexed by position, or of
+        (segment_id, text) pairs; content_segments by default. Each segment is
+        profiled once for its keyword hits, complexity metrics and deadlines;
+        deadlines without a year are placed in `default_year` (this year).
+        """
+        index = index if index is not None else SegmentIndex()
+        default_year = default_year or date.today().year
+        items = self.content_segments if segments is None else segments
+        for position, item in enumerate(items):
+            segment_id, text = item if isinstance(item, tuple) else (position, item)
+            profile = self.build_profile(text)
+            deadlines = (parse_deadline(deadline, default_year) for deadline in self._identify_deadlines(profile))
+            index.add(
+                segment_id,
+                profile.keyword_hits,
+                self.analyze_text_complexity(profile, fields=INDEXED_METRICS),
+                [deadline for deadline in deadlines if deadline is not None]
+            )
+            profile.record_stages()
+        return index
+
+    def _lexicon_config(self) -> Dict:
+        """Term lists that define this analyser, used to rebuild it in worker processes."""
+        return {
+            'epr_keywords': self.epr_keywords,
+            'complexity_indicators': self.complexity_indicators,
+            'cultural_terms': self.cultural_terms
+        }
+
+    def _worker_config(self) -> Dict:
+        """Everything besides the cache that defines this analyser, used to rebuild it in worker processes."""
+        config = dict(self._lexicon_config())
+        config['phrase_extractor'] = self.phrase_extractor
+        config['action_patterns'] = list(self.action_patterns)
+        config['deadline_patterns'] = list(self.deadline_patterns)
+        config['metrics_buckets'] = self.metrics.buckets if self.metrics.enabled else None
+        return config
+
     # Helper methods
     def _count_syllables(self, word: str) -> int:
-        """Simplified syllable counting for readability analysis."""
-        word = word.lower()
-        vowels = 'aeiouy'
-        syllables = 0
-        prev_was_vowel = False
-        
-        for char in word:
-            if char in vowels:
-                if not prev_was_vowel:
-                    syllables += 1
-                prev_was_vowel = True
-            else:
-                prev_was_vowel = False
-                
-        if word.endswith('e'):
-            syllables -= 1
-        
-        return max(1, syllables)
-    
-    def _calculate_epr_density(self, text: str) -> Dict:
+        """Simplified syllable counting for readability analysis (memoised)."""
+        return self.syllable_counter.count(word.lower())
+    
+    @_records_stages
+    def _calculate_epr_density(self, text: Union[str, TextProfile]) -> Dict:
         """Calculate density of EPR-related terminology."""
-        total_words = len(text.split())
+        profile = self.build_profile(text)
+        return self._density_from_counts(self._epr_term_counts(profile.keyword_hits), len(profile.words))
+
+    def _readability_stats(self, profile: TextProfile) -> ComplexityStats:
+        """Word, syllable and sentence counts (with sentence boundary state) for a profile."""
+        segmentation = profile.segmentation
+        sentences = segmentation.sentence_count
+        return ComplexityStats(
+            total_words=len(profile.words),
+            total_sentences=sentences,
+            syllables=sum(profile.syllable_counts),
+            has_terminator=segmentation.has_terminator,
+            leading_fragment=sentences > 0 and segmentation.sentence_span(0)[0] == 0,
+            trailing_fragment=sentences > 0 and segmentation.sentence_span(-1)[1] == len(profile.text)
+        )
+
+    def _epr_term_counts(self, hits: KeywordHits) -> Dict[str, int]:
+        """Total keyword occurrences per EPR priority category."""
+        return {
+            priority: sum(hits.count(keyword) for keyword in keywords)
+            for priority, keywords in self.epr_keywords.items()
+        }
+
+    def _density_from_counts(self, counts: Dict[str, int], total_words: int) -> Dict:
+        """Occurrences per 100 words for each EPR priority category."""
         densities = {}
         
-        for priority, keywords in self.epr_keywords.items():
-            count = sum(text.count(keyword) for keyword in keywords)
+        for priority, count in counts.items():
             densities[priority] = round(count / total_words * 100, 2) if total_words > 0 else 0
         
         return densities
@@ -290,55 +949,42 @@ class ContentAnalyzer:
         weights = {'high_priority': 3, 'medium_priority': 2, 'process_terms': 2}
         return weights.get(priority_level, 1)
     
-    def _extract_important_phrases(self, text: str, top_n: int) -> List[Dict]:
+    @_records_stages
+    def _extract_important_phrases(self, text: Union[str, TextProfile], top_n: int) -> List[Dict]:
         """Extract multi-word phrases likely to be important for sellers."""
-        # Simple n-gram extraction for important phrases
-        words = re.findall(r'\b\w+\b', text.lower())
-        
-        # Generate 2-3 word phrases
-        phrases = []
-        for i in range(len(words) - 2):
-            phrase = ' '.join(words[i:i+3])
-            phrases.append(phrase)
-        
-        # Count frequency and return top phrases
-        phrase_counts = Counter(phrases)
-        top_phrases = phrase_counts.most_common(top_n)
-        
-        return [{'phrase': phrase, 'frequency': count} for phrase, count in top_phrases]
+        # N-grams are counted as token-ID tuples; only the top phrases are joined back into text
+        profile = self.build_profile(text)
+        tokens = profile.phrase_tokens
+        with profile.stages.stage('phrase_ngrams'):
+            return self.phrase_extractor.top_phrases(tokens, top_n)
+
+    def rank_corpus_phrases(self, texts: Iterable[str], top_n: int = 10, capacity: int = 10000) -> List[Dict]:
+        """
+        Approximate corpus-wide key phrases in bounded memory.
+
+        Uses a space-saving summary of `capacity` phrases; each result carries
+        the maximum amount by which its frequency may be overestimated.
+        """
+        ranker = CorpusPhraseRanker(self.phrase_extractor, capacity)
+        for text in texts:
+            profile = self.build_profile(text)
+            ranker.add_tokens(profile.phrase_tokens)
+            profile.record_stages()
+        return ranker.top_phrases(top_n)
     
-    def _identify_action_items(self, text: str) -> List[str]:
+    @_records_stages
+    def _identify_action_items(self, text: Union[str, TextProfile]) -> List[str]:
         """Identify actionable items sellers need to complete."""
-        action_patterns = [
-            r'must\s+\w+',
-            r'shall\s+\w+',
-            r'required\s+to\s+\w+',
-            r'obligation\s+to\s+\w+',
-            r'need\s+to\s+\w+'
-        ]
-        
-        actions = []
-        for pattern in action_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            actions.extend(matches)
-        
-        return list(set(actions))  # Remove duplicates
-    
-    def _identify_deadlines(self, text: str) -> List[str]:
-        """Identify time-sensitive information."""
-        date_patterns = [
-            r'\d{1,2}/\d{1,2}/\d{4}',
-            r'\d{1,2}\s+\w+\s+\d{4}',
-            r'by\s+\w+\s+\d{1,2}',
-            r'before\s+\w+\s+\d{1,2}'
-        ]
-        
-        deadlines = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            deadlines.extend(matches)
+        matches = self.build_profile(text).pattern_matches
+        actions = [match['text'] for match in matches if match['type'] == 'action_item']
         
-        return deadlines
+        return list(dict.fromkeys(actions))  # Remove duplicates, keeping document order
+    
+    @_records_stages
+    def _identify_deadlines(self, text: Union[str, TextProfile]) -> List[str]:
+        """Identify time-sensitive information."""
+        matches = self.build_profile(text).pattern_matches
+        return [match['text'] for match in matches if match['type'] == 'deadline']
     
     def _rank_communication_priorities(self, concepts: Dict, actions: List) -> List[str]:
         """Rank what should be communicated first."""
@@ -391,8 +1037,8 @@ class ContentAnalyzer:
     
     def _determine_primary_focus(self, concepts: Dict) -> str:
         """Determine primary message focus based on content analysis."""
-        high_priority_count = len(concepts['high_priority'])
-        process_count = len(concepts['process_terms'])
+        high_priority_count = len(concepts['epr_concepts']['high_priority'])
+        process_count = len(concepts['epr_concepts']['process_terms'])
         
         if high_priority_count > process_count:
             return "Compliance importance and consequences"
@@ -460,7 +1106,7 @@ class ContentAnalyzer:
             risk_factors += 2
         
         # Many high-priority compliance items increase stress
-        if len(concepts['high_priority']) > 5:
+        if len(concepts['epr_concepts']['high_priority']) > 5:
             risk_factors += 1
         
         # Many action items can overwhelm
@@ -505,7 +1151,7 @@ class ContentAnalyzer:
             priority_score += 1
         
         # High-priority concepts need immediate attention
-        priority_score += len(concepts['high_priority'])
+        priority_score += len(concepts['epr_concepts']['high_priority'])
         
         # Translation challenges add complexity
         if translation['translation_difficulty'].startswith("HIGH"):
@@ -519,6 +1165,75 @@ class ContentAnalyzer:
             return "MEDIUM - Standard implementation timeline"
 
 
+def shared_syllable_counter() -> SyllableCounter:
+    """Process-wide syllable counter, seeded from the bundled lexicon when present."""
+    global _SYLLABLE_COUNTER
+    if _SYLLABLE_COUNTER is None:
+        if os.path.exists(SYLLABLE_LEXICON_PATH):
+            _SYLLABLE_COUNTER = SyllableCounter.from_file(SYLLABLE_LEXICON_PATH)
+        else:
+            _SYLLABLE_COUNTER = SyllableCounter()
+    return _SYLLABLE_COUNTER
+
+
+def _compiled(cache: OrderedDict, key: Tuple, build: Callable[[], object]):
+    """Least-recently-used lookup in a compiled cache, building the entry on a miss."""
+    with _COMPILED_CACHE_LOCK:
+        compiled = cache.get(key)
+        if compiled is not None:
+            cache.move_to_end(key)
+            return compiled
+    # Compile outside the lock; if another thread got there first, share its copy
+    compiled = build()
+    with _COMPILED_CACHE_LOCK:
+        compiled = cache.setdefault(key, compiled)
+        cache.move_to_end(key)
+        while len(cache) > COMPILED_CACHE_SIZE:
+            cache.popitem(last=False)
+    return compiled
+
+
+def worker_analyzer(config: Dict) -> ContentAnalyzer:
+    """Rebuild an analyser from its _worker_config() in a worker process (automaton compiled)."""
+    config = dict(config)
+    buckets = config.pop('metrics_buckets')
+    analyzer = ContentAnalyzer([])
+    if buckets is not None:
+        analyzer.metrics = AnalysisMetrics(buckets)
+    for name, value in config.items():
+        setattr(analyzer, name, value)
+    analyzer.keyword_automaton()
+    return analyzer
+
+
+def _init_corpus_worker(config: Dict):
+    """Build the per-process analyser once per worker."""
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = worker_analyzer(config)
+
+
+def _analyze_corpus_document(item: Tuple[int, str]) -> Dict:
+    """Analyse one corpus document in a worker."""
+    index, text = item
+    analyzer = _WORKER_ANALYZER
+    if not analyzer.metrics.enabled:
+        return _corpus_record(analyzer, index, text)
+    # Ship this document's stage timings back with its record
+    analyzer.metrics = AnalysisMetrics(analyzer.metrics.buckets)
+    record = _corpus_record(analyzer, index, text)
+    record['metrics'] = analyzer.metrics
+    return record
+
+
+def _corpus_record(analyzer: ContentAnalyzer, index: int, text: str) -> Dict:
+    """Analyse one corpus document, capturing failures instead of raising."""
+    try:
+        result = analyzer.generate_communication_recommendations(text)
+    except Exception as exc:
+        return {'index': index, 'ok': False, 'result': None, 'error': f"{type(exc).__name__}: {exc}"}
+    return {'index': index, 'ok': True, 'result': result, 'error': None}
+
+
 # Example usage and testing functionality
 if __name__ == "__main__":
     # Example EPR regulation text for demonstration
@@ -530,8 +1245,15 @@ if __name__ == "__main__":
     materials. Non-compliance may result in penalties up to €50,000. 
     Registration must be completed before first market placement.
     """
-    
-    analyzer = ContentAnalyzer()
+
+    parser = argparse.ArgumentParser(description='Analyse an EPR regulation text.')
+    parser.add_argument('--input', help='text file to analyse (default: a built-in EPR example)')
+    args = parser.parse_args()
+    if args.input:
+        with open(args.input, encoding='utf-8') as handle:
+            sample_epr_text = handle.read()
+
+    analyzer = ContentAnalyzer([sample_epr_text])
     
     print("=== Sustainability Communications Framework Demo ===\n")
     
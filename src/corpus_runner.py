@@ -0,0 +1,271 @@
+"""
+Sustainability Communications Framework - Incremental Corpus Runner
+
+Command-line runner that analyses a directory tree of regulatory texts and
+seller drafts with ContentAnalyzer and writes one JSON line per file. A
+manifest of content hashes and previous results is kept next to the corpus,
+so only new or changed files are re-analysed; with --watch the tree is
+polled and changes are processed as they land.
+
+Files whose size and modification time match the manifest are reused
+without being read. Files modified at or after the previous scan started are
+re-hashed even when their stat matches (the same "racily clean" rule git
+uses), so an edit within the clock's granularity is never missed. Cold runs
+fan out over all cores through analyze_corpus.
+
+Usage:
+    python src/corpus_runner.py regulations/ --output results.jsonl
+    python src/corpus_runner.py regulations/ --watch --interval 5 --output results.jsonl
+
+Author: Begoña Penón
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from content_analyzer import ContentAnalyzer
+
+
+MANIFEST_NAME = '.analysis_manifest.json'
+MANIFEST_VERSION = 1
+
+DEFAULT_PATTERNS = ('*.txt', '*.md')
+
+# Batches this small are analysed in-process; a worker pool would cost more to start
+IN_PROCESS_BATCH = 16
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class CorpusRunner:
+    """
+    Manifest-backed incremental analysis of every matching file under `root`.
+
+    The manifest maps each relative path to its size, mtime, content hash and
+    last analysis record ({'ok', 'result', 'error'}). It is tied to the
+    analyser's config fingerprint: a lexicon or rules change re-analyses
+    everything.
+    """
+
+    def __init__(self, root: str, manifest_path: Optional[str] = None,
+                 patterns: Sequence[str] = DEFAULT_PATTERNS, analyzer: Optional[ContentAnalyzer] = None,
+                 workers: Optional[int] = None):
+        self.root = os.path.abspath(root)
+        self.manifest_path = manifest_path or os.path.join(self.root, MANIFEST_NAME)
+        self.patterns = tuple(patterns)
+        self.analyzer = analyzer or ContentAnalyzer([])
+        self.workers = workers
+        self.entries: Dict[str, Dict] = {}
+        self._scanned_at = 0
+        self._load_manifest()
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as handle:
+                manifest = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if not isinstance(manifest, dict) or not isinstance(manifest.get('files'), dict):
+            return
+        if (manifest.get('version') == MANIFEST_VERSION
+                and manifest.get('config_fingerprint') == self.analyzer.config_fingerprint()):
+            self.entries = manifest['files']
+            self._scanned_at = manifest.get('scanned_at', 0)
+
+    def save_manifest(self):
+        _write_atomically(self.manifest_path, lambda handle: json.dump({
+            'version': MANIFEST_VERSION,
+            'config_fingerprint': self.analyzer.config_fingerprint(),
+            'scanned_at': self._scanned_at,
+            'files': self.entries
+        }, handle))
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        """Relative path -> (size, mtime_ns) of every matching file, in sorted order."""
+        manifest = os.path.abspath(self.manifest_path)
+        found = {}
+        for directory, subdirectories, filenames in os.walk(self.root):
+            subdirectories[:] = sorted(name for name in subdirectories if not name.startswith('.'))
+            for filename in sorted(filenames):
+                path = os.path.join(directory, filename)
+                if path == manifest or not any(fnmatch.fnmatch(filename, pattern) for pattern in self.patterns):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    # Deleted or renamed since the directory was listed (or a dangling link)
+                    continue
+                found[os.path.relpath(path, self.root).replace(os.sep, '/')] = (stat.st_size, stat.st_mtime_ns)
+        return found
+
+    def run(self) -> Dict:
+        """
+        Bring the manifest up to date with the tree.
+
+        Returns a summary with the paths analysed and removed in this run and
+        the counts of reused files and failures.
+        """
+        started = time.perf_counter()
+        scanned_at = time.time_ns()
+        files = self.scan()
+
+        # Only files whose stat changed (or that could have changed unnoticed) are read and hashed
+        candidates: List[str] = []
+        reused = 0
+        for path, (size, mtime_ns) in files.items():
+            entry = self.entries.get(path)
+            if entry is not None and entry['size'] == size and entry['mtime_ns'] == mtime_ns \
+                    and mtime_ns < self._scanned_at:
+                reused += 1
+            else:
+                candidates.append(path)
+
+        removed = [path for path in self.entries if path not in files]
+        for path in removed:
+            del self.entries[path]
+
+        analyzed = self._analyze(candidates, files)
+        self._scanned_at = scanned_at
+        return {
+            'analyzed': analyzed,
+            'removed': removed,
+            'reused': reused + len(candidates) - len(analyzed),
+            'failed': sum(1 for entry in self.entries.values() if not entry['record']['ok']),
+            'seconds': round(time.perf_counter() - started, 3)
+        }
+
+    def _analyze(self, candidates: List[str], files: Dict[str, Tuple[int, int]]) -> List[str]:
+        """
+        Hash `candidates` and analyse those whose content changed.
+
+        Returns the analysed paths, including files that could not be read:
+        those are recorded as failures and retried on the next run.
+        """
+        if not candidates:
+            return []
+        changed: List[Tuple[str, str]] = []
+        unreadable: List[str] = []
+
+        def texts():
+            # Each file is read once, so the stored hash is always that of the analysed text,
+            # and lazily, so a cold run never holds the whole corpus in memory
+            for path in candidates:
+                try:
+                    with open(os.path.join(self.root, path), 'rb') as handle:
+                        data = handle.read()
+                except OSError as exc:
+                    # Deleted, renamed or locked since the scan. No stat or hash is kept,
+                    # so the next run looks at the file afresh (or reports it removed)
+                    self.entries[path] = {
+                        'size': None,
+                        'mtime_ns': None,
+                        'sha256': None,
+                        'record': {'ok': False, 'result': None, 'error': f"{type(exc).__name__}: {exc}"}
+                    }
+                    unreadable.append(path)
+                    continue
+                digest = file_digest(data)
+                entry = self.entries.get(path)
+                if entry is not None and entry['sha256'] == digest:
+                    entry['size'], entry['mtime_ns'] = files[path]
+                    continue
+                changed.append((path, digest))
+                # Decoded as text mode would: invalid bytes replaced, universal newlines
+                yield data.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+
+        workers = 1 if len(candidates) <= IN_PROCESS_BATCH else self.workers
+        for record in self.analyzer.analyze_corpus(texts(), workers=workers, ordered=False):
+            path, digest = changed[record['index']]
+            size, mtime_ns = files[path]
+            self.entries[path] = {
+                'size': size,
+                'mtime_ns': mtime_ns,
+                'sha256': digest,
+                'record': {'ok': record['ok'], 'result': record['result'], 'error': record['error']}
+            }
+        return [path for path, _ in changed] + unreadable
+
+    def records(self, paths: Optional[Sequence[str]] = None) -> List[Dict]:
+        """Output records, sorted by path (all files unless `paths` is given)."""
+        paths = sorted(self.entries if paths is None else paths)
+        return [dict(path=path, sha256=self.entries[path]['sha256'], **self.entries[path]['record'])
+                for path in paths]
+
+    def write_jsonl(self, handle: TextIO, paths: Optional[Sequence[str]] = None):
+        for record in self.records(paths):
+            handle.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def watch(self, interval: float = 2.0, on_run: Optional[Callable[[Dict], None]] = None,
+              max_polls: Optional[int] = None):
+        """Poll the tree every `interval` seconds, calling `on_run` with each run summary that changed anything."""
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            summary = self.run()
+            polls += 1
+            if summary['analyzed'] or summary['removed']:
+                self.save_manifest()
+                if on_run is not None:
+                    on_run(summary)
+            if max_polls is None or polls < max_polls:
+                time.sleep(interval)
+
+
+def _write_atomically(path: str, write: Callable[[TextIO], None]):
+    """Write through a temporary file so readers never see a partial file."""
+    temporary = f'{path}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as handle:
+        write(handle)
+    os.replace(temporary, path)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Incrementally analyse a directory of regulatory texts.')
+    parser.add_argument('root', help='directory tree to analyse')
+    parser.add_argument('--output', default='-', help='combined JSON-lines output file (default: stdout)')
+    parser.add_argument('--manifest', help=f'manifest path (default: <root>/{MANIFEST_NAME})')
+    parser.add_argument('--pattern', nargs='+', default=list(DEFAULT_PATTERNS), help='file name patterns')
+    parser.add_argument('--workers', type=int, help='worker processes for large batches (default: all cores)')
+    parser.add_argument('--force', action='store_true', help='ignore the manifest and re-analyse everything')
+    parser.add_argument('--watch', action='store_true', help='keep polling the tree for changes')
+    parser.add_argument('--interval', type=float, default=2.0, help='seconds between polls in watch mode')
+    args = parser.parse_args(argv)
+
+    runner = CorpusRunner(args.root, args.manifest, args.pattern, workers=args.workers)
+    if args.force:
+        runner.entries = {}
+
+    def write_output(summary: Dict, paths: Optional[List[str]] = None):
+        if args.output == '-':
+            runner.write_jsonl(sys.stdout, paths)
+            for path in summary['removed'] if paths is not None else ():
+                sys.stdout.write(json.dumps({'path': path, 'removed': True}) + '\n')
+            sys.stdout.flush()
+        else:
+            _write_atomically(args.output, runner.write_jsonl)
+        report = {key: len(value) if isinstance(value, list) else value for key, value in summary.items()}
+        print(json.dumps(report), file=sys.stderr)
+
+    summary = runner.run()
+    runner.save_manifest()
+    write_output(summary)
+
+    if args.watch:
+        try:
+            # On stdout, later runs only emit the files they re-analysed or removed
+            runner.watch(args.interval, on_run=lambda summary: write_output(summary, summary['analyzed']))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Sustainability Communications Framework - Incremental Analysis Session
+
+Re-analysis of edited drafts. Each content segment is fingerprinted and its
+partial results are cached, so after an edit only the changed segments are
+re-profiled before the document-level analysis is re-derived.
+
+Author: Begoña Penón
+"""
+
+import hashlib
+from typing import Dict, List, Tuple
+
+from complexity_stats import ComplexityStats
+
+
+# The document analysed by a session is its segments joined by line breaks
+SEGMENT_SEPARATOR = '\n'
+
+
+class SegmentResult:
+    """Cached partial results for one segment text."""
+
+    def __init__(self, analyzer, text: str):
+        profile = analyzer.build_profile(text)
+        tokens = profile.phrase_tokens
+        edge = analyzer.phrase_extractor.ngram_range[1] - 1
+
+        self.stats: ComplexityStats = analyzer.complexity_stats(profile)
+        self.term_counts: Dict[str, int] = profile.keyword_hits.counts
+        self.acronyms = profile.acronym_count
+        self.sentence_words = sum(profile.sentence_word_counts)
+        self.token_count = len(tokens)
+        # Tokens that can take part in an n-gram straddling a segment join
+        self.head_tokens = tokens[:edge]
+        self.tail_tokens = tokens[max(0, len(tokens) - edge):] if edge else []
+
+        # Phrase -> [count, n, first local token position]
+        self.phrases: Dict[str, List[int]] = analyzer.phrase_extractor.positioned_counts(tokens)
+        profile.record_stages()
+
+
+class IncrementalAnalysisSession:
+    """
+    Incremental generate_communication_recommendations over a segmented draft.
+
+    `update` takes the full list of segments after an edit; segments whose
+    fingerprint is unchanged reuse their cached results. Action item and
+    deadline patterns can match across a segment join, so they are re-run as
+    one regex pass over the joined draft. Everything else (tokenisation,
+    syllables, keyword and phrase counting) is only recomputed for changed
+    segments. The aggregate equals a full run over the joined document.
+    """
+
+    def __init__(self, analyzer, top_n: int = 10):
+        self.analyzer = analyzer
+        self.top_n = top_n
+        self.segments: List[str] = []
+        self.result: Dict = {}
+        self.segments_recomputed = 0
+        self.segments_reused = 0
+        self._cache: Dict[str, SegmentResult] = {}
+        self._automaton = None
+
+    @staticmethod
+    def fingerprint(segment: str) -> str:
+        return hashlib.sha1(segment.encode('utf-8')).hexdigest()
+
+    @property
+    def document(self) -> str:
+        return SEGMENT_SEPARATOR.join(self.segments)
+
+    def update(self, segments: List[str]) -> Dict:
+        """Replace the draft's segments and return the re-derived recommendations."""
+        # A lexicon edit invalidates every cached segment
+        automaton = self.analyzer.keyword_automaton()
+        if automaton is not self._automaton:
+            self._cache.clear()
+            self._automaton = automaton
+
+        results = []
+        live = {}
+        for segment in segments:
+            key = self.fingerprint(segment)
+            result = live.get(key) or self._cache.get(key)
+            if result is None:
+                result = SegmentResult(self.analyzer, segment)
+                self.segments_recomputed += 1
+            else:
+                self.segments_reused += 1
+            live[key] = result
+            results.append(result)
+
+        # Only keep entries for segments still in the draft
+        self._cache = live
+        self.segments = list(segments)
+        self.result = self._aggregate(results)
+        return self.result
+
+    def update_segment(self, index: int, text: str) -> Dict:
+        """Edit a single segment in place."""
+        segments = list(self.segments)
+        segments[index] = text
+        return self.update(segments)
+
+    def _aggregate(self, results: List[SegmentResult]) -> Dict:
+        analyzer = self.analyzer
+        document = analyzer.build_profile(self.document)
+
+        stats = sum((result.stats for result in results), ComplexityStats())
+        term_counts: Dict[str, int] = {}
+        for result in results:
+            for term, count in result.term_counts.items():
+                term_counts[term] = term_counts.get(term, 0) + count
+
+        complexity = analyzer.complexity_report(stats)
+        concepts = analyzer._key_concepts(
+            term_counts=term_counts,
+            phrases=self._merge_phrases(results),
+            action_items=analyzer._identify_action_items(document),
+            deadlines=analyzer._identify_deadlines(document)
+        )
+        translation = analyzer._translation_readiness(
+            term_counts=term_counts,
+            technical_density=sum(result.acronyms for result in results),
+            sentence_words=sum(result.sentence_words for result in results),
+            sentence_count=stats.total_sentences
+        )
+        document.record_stages()
+        return analyzer._compose_recommendations(complexity, concepts, translation)
+
+    def _merge_phrases(self, results: List[SegmentResult]) -> List[Dict]:
+        """Combine segment phrase counts, adding the n-grams that straddle segment joins."""
+        extractor = self.analyzer.phrase_extractor
+        min_n, max_n = extractor.ngram_range
+
+        # Phrase -> [count, n, first global token position]; ties rank like PhraseExtractor
+        merged: Dict[str, List[int]] = {}
+
+        def add(phrase: str, count: int, n: int, position: int):
+            entry = merged.get(phrase)
+            if entry is None:
+                merged[phrase] = [count, n, position]
+            else:
+                entry[0] += count
+                entry[2] = min(entry[2], position)
+
+        offset = 0
+        carry: List[Tuple[int, str]] = []  # last (max_n - 1) tokens seen, with global positions
+        for result in results:
+            for phrase, (count, n, first) in result.phrases.items():
+                add(phrase, count, n, offset + first)
+
+            window = carry + [(offset + i, token) for i, token in enumerate(result.head_tokens)]
+            for n in range(min_n, max_n + 1):
+                # Only n-grams starting before the join and ending inside this segment
+                for start in range(max(0, len(carry) - n + 1), len(carry)):
+                    if start + n <= len(window):
+                        tokens = [token for _, token in window[start:start + n]]
+                        if extractor.is_kept(tokens):
+                            add(' '.join(tokens), 1, n, window[start][0])
+
+            tail_start = offset + result.token_count - len(result.tail_tokens)
+            carry = carry + [(tail_start + i, token) for i, token in enumerate(result.tail_tokens)]
+            carry = carry[max(0, len(carry) - (max_n - 1)):] if max_n > 1 else []
+            offset += result.token_count
+
+        ranked = sorted(merged.items(), key=lambda item: (-item[1][0], item[1][1], item[1][2]))[:self.top_n]
+        return [{'phrase': phrase, 'frequency': count} for phrase, (count, _, _) in ranked]
@@ -0,0 +1,105 @@
+"""
+Sustainability Communications Framework - Keyword Automaton
+
+Multi-pattern keyword matching for the content analyser lexicons. The
+lexicon is compiled once into a term -> categories table; each term is then
+located with str.find, which runs in C, and the offsets it reports give the
+counts, the categories and the document-order hit streams the analyser needs.
+
+Author: Begoña Penón
+"""
+
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple
+
+
+class KeywordHits:
+    """
+    Result of a single automaton scan over a (lowercased) text.
+
+    Holds per-term counts, the categories each term belongs to and the
+    character offsets of every occurrence.
+    """
+
+    def __init__(self, categories: Dict[str, Tuple[str, ...]]):
+        self.categories = categories
+        self.counts: Dict[str, int] = {}
+        self.offsets: Dict[str, List[int]] = {}
+
+    def count(self, term: str) -> int:
+        """Non-overlapping occurrences of a term (same semantics as str.count)."""
+        return self.counts.get(term, 0)
+
+    def found(self, term: str) -> bool:
+        """Whether a term occurs at least once."""
+        return term in self.counts
+
+    def category_total(self, category: str) -> int:
+        """Total occurrences of all terms belonging to a category."""
+        return sum(count for term, count in self.counts.items() if category in self.categories[term])
+
+
+class KeywordAutomaton:
+    """
+    Keyword matcher over a categorised lexicon.
+
+    Every term is searched for with str.find, stepping past each occurrence
+    (or by one character when overlaps are wanted). Per-term find loops beat
+    a combined regex here: the search itself runs in C and only hits cost
+    Python work, while a regex alternation is tried at every text position.
+    """
+
+    def __init__(self, lexicon: Mapping[str, Iterable[str]]):
+        categories: Dict[str, List[str]] = {}
+        for category, terms in lexicon.items():
+            for term in terms:
+                term = term.lower()
+                if term and category not in categories.setdefault(term, []):
+                    categories[term].append(category)
+
+        self.categories = {term: tuple(cats) for term, cats in categories.items()}
+        self.terms = list(self.categories)
+
+    def find_all(self, text: str, overlapping: bool = False) -> Dict[str, List[int]]:
+        """
+        Start offsets of every term found in `text`, ascending per term.
+
+        Without `overlapping`, repeats of a term that overlap an earlier one are
+        skipped, exactly as str.count skips them.
+        """
+        found = {}
+        find = text.find
+        for term in self.terms:
+            start = find(term)
+            if start < 0:
+                continue
+            starts = found[term] = []
+            step = 1 if overlapping else len(term)
+            while start >= 0:
+                starts.append(start)
+                start = find(term, start + step)
+        return found
+
+    def scan(self, text: str) -> KeywordHits:
+        """Scan a lowercased text and collect every term occurrence."""
+        hits = KeywordHits(self.categories)
+        found = self.find_all(text)
+        # Terms in order of first occurrence, as a left-to-right scan meets them
+        for term in sorted(found, key=lambda term: (found[term][0], len(term))):
+            hits.counts[term] = len(found[term])
+            hits.offsets[term] = found[term]
+        return hits
+
+    def iter_hits(self, text: str, offset: int = 0) -> Iterator[Tuple[int, str]]:
+        """Yield (offset, term) for the occurrences `scan` counts, in document order."""
+        yield from _document_order(self.find_all(text), offset)
+
+    def iter_matches(self, text: str, offset: int = 0) -> Iterator[Tuple[int, str]]:
+        """Yield (offset, term) for every occurrence in document order, overlaps included."""
+        yield from _document_order(self.find_all(text, overlapping=True), offset)
+
+
+def _document_order(found: Dict[str, List[int]], offset: int) -> Iterator[Tuple[int, str]]:
+    # Terms starting at the same offset are prefixes of one another, so the
+    # (start, term) order lists them shortest first
+    for start, term in sorted((start, term) for term, starts in found.items() for start in starts):
+        yield start + offset, term
@@ -0,0 +1,170 @@
+"""
+Sustainability Communications Framework - Lazy Analysis Results
+
+Analysis results whose fields are computed on first access and memoised, and
+the explicit dependency graph between result fields and the per-document
+profile stages they read. Asking for one field runs only the stages in its
+dependency closure: `flesch_reading_ease` never extracts phrases, and
+`critical_deadlines` never counts syllables.
+
+Author: Begoña Penón
+"""
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set
+
+
+# Result field -> the fields and profile stages ('profile.<field>') it reads.
+# Field names are unique across the analysis sections.
+FIELD_DEPENDENCIES = {
+    # analyze_text_complexity
+    'total_words': ('profile.words',),
+    'total_sentences': ('profile.segmentation',),
+    'avg_words_per_sentence': ('total_words', 'total_sentences'),
+    'avg_syllables_per_word': ('profile.syllable_counts', 'total_words'),
+    'flesch_reading_ease': ('avg_words_per_sentence', 'avg_syllables_per_word'),
+    'readability_level': ('flesch_reading_ease',),
+    'legal_complexity_ratio': ('profile.keyword_hits', 'total_words'),
+    'epr_terminology_density': ('profile.keyword_hits', 'total_words'),
+    'recommended_audience': ('flesch_reading_ease', 'legal_complexity_ratio'),
+    'adaptation_priority': ('flesch_reading_ease', 'legal_complexity_ratio', 'epr_terminology_density'),
+
+    # extract_key_concepts
+    'epr_concepts': ('profile.keyword_hits',),
+    'key_phrases': ('profile.phrase_tokens',),
+    'action_items': ('profile.pattern_matches',),
+    'critical_deadlines': ('profile.pattern_matches',),
+    'communication_priorities': ('epr_concepts', 'action_items'),
+
+    # assess_translation_readiness
+    'cultural_terms_found': ('profile.keyword_hits',),
+    'cultural_adaptation_needed': ('cultural_terms_found',),
+    'technical_density_score': ('profile.acronym_count',),
+    'avg_sentence_length': ('profile.sentence_word_counts',),
+    'translation_difficulty': ('cultural_terms_found', 'technical_density_score', 'avg_sentence_length'),
+    'recommended_localization_strategy': ('cultural_terms_found', 'technical_density_score'),
+
+    # generate_communication_recommendations (_determine_* / _recommend_* / _assess_* rules)
+    'primary_message_focus': ('epr_concepts',),
+    'audience_segmentation': ('flesch_reading_ease', 'legal_complexity_ratio'),
+    'channel_strategy': ('flesch_reading_ease', 'action_items'),
+    'content_adaptation_needs': ('flesch_reading_ease', 'legal_complexity_ratio',
+                                 'cultural_adaptation_needed', 'technical_density_score'),
+    'crisis_communication_risk': ('flesch_reading_ease', 'epr_concepts', 'action_items'),
+    'success_metrics_focus': ('action_items', 'flesch_reading_ease'),
+    'implementation_priority': ('flesch_reading_ease', 'epr_concepts', 'translation_difficulty')
+}
+
+
+# Profile stage -> the profile stages it is derived from
+PROFILE_DEPENDENCIES = {
+    'profile.words': ('profile.lower', 'profile.segmentation'),
+    'profile.phrase_tokens': ('profile.words',),
+    'profile.keyword_hits': ('profile.lower',),
+    'profile.syllable_counts': ('profile.words',),
+    'profile.sentence_spans': ('profile.segmentation',),
+    'profile.sentence_word_counts': ('profile.segmentation',)
+}
+
+
+def dependency_closure(fields: Iterable[str]) -> Set[str]:
+    """Every field and profile stage needed to compute `fields`, including themselves."""
+    needed = set()
+    pending = list(fields)
+    while pending:
+        name = pending.pop()
+        if name in needed:
+            continue
+        needed.add(name)
+        pending.extend(FIELD_DEPENDENCIES.get(name) or PROFILE_DEPENDENCIES.get(name, ()))
+    return needed
+
+
+def required_stages(fields: Iterable[str]) -> Set[str]:
+    """Profile stages (TextProfile attribute names) that computing `fields` touches."""
+    return {name[len('profile.'):] for name in dependency_closure(fields) if name.startswith('profile.')}
+
+
+class LazyResult(Mapping):
+    """
+    Read-only mapping whose values are computed on first access and memoised.
+
+    `resolvers` maps each key to a zero-argument callable; values may
+    themselves be LazyResults, giving the nested layout of the eager methods.
+    """
+
+    def __init__(self, resolvers: Dict[str, Callable[[], Any]]):
+        self._resolvers = resolvers
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        values = self._values
+        if key not in values:
+            values[key] = self._resolvers[key]()
+        return values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._resolvers)
+
+    def __len__(self) -> int:
+        return len(self._resolvers)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._resolvers
+
+    def __repr__(self) -> str:
+        return f'LazyResult(computed={self.computed()!r})'
+
+    def computed(self) -> List[str]:
+        """Keys evaluated so far."""
+        return list(self._values)
+
+    def leaves(self) -> Set[str]:
+        """Field names at the bottom of the layout, across nested sections."""
+        names = set()
+        for key in self._resolvers:
+            if key in FIELD_DEPENDENCIES:
+                names.add(key)
+            else:
+                names |= self[key].leaves()
+        return names
+
+    def to_dict(self) -> Dict:
+        """Compute every field and return plain nested dicts."""
+        return {key: _materialize(value) for key, value in self.items()}
+
+    def select(self, fields: Iterable[str]) -> Dict:
+        """
+        Plain dict holding only `fields`, in this result's nested layout.
+
+        Only the stages those fields depend on are computed.
+        """
+        wanted = set(fields)
+        unknown = wanted - self.leaves()
+        if unknown:
+            raise ValueError(f"Unknown analysis fields: {', '.join(sorted(unknown))}")
+        return self._select(wanted)
+
+    def _select(self, wanted: Set[str]) -> Dict:
+        selected = {}
+        for key in self._resolvers:
+            if key in FIELD_DEPENDENCIES:
+                if key in wanted:
+                    selected[key] = _materialize(self[key])
+            elif wanted & self[key].leaves():
+                selected[key] = self[key]._select(wanted)
+        return selected
+
+
+def merge_selected(result: Dict, selected: Dict) -> Dict:
+    """Overwrite the fields of a plain result dict with a `select` output, in place."""
+    for key, value in selected.items():
+        if isinstance(value, dict) and key not in FIELD_DEPENDENCIES:
+            merge_selected(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+def _materialize(value: Any) -> Any:
+    return value.to_dict() if isinstance(value, LazyResult) else value
@@ -0,0 +1,185 @@
+"""
+Sustainability Communications Framework - Shared Lexicon
+
+The EPR keywords, complexity indicators and cultural terms are loaded once
+from a versioned data file (data/lexicon.json) and compiled once into a
+read-only Lexicon shared by every ContentAnalyzer. A compiled lexicon can be
+written to a precompiled cache file, inherited by forked workers without
+being rebuilt, and swapped for a newer version at runtime: analysers created
+after a swap use the new lexicon, while analysers already running keep the
+one they started with.
+
+Author: Begoña Penón
+"""
+
+import gc
+import hashlib
+import json
+import os
+import pickle
+import threading
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from keyword_automaton import KeywordAutomaton
+
+
+DEFAULT_LEXICON_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'lexicon.json'
+)
+
+# Bump when the precompiled cache layout changes
+COMPILED_FORMAT_VERSION = 1
+
+
+class Lexicon:
+    """
+    Immutable, compiled term lists.
+
+    Term lists are tuples and `epr_keywords` is a read-only mapping, so one
+    instance can be shared by any number of analysers and threads. The keyword
+    automaton is compiled on construction.
+    """
+
+    __slots__ = ('version', 'epr_keywords', 'complexity_indicators', 'cultural_terms', 'key',
+                 'fingerprint', 'automaton')
+
+    def __init__(self, epr_keywords: Mapping[str, Iterable[str]], complexity_indicators: Iterable[str],
+                 cultural_terms: Iterable[str], version: int = 1, automaton: Optional[KeywordAutomaton] = None):
+        epr = {priority: tuple(terms) for priority, terms in epr_keywords.items()}
+        setter = super().__setattr__
+        setter('version', version)
+        setter('epr_keywords', MappingProxyType(epr))
+        setter('complexity_indicators', tuple(complexity_indicators))
+        setter('cultural_terms', tuple(cultural_terms))
+        # Same layout as the automaton cache key in ContentAnalyzer.keyword_automaton
+        setter('key', tuple(epr.items()) + (('complexity_indicators', self.complexity_indicators),
+                                            ('cultural_terms', self.cultural_terms)))
+        config = json.dumps(self.to_config(), sort_keys=True).encode('utf-8')
+        setter('fingerprint', hashlib.sha256(config).hexdigest())
+        setter('automaton', automaton if automaton is not None else KeywordAutomaton(dict(self.key)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Lexicon is immutable')
+
+    def __reduce__(self):
+        return (Lexicon, (dict(self.epr_keywords), self.complexity_indicators, self.cultural_terms,
+                          self.version, self.automaton))
+
+    def __repr__(self) -> str:
+        return f'Lexicon(version={self.version}, terms={len(self.automaton.terms)})'
+
+    def to_config(self) -> Dict:
+        """The data file representation (plain lists)."""
+        return {
+            'version': self.version,
+            'epr_keywords': {priority: list(terms) for priority, terms in self.epr_keywords.items()},
+            'complexity_indicators': list(self.complexity_indicators),
+            'cultural_terms': list(self.cultural_terms)
+        }
+
+    @classmethod
+    def from_config(cls, config: Mapping) -> 'Lexicon':
+        return cls(config['epr_keywords'], config['complexity_indicators'], config['cultural_terms'],
+                   config.get('version', 1))
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_LEXICON_PATH, compiled_path: Optional[str] = None) -> 'Lexicon':
+        """
+        Load a lexicon data file.
+
+        With `compiled_path`, a precompiled copy is reused when it was built from
+        the same file contents, and (re)written otherwise.
+        """
+        with open(path, 'rb') as handle:
+            source = handle.read()
+        source_hash = hashlib.sha256(source).hexdigest()
+
+        if compiled_path is not None:
+            lexicon = _read_compiled(compiled_path, source_hash)
+            if lexicon is not None:
+                return lexicon
+
+        lexicon = cls.from_config(json.loads(source.decode('utf-8')))
+        if compiled_path is not None:
+            _write_compiled(compiled_path, source_hash, lexicon)
+        return lexicon
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(self.to_config(), handle, indent=2)
+            handle.write('\n')
+
+
+def _read_compiled(path: str, source_hash: str) -> Optional[Lexicon]:
+    # The compiled cache is a local artefact written by _write_compiled; never point this at untrusted files
+    try:
+        with open(path, 'rb') as handle:
+            payload = pickle.load(handle)
+        if payload.get('format') != COMPILED_FORMAT_VERSION or payload.get('source') != source_hash:
+            return None
+        lexicon = payload['lexicon']
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, KeyError, TypeError):
+        return None
+    return lexicon if isinstance(lexicon, Lexicon) else None
+
+
+def _write_compiled(path: str, source_hash: str, lexicon: Lexicon):
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as handle:
+        pickle.dump({'format': COMPILED_FORMAT_VERSION, 'source': source_hash, 'lexicon': lexicon}, handle,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, path)
+
+
+_ACTIVE_LEXICON: Optional[Lexicon] = None
+_ACTIVE_SOURCE: Tuple[Optional[str], Optional[float]] = (None, None)
+_LOCK = threading.Lock()
+
+
+def active_lexicon() -> Lexicon:
+    """The process-wide lexicon, loaded from DEFAULT_LEXICON_PATH on first use."""
+    if _ACTIVE_LEXICON is None:
+        reload_lexicon()
+    return _ACTIVE_LEXICON
+
+
+def activate_lexicon(lexicon: Lexicon) -> Lexicon:
+    """Swap in `lexicon` for analysers created from now on; returns the previous one."""
+    global _ACTIVE_LEXICON
+    with _LOCK:
+        previous, _ACTIVE_LEXICON = _ACTIVE_LEXICON, lexicon
+    return previous
+
+
+def reload_lexicon(path: str = DEFAULT_LEXICON_PATH, compiled_path: Optional[str] = None,
+                   force: bool = False) -> bool:
+    """
+    Hot-swap the active lexicon from `path` if the file changed since it was loaded.
+
+    Cheap enough to call before every batch in long-lived workers: an unchanged
+    file costs one stat. Returns whether a new lexicon was activated.
+    """
+    global _ACTIVE_SOURCE
+    modified = os.stat(path).st_mtime
+    if not force and _ACTIVE_LEXICON is not None and _ACTIVE_SOURCE == (path, modified):
+        return False
+
+    lexicon = Lexicon.from_file(path, compiled_path)
+    with _LOCK:
+        changed = _ACTIVE_LEXICON is None or _ACTIVE_LEXICON.fingerprint != lexicon.fingerprint
+        _ACTIVE_SOURCE = (path, modified)
+    if changed:
+        activate_lexicon(lexicon)
+    return changed
+
+
+def preload_for_fork():
+    """
+    Load and compile the active lexicon in a parent process before forking workers.
+
+    Children then inherit it without rebuilding, and freezing the collector
+    keeps its pages shared copy-on-write instead of being touched by GC passes.
+    """
+    active_lexicon()
+    gc.freeze()
@@ -0,0 +1,193 @@
+"""
+Sustainability Communications Framework - Near-Duplicate Detection
+
+MinHash signatures with locality-sensitive hashing over word shingles, used
+to group near-identical regulatory paragraphs (the same obligation restated
+per country, packaging type or language variant) so that only one
+representative per group needs a full analysis.
+
+Shingles are hashed by rolling CRC-32 token hashes, so no shingle string is
+ever built. Signatures use one-permutation hashing: each shingle hash lands
+in one of `num_perm` bins, and empty bins are filled by rotation
+densification. That costs one multiply per shingle, rather than one hash per
+shingle and permutation, so a signature stays far cheaper than an analysis.
+
+Author: Begoña Penón
+"""
+
+import zlib
+from typing import Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from segmentation import TOKEN_PATTERN
+
+_MASK = (1 << 64) - 1
+_PRIME = 0x100000001B3         # rolls token hashes into a shingle hash
+_GOLDEN = 0x9E3779B97F4A7C15   # Fibonacci hashing: spreads shingle hashes into the high bits
+_EMPTY = -1
+
+
+def jaccard(first: Set, second: Set) -> float:
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+def estimated_jaccard(first: Sequence[int], second: Sequence[int]) -> float:
+    """Jaccard similarity estimated from two MinHash signatures."""
+    if not first:
+        return 0.0
+    return sum(a == b for a, b in zip(first, second)) / len(first)
+
+
+def lsh_parameters(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Bands and rows per band for the given similarity threshold.
+
+    Minimises the summed probability of missing pairs above the threshold and
+    of proposing pairs below it (the S-curve 1 - (1 - s^r)^b).
+    """
+    def probability(s, bands, rows):
+        return 1 - (1 - s ** rows) ** bands
+
+    def integral(f, low, high, steps=100):
+        width = (high - low) / steps
+        return sum(f(low + (i + 0.5) * width) for i in range(steps)) * width
+
+    best = None
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        false_positives = integral(lambda s: probability(s, bands, rows), 0.0, threshold)
+        false_negatives = integral(lambda s: 1 - probability(s, bands, rows), threshold, 1.0)
+        error = false_positives + false_negatives
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class MinHasher:
+    """One-permutation MinHash over word shingles (`num_perm` must be a power of two)."""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        if num_perm < 1 or num_perm & (num_perm - 1):
+            raise ValueError("num_perm must be a power of two")
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed & 0xFFFFFFFF
+        self._shift = 64 - (num_perm.bit_length() - 1)
+
+    def shingle_hashes(self, text: str) -> Set[int]:
+        """64-bit hashes of the lowercased word n-grams; shorter texts form a single shingle."""
+        crc, seed = zlib.crc32, self.seed
+        hashes = [crc(token.encode('utf-8'), seed) for token in TOKEN_PATTERN.findall(text.lower())]
+        if not hashes:
+            return set()
+
+        size = min(self.shingle_size, len(hashes))
+        rolled = hashes[:len(hashes) - size + 1]
+        for offset in range(1, size):
+            rolled = [(value * _PRIME + following) & _MASK for value, following in zip(rolled, hashes[offset:])]
+        return {(value * _GOLDEN) & _MASK for value in rolled}
+
+    def signature(self, shingle_hashes: Set[int]) -> Tuple[int, ...]:
+        """Signature of a shingle hash set; empty sets have an empty signature."""
+        if not shingle_hashes:
+            return ()
+        shift = self._shift
+        low = (1 << shift) - 1
+        values = [_EMPTY] * self.num_perm
+        for value in shingle_hashes:
+            # High bits pick the bin, the remaining bits are the value minimised within it
+            bin_index = value >> shift
+            value &= low
+            current = values[bin_index]
+            if current == _EMPTY or value < current:
+                values[bin_index] = value
+        if _EMPTY in values:
+            self._densify(values)
+        return tuple(values)
+
+    @staticmethod
+    def _densify(values: List[int]):
+        """Fill empty bins from the nearest non-empty bin to their right, offset by the distance."""
+        bins = len(values)
+        offset = 1 << 64  # larger than any bin value, so borrowed values never collide with real ones
+        original = list(values)
+        donor, distance = _EMPTY, 0
+        # Two passes right-to-left so bins near the end can borrow across the wrap-around
+        for step in range(2 * bins):
+            index = (bins - 1 - step) % bins
+            if original[index] != _EMPTY:
+                donor, distance = original[index], 0
+            else:
+                distance += 1
+                if donor != _EMPTY and values[index] == _EMPTY:
+                    values[index] = donor + distance * offset
+
+
+class NearDuplicateIndex:
+    """
+    LSH index of cluster representatives.
+
+    `assign` places each text in the cluster of the most similar
+    representative, provided its exact shingle Jaccard similarity reaches
+    `threshold`, or makes it a new representative. LSH only proposes candidates; every merge is
+    verified against the representative's shingle set, so it never merges
+    texts below the threshold.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, shingle_size, seed)
+        self.bands, self.rows = lsh_parameters(threshold, num_perm)
+        self._buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [{} for _ in range(self.bands)]
+        self._shingles: Dict[Hashable, Set[int]] = {}
+        self._exact: Dict[str, Hashable] = {}
+
+    def __len__(self) -> int:
+        return len(self._shingles)
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        rows = self.rows
+        return [signature[band * rows:(band + 1) * rows] for band in range(self.bands)]
+
+    def assign(self, key: Hashable, text: str) -> Tuple[Hashable, bool]:
+        """
+        (representative key, exact duplicate?) for `text`.
+
+        A text that matches no representative becomes one under `key`.
+        """
+        # Whitespace inside the text can change keyword matches, so only the ends are ignored
+        normalized = text.strip()
+        representative = self._exact.get(normalized)
+        if representative is not None:
+            return representative, True
+
+        shingle_set = self.hasher.shingle_hashes(text)
+        signature = self.hasher.signature(shingle_set)
+        band_keys = self._band_keys(signature) if signature else []
+
+        representative = self._best_candidate(shingle_set, band_keys)
+        if representative is not None:
+            return representative, False
+
+        self._shingles[key] = shingle_set
+        self._exact[normalized] = key
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets.setdefault(band_key, []).append(key)
+        return key, False
+
+    def _best_candidate(self, shingle_set: Set[int], band_keys: List[Tuple[int, ...]]) -> Optional[Hashable]:
+        candidates = {}
+        for buckets, band_key in zip(self._buckets, band_keys):
+            for candidate in buckets.get(band_key, ()):
+                candidates[candidate] = None
+
+        # The most similar verified candidate wins; ties go to the earliest representative
+        best, best_similarity = None, 0.0
+        for candidate in candidates:
+            similarity = jaccard(shingle_set, self._shingles[candidate])
+            if similarity >= self.threshold and (best is None or similarity > best_similarity):
+                best, best_similarity = candidate, similarity
+        return best
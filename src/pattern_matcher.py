@@ -0,0 +1,54 @@
+"""
+Sustainability Communications Framework - Pattern Matcher
+
+Single-pass extraction of action items and deadlines. Every pattern becomes a
+named alternative of one precompiled regular expression, so a document is
+scanned once and each match comes back typed and positioned, in document
+order, ready for highlighting in an editor.
+
+Author: Begoña Penón
+"""
+
+import re
+from typing import Dict, Iterator, List, Mapping, Sequence
+
+
+class PatternMatcher:
+    """
+    Precompiled alternation over typed extraction patterns.
+
+    `patterns` maps a match type (e.g. 'action_item') to its regexes. At any
+    position the first matching alternative wins, in mapping order, and
+    matches never overlap.
+    """
+
+    def __init__(self, patterns: Mapping[str, Sequence[str]], flags: int = re.IGNORECASE):
+        alternatives = []
+        names = {}
+        for match_type, regexes in patterns.items():
+            for index, regex in enumerate(regexes):
+                name = f'{match_type}_{index}'
+                names[name] = match_type
+                alternatives.append(f'(?P<{name}>{regex})')
+
+        self.types = list(patterns)
+        self.pattern = re.compile('|'.join(alternatives), flags) if alternatives else None
+        # Outer group number -> match type (patterns may contain groups of their own)
+        self._group_types = {self.pattern.groupindex[name]: match_type
+                             for name, match_type in names.items()} if self.pattern else {}
+
+    def finditer(self, text: str, pos: int = 0) -> Iterator[re.Match]:
+        if self.pattern is None:
+            return iter(())
+        return self.pattern.finditer(text, pos)
+
+    def match_type(self, match: re.Match) -> str:
+        return self._group_types[match.lastindex]
+
+    def scan(self, text: str) -> List[Dict]:
+        """Every match as {'type', 'text', 'start', 'end'}, in document order."""
+        group_types = self._group_types
+        return [
+            {'type': group_types[match.lastindex], 'text': match.group(), 'start': match.start(), 'end': match.end()}
+            for match in self.finditer(text)
+        ]
@@ -0,0 +1,199 @@
+"""
+Sustainability Communications Framework - Persona Matrix Scoring
+
+Scores a batch of drafts against many seller personas at once. Each persona
+(data/seller_personas.json) carries its own reading-level and legal-tolerance
+thresholds, generalising the fixed ones in _recommend_audience_segment and
+_assess_adaptation_priority. Drafts are reduced to their feature vector once,
+as a ReadabilityTable, and every threshold is applied by broadcasting an
+N x 1 feature column against a 1 x M threshold row, so N drafts x M personas
+cost no per-pair Python calls.
+
+Persona files load without NumPy; scoring requires it.
+
+Author: Begoña Penón
+"""
+
+import json
+import math
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from readability_table import ADAPTATION_PRIORITIES, ReadabilityTable
+
+
+DEFAULT_PERSONAS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'seller_personas.json'
+)
+
+# Adaptation rule levels, in the order they are tested (codes into ADAPTATION_PRIORITIES)
+ADAPTATION_LEVELS = ('high', 'medium')
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Persona matrix scoring requires numpy (pip install numpy)")
+
+
+@dataclass(frozen=True)
+class SellerPersona:
+    """
+    One seller segment and its thresholds.
+
+    A draft fits the persona when its Flesch score is at least
+    `min_reading_ease` and its legal complexity ratio is below
+    `max_legal_ratio`. Adaptation priority is HIGH when any `high_*`
+    threshold is crossed, else MEDIUM when any `medium_*` one is, else LOW.
+    A missing (null) threshold never triggers.
+    """
+
+    persona_id: str
+    name: str
+    description: str = ''
+    min_reading_ease: float = -math.inf
+    max_legal_ratio: float = math.inf
+    high_reading_ease_below: float = -math.inf
+    high_legal_ratio_above: float = math.inf
+    high_epr_density_above: float = math.inf
+    medium_reading_ease_below: float = -math.inf
+    medium_legal_ratio_above: float = math.inf
+    medium_epr_density_above: float = math.inf
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SellerPersona':
+        """Build a persona from its data file entry."""
+        def threshold(value, default):
+            return default if value is None else float(value)
+
+        fields = {
+            'persona_id': data['id'],
+            'name': data.get('name', data['id']),
+            'description': data.get('description', ''),
+            'min_reading_ease': threshold(data.get('min_reading_ease'), -math.inf),
+            'max_legal_ratio': threshold(data.get('max_legal_ratio'), math.inf)
+        }
+        adaptation = data.get('adaptation', {})
+        for level in ADAPTATION_LEVELS:
+            rule = adaptation.get(level, {})
+            fields[f'{level}_reading_ease_below'] = threshold(rule.get('reading_ease_below'), -math.inf)
+            fields[f'{level}_legal_ratio_above'] = threshold(rule.get('legal_ratio_above'), math.inf)
+            fields[f'{level}_epr_density_above'] = threshold(rule.get('epr_density_above'), math.inf)
+        return cls(**fields)
+
+    def to_dict(self) -> Dict:
+        """The data file representation (unbounded thresholds become null)."""
+        def threshold(value):
+            return None if math.isinf(value) else value
+
+        return {
+            'id': self.persona_id,
+            'name': self.name,
+            'description': self.description,
+            'min_reading_ease': threshold(self.min_reading_ease),
+            'max_legal_ratio': threshold(self.max_legal_ratio),
+            'adaptation': {
+                level: {
+                    'reading_ease_below': threshold(getattr(self, f'{level}_reading_ease_below')),
+                    'legal_ratio_above': threshold(getattr(self, f'{level}_legal_ratio_above')),
+                    'epr_density_above': threshold(getattr(self, f'{level}_epr_density_above'))
+                }
+                for level in ADAPTATION_LEVELS
+            }
+        }
+
+
+def load_personas(path: str = DEFAULT_PERSONAS_PATH) -> List[SellerPersona]:
+    with open(path, encoding='utf-8') as handle:
+        data = json.load(handle)
+    return [SellerPersona.from_dict(entry) for entry in data['personas']]
+
+
+class PersonaScores:
+    """
+    Draft x persona results.
+
+    `fit` (bool), `reading_gap` (Flesch points a draft must gain to reach the
+    persona's level, 0 when it already does) and `adaptation_priority`
+    (int8 codes into ADAPTATION_PRIORITIES) all have shape (drafts, personas).
+    """
+
+    def __init__(self, persona_ids: Sequence[str], fit: 'np.ndarray', reading_gap: 'np.ndarray',
+                 adaptation_priority: 'np.ndarray'):
+        self.persona_ids = list(persona_ids)
+        self.fit = fit
+        self.reading_gap = reading_gap
+        self.adaptation_priority = adaptation_priority
+
+    @property
+    def shape(self):
+        return self.fit.shape
+
+    def fitting_personas(self, index: int) -> List[str]:
+        """Ids of the personas draft `index` fits without adaptation."""
+        return [self.persona_ids[column] for column in np.flatnonzero(self.fit[index]).tolist()]
+
+    def row(self, index: int) -> Dict[str, Dict]:
+        """Draft `index` scored against every persona, keyed by persona id."""
+        fit = self.fit[index].tolist()
+        gap = self.reading_gap[index].tolist()
+        priority = self.adaptation_priority[index].tolist()
+        return {
+            persona_id: {
+                'fit': fit[column],
+                'reading_gap': round(gap[column], 2),
+                'adaptation_priority': ADAPTATION_PRIORITIES[priority[column]]
+            }
+            for column, persona_id in enumerate(self.persona_ids)
+        }
+
+
+class PersonaMatrix:
+    """Persona thresholds as one NumPy row per threshold, for broadcasting against a batch of drafts."""
+
+    def __init__(self, personas: Sequence[SellerPersona]):
+        _require_numpy()
+        self.personas = tuple(personas)
+        self.persona_ids = [persona.persona_id for persona in self.personas]
+
+        def row(name):
+            return np.array([getattr(persona, name) for persona in self.personas], dtype=np.float64)[np.newaxis, :]
+
+        self._min_reading_ease = row('min_reading_ease')
+        self._max_legal_ratio = row('max_legal_ratio')
+        self._rules = [
+            (row(f'{level}_reading_ease_below'), row(f'{level}_legal_ratio_above'), row(f'{level}_epr_density_above'))
+            for level in ADAPTATION_LEVELS
+        ]
+
+    def __len__(self) -> int:
+        return len(self.personas)
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_PERSONAS_PATH) -> 'PersonaMatrix':
+        return cls(load_personas(path))
+
+    def score(self, table: ReadabilityTable) -> PersonaScores:
+        """Score every draft in `table` against every persona."""
+        flesch = np.asarray(table['flesch_reading_ease'], dtype=np.float64)[:, np.newaxis]
+        legal_ratio = np.asarray(table['legal_complexity_ratio'], dtype=np.float64)[:, np.newaxis]
+        # Total of the rounded per-category densities, as in _assess_adaptation_priority
+        density = np.zeros(len(table))
+        for category in table.epr_categories:
+            density += table[f'density_{category}']
+        density = density[:, np.newaxis]
+
+        fit = (flesch >= self._min_reading_ease) & (legal_ratio < self._max_legal_ratio)
+        reading_gap = np.maximum(self._min_reading_ease - flesch, 0.0)
+
+        triggered = [
+            (flesch < reading_ease_below) | (legal_ratio > legal_ratio_above) | (density > epr_density_above)
+            for reading_ease_below, legal_ratio_above, epr_density_above in self._rules
+        ]
+        adaptation_priority = np.select(triggered, list(range(len(triggered))), default=len(triggered))
+        return PersonaScores(self.persona_ids, fit, reading_gap, adaptation_priority.astype(np.int8))
@@ -0,0 +1,192 @@
+"""
+Sustainability Communications Framework - Phrase Extractor
+
+Key-phrase extraction over token streams. N-grams are counted as tuples of
+integer token IDs rather than joined strings, only the top phrases are ever
+turned back into text, and a bounded-memory space-saving counter ranks
+phrases across corpora too large to count exactly.
+
+Author: Begoña Penón
+"""
+
+import heapq
+import itertools
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Function words that never make a key phrase on their own
+DEFAULT_STOPWORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in',
+    'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'their', 'this', 'to', 'was',
+    'were', 'which', 'will', 'with'
+])
+
+
+class PhraseExtractor:
+    """
+    N-gram phrase counting with a configurable n range.
+
+    Phrases are ranked by frequency; ties go to shorter n-grams, then to the
+    earliest occurrence. With `skip_stopword_only`, n-grams made entirely of
+    stopwords are dropped.
+    """
+
+    def __init__(self, ngram_range: Tuple[int, int] = (3, 3), skip_stopword_only: bool = False,
+                 stopwords: Iterable[str] = DEFAULT_STOPWORDS):
+        min_n, max_n = ngram_range
+        if not 1 <= min_n <= max_n:
+            raise ValueError(f"Invalid ngram_range {ngram_range!r}")
+        self.ngram_range = (min_n, max_n)
+        self.skip_stopword_only = skip_stopword_only
+        self.stopwords = frozenset(stopwords)
+
+    def config(self) -> Dict:
+        """Settings that change extraction results (part of the analyser fingerprint)."""
+        return {
+            'ngram_range': list(self.ngram_range),
+            'skip_stopword_only': self.skip_stopword_only,
+            'stopwords': sorted(self.stopwords) if self.skip_stopword_only else []
+        }
+
+    def encode(self, tokens: Sequence[str], vocabulary: Optional[Dict[str, int]] = None) -> Tuple[List[int], Dict[str, int]]:
+        """Map tokens to integer IDs, extending (or creating) a vocabulary."""
+        if vocabulary is None:
+            vocabulary = {}
+        setdefault = vocabulary.setdefault
+        ids = [setdefault(token, len(vocabulary)) for token in tokens]
+        return ids, vocabulary
+
+    def count_ids(self, ids: Sequence[int], vocabulary: Dict[str, int]) -> Counter:
+        """Exact counts of every n-gram (as an ID tuple) in one document."""
+        counts: Counter = Counter()
+        min_n, max_n = self.ngram_range
+        for n in range(min_n, max_n + 1):
+            counts.update(zip(*(itertools.islice(ids, i, None) for i in range(n))))
+
+        if self.skip_stopword_only and counts:
+            stop_ids = {vocabulary[word] for word in self.stopwords if word in vocabulary}
+            for gram in [gram for gram in counts if all(i in stop_ids for i in gram)]:
+                del counts[gram]
+        return counts
+
+    def top_phrases(self, tokens: Sequence[str], top_n: int) -> List[Dict]:
+        """Most frequent phrases in a token sequence, as {'phrase', 'frequency'} dicts."""
+        ids, vocabulary = self.encode(tokens)
+        counts = self.count_ids(ids, vocabulary)
+        return self.decode_ranked(counts.most_common(top_n), vocabulary)
+
+    def positioned_counts(self, tokens: Sequence[str]) -> Dict[str, List[int]]:
+        """Phrase -> [count, n, first token position]; used to merge counts across segments."""
+        ids, vocabulary = self.encode(tokens)
+        counts = self.count_ids(ids, vocabulary)
+        words = _inverse(vocabulary)
+
+        first: Dict[Tuple[int, ...], int] = {}
+        min_n, max_n = self.ngram_range
+        for n in range(min_n, max_n + 1):
+            for position, gram in enumerate(zip(*(itertools.islice(ids, i, None) for i in range(n)))):
+                if gram in counts and gram not in first:
+                    first[gram] = position
+
+        return {' '.join(words[i] for i in gram): [count, len(gram), first[gram]] for gram, count in counts.items()}
+
+    def is_kept(self, phrase_tokens: Sequence[str]) -> bool:
+        """Whether an n-gram survives the stopword filter."""
+        return not (self.skip_stopword_only and all(token in self.stopwords for token in phrase_tokens))
+
+    @staticmethod
+    def decode_ranked(ranked: Iterable[Tuple[Tuple[int, ...], int]], vocabulary: Dict[str, int]) -> List[Dict]:
+        words = _inverse(vocabulary)
+        return [{'phrase': ' '.join(words[i] for i in gram), 'frequency': count} for gram, count in ranked]
+
+
+class SpaceSavingCounter:
+    """
+    Space-saving heavy-hitters counter (Metwally et al.) with fixed capacity.
+
+    Tracks at most `capacity` items. Any item whose true count exceeds
+    total / capacity is guaranteed to be tracked, and each reported count
+    overestimates the true count by at most its recorded error.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict = {}
+        self._errors: Dict = {}
+        self._heap: List = []
+        self._sequence = itertools.count()
+
+    def update(self, item, weight: int = 1):
+        self.total += weight
+        counts = self._counts
+        if item in counts:
+            counts[item] += weight
+        elif len(counts) < self.capacity:
+            counts[item] = weight
+            self._errors[item] = 0
+        else:
+            # Replace the current minimum; the newcomer inherits its count as error
+            floor, evicted = self._pop_min()
+            del counts[evicted], self._errors[evicted]
+            counts[item] = floor + weight
+            self._errors[item] = floor
+        heapq.heappush(self._heap, (counts[item], next(self._sequence), item))
+
+        # Lazy heap entries accumulate with every update; rebuild before they dominate memory
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, next(self._sequence), key) for key, count in counts.items()]
+            heapq.heapify(self._heap)
+
+    def top(self, n: int) -> List[Tuple[object, int, int]]:
+        """(item, estimated count, max overestimate) for the n highest-ranked items."""
+        ranked = heapq.nlargest(n, self._counts.items(), key=lambda entry: entry[1])
+        return [(item, count, self._errors[item]) for item, count in ranked]
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _pop_min(self):
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            if self._counts.get(item) == count:
+                return count, item
+
+
+class CorpusPhraseRanker:
+    """
+    Corpus-wide approximate phrase ranking in bounded memory.
+
+    Each document's n-grams are counted exactly, then folded into a
+    space-saving summary keyed by token-ID tuples over a shared vocabulary.
+    """
+
+    def __init__(self, extractor: Optional[PhraseExtractor] = None, capacity: int = 10000):
+        self.extractor = extractor or PhraseExtractor()
+        self.summary = SpaceSavingCounter(capacity)
+        self.vocabulary: Dict[str, int] = {}
+        self.documents = 0
+
+    def add_tokens(self, tokens: Sequence[str]):
+        ids, _ = self.extractor.encode(tokens, self.vocabulary)
+        for gram, count in self.extractor.count_ids(ids, self.vocabulary).items():
+            self.summary.update(gram, count)
+        self.documents += 1
+
+    def top_phrases(self, top_n: int) -> List[Dict]:
+        """Top phrases with estimated frequency and the maximum overestimate."""
+        words = _inverse(self.vocabulary)
+        return [
+            {'phrase': ' '.join(words[i] for i in gram), 'frequency': count, 'max_error': error}
+            for gram, count, error in self.summary.top(top_n)
+        ]
+
+
+def _inverse(vocabulary: Dict[str, int]) -> List[str]:
+    words = [''] * len(vocabulary)
+    for word, index in vocabulary.items():
+        words[index] = word
+    return words
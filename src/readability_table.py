@@ -0,0 +1,198 @@
+"""
+Sustainability Communications Framework - Columnar Readability Results
+
+Batch readability results as one NumPy array per metric instead of one dict
+per document. Derived scores and the readability / adaptation bucketing are
+computed vectorised over the whole batch, categorical fields are stored as
+small integer codes, and tables are saved as plain `.npy` files that load
+memory-mapped for fast downstream slicing.
+
+NumPy is an optional dependency: this module imports without it, and only
+building or loading a table requires it.
+
+Author: Begoña Penón
+"""
+
+import json
+import os
+from typing import Dict, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from complexity_stats import ComplexityStats
+
+
+# Category labels, indexed by code, in the order the scalar rules test them
+READABILITY_LEVELS = (
+    "Very Easy (5th grade level)",
+    "Easy (6th grade level)",
+    "Fairly Easy (7th grade level)",
+    "Standard (8th-9th grade level)",
+    "Fairly Difficult (10th-12th grade level)",
+    "Difficult (College level)",
+    "Very Difficult (Graduate level)"
+)
+
+ADAPTATION_PRIORITIES = (
+    "HIGH - Requires significant simplification",
+    "MEDIUM - Moderate adaptation needed",
+    "LOW - Minor adjustments sufficient"
+)
+
+RECOMMENDED_AUDIENCES = (
+    "All seller segments",
+    "Experienced sellers and enterprise accounts",
+    "Legal/compliance teams and enterprise sellers only"
+)
+
+CATEGORICAL_LABELS = {
+    'readability_level': READABILITY_LEVELS,
+    'adaptation_priority': ADAPTATION_PRIORITIES,
+    'recommended_audience': RECOMMENDED_AUDIENCES
+}
+
+COUNT_COLUMNS = ('total_words', 'total_sentences', 'syllables', 'legal_terms')
+
+METADATA_FILE = 'table.json'
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Columnar readability results require numpy (pip install numpy)")
+
+
+class ReadabilityTable:
+    """
+    Column-oriented complexity analysis of a batch of documents.
+
+    `columns` maps a column name to a 1-D array with one entry per document.
+    EPR densities are stored as `density_<category>` columns and categorical
+    fields as int8 codes into CATEGORICAL_LABELS.
+    """
+
+    def __init__(self, columns: Dict[str, 'np.ndarray'], epr_categories: Sequence[str]):
+        _require_numpy()
+        self.columns = columns
+        self.epr_categories = list(epr_categories)
+
+    def __len__(self) -> int:
+        return len(self.columns['total_words'])
+
+    def __getitem__(self, name: str) -> 'np.ndarray':
+        return self.columns[name]
+
+    @classmethod
+    def from_stats(cls, stats: Sequence[ComplexityStats], epr_categories: Sequence[str]) -> 'ReadabilityTable':
+        """Build the table from per-document counts, deriving every score vectorised."""
+        _require_numpy()
+        columns = {
+            name: np.fromiter((getattr(item, name) for item in stats), dtype=np.int64, count=len(stats))
+            for name in COUNT_COLUMNS
+        }
+        epr_counts = {
+            category: np.fromiter((item.epr_term_counts.get(category, 0) for item in stats),
+                                  dtype=np.int64, count=len(stats))
+            for category in epr_categories
+        }
+        columns.update(_derive(columns, epr_counts))
+        return cls(columns, epr_categories)
+
+    def labels(self, name: str) -> List[str]:
+        """Decoded values of a categorical column."""
+        labels = CATEGORICAL_LABELS[name]
+        return [labels[code] for code in self.columns[name].tolist()]
+
+    def row(self, index: int) -> Dict:
+        """One document's results in the analyze_text_complexity layout."""
+        columns = self.columns
+
+        def value(name):
+            return columns[name][index].item()
+
+        return {
+            'total_words': value('total_words'),
+            'total_sentences': value('total_sentences'),
+            'avg_words_per_sentence': round(value('avg_words_per_sentence'), 2),
+            'avg_syllables_per_word': round(value('avg_syllables_per_word'), 2),
+            'flesch_reading_ease': round(value('flesch_reading_ease'), 2),
+            'readability_level': READABILITY_LEVELS[value('readability_level')],
+            'legal_complexity_ratio': round(value('legal_complexity_ratio'), 4),
+            'epr_terminology_density': {
+                category: value(f'density_{category}') for category in self.epr_categories
+            },
+            'recommended_audience': RECOMMENDED_AUDIENCES[value('recommended_audience')],
+            'adaptation_priority': ADAPTATION_PRIORITIES[value('adaptation_priority')]
+        }
+
+    def save(self, directory: str):
+        """Write one `.npy` file per column plus a small JSON descriptor."""
+        os.makedirs(directory, exist_ok=True)
+        for name, column in self.columns.items():
+            np.save(os.path.join(directory, f'{name}.npy'), column)
+        with open(os.path.join(directory, METADATA_FILE), 'w', encoding='utf-8') as handle:
+            json.dump({
+                'version': 1,
+                'columns': list(self.columns),
+                'epr_categories': self.epr_categories,
+                'categorical_labels': CATEGORICAL_LABELS
+            }, handle, indent=2)
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: str = 'r') -> 'ReadabilityTable':
+        """Open a saved table; columns are memory-mapped unless `mmap_mode` is None."""
+        _require_numpy()
+        with open(os.path.join(directory, METADATA_FILE), encoding='utf-8') as handle:
+            metadata = json.load(handle)
+        columns = {
+            name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mmap_mode)
+            for name in metadata['columns']
+        }
+        return cls(columns, metadata['epr_categories'])
+
+
+def _derive(counts: Dict[str, 'np.ndarray'], epr_counts: Dict[str, 'np.ndarray']) -> Dict[str, 'np.ndarray']:
+    """Vectorised complexity_report: ratios, Flesch score, densities and bucket codes."""
+    words = counts['total_words'].astype(np.float64)
+    sentences = counts['total_sentences'].astype(np.float64)
+    has_words = words > 0
+
+    avg_words_per_sentence = np.divide(words, sentences, out=np.zeros_like(words), where=sentences > 0)
+    avg_syllables_per_word = np.divide(counts['syllables'], words, out=np.zeros_like(words), where=has_words)
+    flesch = 206.835 - (1.015 * avg_words_per_sentence) - (84.6 * avg_syllables_per_word)
+    legal_ratio = np.divide(counts['legal_terms'], words, out=np.zeros_like(words), where=has_words)
+
+    derived = {
+        'avg_words_per_sentence': avg_words_per_sentence,
+        'avg_syllables_per_word': avg_syllables_per_word,
+        'flesch_reading_ease': flesch,
+        'legal_complexity_ratio': legal_ratio
+    }
+
+    total_density = np.zeros_like(words)
+    for category, count in epr_counts.items():
+        density = np.round(np.divide(count, words, out=np.zeros_like(words), where=has_words) * 100, 2)
+        derived[f'density_{category}'] = density
+        total_density += density
+
+    # Same thresholds as _interpret_flesch_score, tested in the same order
+    derived['readability_level'] = np.select(
+        [flesch >= 90, flesch >= 80, flesch >= 70, flesch >= 60, flesch >= 50, flesch >= 30],
+        [0, 1, 2, 3, 4, 5], default=6
+    ).astype(np.int8)
+
+    # _recommend_audience_segment
+    derived['recommended_audience'] = np.select(
+        [(flesch >= 60) & (legal_ratio < 0.02), (flesch >= 50) & (legal_ratio < 0.05)],
+        [0, 1], default=2
+    ).astype(np.int8)
+
+    # _assess_adaptation_priority
+    derived['adaptation_priority'] = np.select(
+        [(flesch < 50) | (legal_ratio > 0.05) | (total_density > 5),
+         (flesch < 60) | (legal_ratio > 0.02) | (total_density > 3)],
+        [0, 1], default=2
+    ).astype(np.int8)
+    return derived
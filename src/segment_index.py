@@ -0,0 +1,287 @@
+"""
+Sustainability Communications Framework - Segment Index
+
+Queryable store built from analysis output, so questions like "segments
+mentioning 'reporting deadlines' with Flesch < 40 and a deadline before June"
+are answered without re-analysing the corpus. It holds term and category
+posting lists with character offsets, and sorted numeric indexes on the
+complexity metrics and deadline dates. Segments can be added and removed
+incrementally.
+
+Author: Begoña Penón
+"""
+
+import calendar
+import re
+from bisect import bisect_left, insort
+from datetime import date
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+from keyword_automaton import KeywordHits
+
+
+# Complexity metrics kept in sorted numeric indexes
+INDEXED_METRICS = (
+    'total_words', 'total_sentences', 'avg_words_per_sentence', 'flesch_reading_ease', 'legal_complexity_ratio'
+)
+
+# Deadline dates are indexed as ordinals under these names
+DEADLINE_METRICS = ('earliest_deadline', 'latest_deadline')
+
+# Pending sorted entries are merged into the main run once they reach this size
+MERGE_THRESHOLD = 4096
+
+MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+MONTHS.update({name.lower(): number for number, name in enumerate(calendar.month_abbr) if name})
+
+_NUMERIC_DATE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+_DAY_MONTH_YEAR = re.compile(r'(\d{1,2})\s+([A-Za-z]+)\.?\s+(\d{4})')
+_MONTH_DAY = re.compile(r'([A-Za-z]+)\.?\s+(\d{1,2})\b')
+
+
+def parse_deadline(text: str, default_year: int) -> Optional[date]:
+    """
+    Date of an extracted deadline phrase, or None if it names no valid date.
+
+    Handles the deadline pattern shapes: '15/03/2026' (day first, as in EU
+    regulations), '1 June 2026', and 'by March 15' / 'before June 30', which
+    fall in `default_year`.
+    """
+    try:
+        match = _NUMERIC_DATE.search(text)
+        if match:
+            day, month, year = map(int, match.groups())
+            if month > 12:
+                day, month = month, day
+            return date(year, month, day)
+
+        match = _DAY_MONTH_YEAR.search(text)
+        if match and match.group(2).lower() in MONTHS:
+            return date(int(match.group(3)), MONTHS[match.group(2).lower()], int(match.group(1)))
+
+        match = _MONTH_DAY.search(text)
+        if match and match.group(1).lower() in MONTHS:
+            return date(default_year, MONTHS[match.group(1).lower()], int(match.group(2)))
+    except ValueError:
+        pass
+    return None
+
+
+class SortedIndex:
+    """
+    (value, doc) pairs kept sorted for range lookups.
+
+    New entries go to a small pending run that is merged into the main run
+    once it outgrows MERGE_THRESHOLD (or a sixteenth of the main run), so adds
+    stay cheap on large indexes. Removed documents are left in place and
+    filtered by the caller, then dropped by `compact`.
+    """
+
+    def __init__(self):
+        self._main: List[Tuple[float, int]] = []
+        self._pending: List[Tuple[float, int]] = []
+        self._limit = MERGE_THRESHOLD
+
+    def __len__(self) -> int:
+        return len(self._main) + len(self._pending)
+
+    def add(self, value: float, doc: int):
+        insort(self._pending, (value, doc))
+        if len(self._pending) >= self._limit:
+            self._merge()
+
+    def _merge(self):
+        # Timsort merges the two sorted runs in linear time
+        self._main = sorted(self._main + self._pending)
+        self._pending = []
+        # The pending run may grow with the index, keeping merges amortised O(log n) per add
+        self._limit = max(MERGE_THRESHOLD, len(self._main) >> 4)
+
+    def compact(self, alive: Mapping[int, object]):
+        self._main = [entry for entry in sorted(self._main + self._pending) if entry[1] in alive]
+        self._pending = []
+        self._limit = max(MERGE_THRESHOLD, len(self._main) >> 4)
+
+    def _bounds(self, run: List[Tuple[float, int]], low: Optional[float], high: Optional[float]) -> Tuple[int, int]:
+        start = 0 if low is None else bisect_left(run, (low,))
+        end = len(run) if high is None else bisect_left(run, (high,))
+        return start, max(start, end)
+
+    def count(self, low: Optional[float], high: Optional[float]) -> int:
+        """Entries with low <= value < high (including not yet compacted removals)."""
+        total = 0
+        for run in (self._main, self._pending):
+            start, end = self._bounds(run, low, high)
+            total += end - start
+        return total
+
+    def docs(self, low: Optional[float], high: Optional[float]) -> Set[int]:
+        docs = set()
+        for run in (self._main, self._pending):
+            start, end = self._bounds(run, low, high)
+            docs.update(doc for _, doc in run[start:end])
+        return docs
+
+
+class SegmentIndex:
+    """
+    Inverted index over analysed segments.
+
+    Terms map to posting lists of {doc: [offsets]} and categories to the docs
+    containing any of their terms. Each metric in INDEXED_METRICS, plus the
+    earliest and latest deadline, has a SortedIndex for range filters.
+    Segment ids can be any hashable; results come back in insertion order.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, List[int]]] = {}
+        self.category_postings: Dict[str, Set[int]] = {}
+        self.sorted_indexes: Dict[str, SortedIndex] = {}
+        self.values: Dict[str, Dict[int, float]] = {}
+        self._docs: Dict[int, Hashable] = {}
+        self._doc_ids: Dict[Hashable, int] = {}
+        self._doc_terms: Dict[int, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+        self._next_doc = 0
+        self._removed = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, segment_id: Hashable) -> bool:
+        return segment_id in self._doc_ids
+
+    def add(self, segment_id: Hashable, hits: KeywordHits, metrics: Mapping[str, float],
+            deadlines: Iterable[date] = ()):
+        """Index one analysed segment, replacing any previous entry with the same id."""
+        if segment_id in self._doc_ids:
+            self.remove(segment_id)
+
+        doc = self._next_doc
+        self._next_doc += 1
+        self._docs[doc] = segment_id
+        self._doc_ids[segment_id] = doc
+
+        categories = set()
+        for term, offsets in hits.offsets.items():
+            self.postings.setdefault(term, {})[doc] = list(offsets)
+            categories.update(hits.categories[term])
+        for category in categories:
+            self.category_postings.setdefault(category, set()).add(doc)
+        self._doc_terms[doc] = (tuple(hits.offsets), tuple(categories))
+
+        values = {name: metrics[name] for name in INDEXED_METRICS if name in metrics}
+        deadlines = [deadline.toordinal() for deadline in deadlines]
+        if deadlines:
+            values['earliest_deadline'] = min(deadlines)
+            values['latest_deadline'] = max(deadlines)
+        for name, value in values.items():
+            self.values.setdefault(name, {})[doc] = value
+            self.sorted_indexes.setdefault(name, SortedIndex()).add(value, doc)
+
+    def remove(self, segment_id: Hashable):
+        """Drop a segment; its sorted index entries are purged lazily."""
+        doc = self._doc_ids.pop(segment_id)
+        del self._docs[doc]
+        terms, categories = self._doc_terms.pop(doc)
+        for term in terms:
+            postings = self.postings[term]
+            del postings[doc]
+            if not postings:
+                del self.postings[term]
+        for category in categories:
+            self.category_postings[category].discard(doc)
+        for values in self.values.values():
+            values.pop(doc, None)
+
+        self._removed += 1
+        if self._removed > max(MERGE_THRESHOLD, len(self._docs) // 4):
+            for index in self.sorted_indexes.values():
+                index.compact(self._docs)
+            self._removed = 0
+
+    def offsets(self, term: str) -> Dict[Hashable, List[int]]:
+        """Character offsets of `term` in every segment that mentions it."""
+        docs = self._docs
+        return {docs[doc]: offsets for doc, offsets in self.postings.get(term.lower(), {}).items()}
+
+    def search(self, all_terms: Iterable[str] = (), any_terms: Iterable[str] = (), not_terms: Iterable[str] = (),
+               categories: Iterable[str] = (), ranges: Optional[Mapping[str, Tuple]] = None,
+               deadline_before: Optional[date] = None, deadline_after: Optional[date] = None) -> List[Hashable]:
+        """
+        Ids of segments matching every given condition.
+
+        - all_terms: mentions each term; any_terms: mentions at least one
+        - not_terms: mentions none of them
+        - categories: mentions a term of each category (e.g. 'high_priority')
+        - ranges: {metric: (low, high)} keeps low <= value < high; None leaves a side open
+        - deadline_before / deadline_after: has a deadline earlier / later than the date
+        """
+        ranges = _range_filters(ranges, deadline_before, deadline_after)
+        candidates = self._term_candidates(all_terms, any_terms, categories)
+        if candidates is not None and not candidates:
+            return []
+        candidates = self._range_candidates(candidates, ranges)
+
+        if candidates is None:
+            candidates = set(self._docs)
+        for term in not_terms:
+            candidates.difference_update(self.postings.get(term.lower(), ()))
+
+        docs = self._docs
+        return [docs[doc] for doc in sorted(candidates) if doc in docs]
+
+    def _term_candidates(self, all_terms: Iterable[str], any_terms: Iterable[str],
+                         categories: Iterable[str]) -> Optional[Set[int]]:
+        """Docs passing the term and category filters; None when there are none."""
+        # Posting sets, smallest first, so intersections shrink as early as possible
+        required = [set(self.postings.get(term.lower(), ())) for term in all_terms]
+        required += [self.category_postings.get(category, set()) for category in categories]
+        any_terms = list(any_terms)
+        if any_terms:
+            required.append(set().union(*(self.postings.get(term.lower(), ()) for term in any_terms)))
+        required.sort(key=len)
+
+        candidates: Optional[Set[int]] = None
+        for docs in required:
+            candidates = set(docs) if candidates is None else candidates & docs
+            if not candidates:
+                return set()
+        return candidates
+
+    def _range_candidates(self, candidates: Optional[Set[int]], ranges: Mapping[str, Tuple]) -> Optional[Set[int]]:
+        """Narrow `candidates` (None meaning every doc) by the range filters."""
+        # Check candidate values directly when cheaper than slicing the sorted index
+        for name, (low, high) in sorted(ranges.items(), key=lambda item: self._range_size(item[0], *item[1])):
+            values = self.values.get(name, {})
+            if candidates is not None and len(candidates) <= self._range_size(name, low, high):
+                candidates = {doc for doc in candidates if doc in values and _within(values[doc], low, high)}
+            else:
+                index = self.sorted_indexes.get(name)
+                docs = index.docs(low, high) if index is not None else set()
+                candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return set()
+        return candidates
+
+    def _range_size(self, name: str, low, high) -> int:
+        index = self.sorted_indexes.get(name)
+        return index.count(low, high) if index is not None else 0
+
+
+def _range_filters(ranges: Optional[Mapping[str, Tuple]], deadline_before: Optional[date],
+                   deadline_after: Optional[date]) -> Dict[str, Tuple]:
+    """Validated {metric: (low, high)} filters, with the deadline bounds folded in."""
+    ranges = dict(ranges or {})
+    unknown = sorted(set(ranges) - set(INDEXED_METRICS + DEADLINE_METRICS))
+    if unknown:
+        raise ValueError(f"Unknown range metric(s) {', '.join(unknown)}; "
+                         f"expected one of {', '.join(INDEXED_METRICS + DEADLINE_METRICS)}")
+    if deadline_before is not None:
+        ranges['earliest_deadline'] = (None, deadline_before.toordinal())
+    if deadline_after is not None:
+        ranges['latest_deadline'] = (deadline_after.toordinal() + 1, None)
+    return ranges
+
+
+def _within(value: float, low: Optional[float], high: Optional[float]) -> bool:
+    return (low is None or value >= low) and (high is None or value < high)
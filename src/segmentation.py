@@ -0,0 +1,162 @@
+"""
+Sustainability Communications Framework - Segmentation
+
+Single sentence and token segmentation engine shared by every analysis. A
+text is segmented into flat arrays of (start, end) offsets over the original
+buffer; no substring is sliced until a caller asks for the text. Sentence
+offsets are found up front, token offsets only when first asked for, since
+counting tokens and listing their strings need no offsets.
+
+A token is a run of word characters, optionally joined by '.', ',', '-',
+'/' or an apostrophe followed by more word characters, so '€50,000' yields
+'50,000', '3.5' and 'take-back' stay whole and '(EPR)' yields 'EPR'.
+
+A run of '.', '!' or '?' ends a sentence unless it is followed directly by
+a letter or digit (decimals, 'e.g' inside a token) or is a single period
+after a known abbreviation ('Art. 5', 'para. 2'). Both decisions only look at
+the text up to the next character, so segmenting parts split on whitespace
+agrees with segmenting the whole document.
+
+Author: Begoña Penón
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from itertools import chain
+from typing import Iterator, List, Optional, Tuple
+
+
+TOKEN_PATTERN = re.compile(r"\w+(?:[.,'’\-/]\w+)*")
+TERMINATOR_PATTERN = re.compile(r'[.!?]+')
+
+# Lowercased abbreviations whose trailing period never ends a sentence.
+# Words that often end sentences ('etc', 'no') are left out.
+ABBREVIATIONS = frozenset({
+    'art', 'arts', 'nr', 'para', 'paras', 'sec', 'ch', 'vol', 'p', 'pp', 'fig', 'ref', 'reg',
+    'dir', 'ann', 'cf', 'vs', 'approx', 'incl', 'excl', 'e.g', 'i.e', 'u.s', 'u.k', 'dept',
+    'inc', 'ltd', 'co', 'corp', 'gmbh', 'mr', 'mrs', 'ms', 'dr', 'st', 'jan', 'feb', 'mar', 'apr', 'jun',
+    'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec'
+})
+
+_ABBREVIATION_WINDOW = max(len(abbreviation) for abbreviation in ABBREVIATIONS) + 1
+_ABBREVIATION_SUFFIXES = tuple(ABBREVIATIONS)
+_WORD_BEFORE_PERIOD = re.compile(r'(?<![\w.])(?:\w+\.)*\w+$')
+_NON_SPACE = re.compile(r'\S')
+
+_span = re.Match.span
+
+
+class Segmentation:
+    """
+    Token and sentence offsets of one text.
+
+    Offsets are stored flat as [start0, end0, start1, end1, ...] in compact
+    integer arrays. Sentences are the non-blank stretches between sentence
+    terminators (which they exclude), so a leading or trailing stretch with
+    no terminator is a sentence fragment.
+    """
+
+    __slots__ = ('text', 'sentence_offsets', 'has_terminator', '_token_offsets')
+
+    def __init__(self, text: str, sentence_offsets: array, has_terminator: bool):
+        self.text = text
+        self.sentence_offsets = sentence_offsets
+        self.has_terminator = has_terminator
+        self._token_offsets: Optional[array] = None
+
+    @property
+    def token_offsets(self) -> array:
+        if self._token_offsets is None:
+            self._token_offsets = array('q', chain.from_iterable(map(_span, TOKEN_PATTERN.finditer(self.text))))
+        return self._token_offsets
+
+    @property
+    def token_count(self) -> int:
+        return len(self.token_offsets) // 2
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentence_offsets) // 2
+
+    def token_span(self, index: int) -> Tuple[int, int]:
+        offsets = self.token_offsets
+        if index < 0:
+            index += self.token_count
+        return offsets[2 * index], offsets[2 * index + 1]
+
+    def sentence_span(self, index: int) -> Tuple[int, int]:
+        offsets = self.sentence_offsets
+        if index < 0:
+            index += self.sentence_count
+        return offsets[2 * index], offsets[2 * index + 1]
+
+    def token_spans(self) -> Iterator[Tuple[int, int]]:
+        offsets = self.token_offsets
+        return zip(offsets[::2], offsets[1::2])
+
+    def sentence_spans(self) -> Iterator[Tuple[int, int]]:
+        offsets = self.sentence_offsets
+        return zip(offsets[::2], offsets[1::2])
+
+    def tokens(self, buffer: Optional[str] = None) -> List[str]:
+        """
+        Token strings of `buffer` (the original text by default).
+
+        `buffer` can be any case-mapped copy of the text, such as its
+        lowercased form. The strings are matched directly rather than sliced
+        from the offsets, which is faster and leaves the offsets uncomputed.
+        """
+        return TOKEN_PATTERN.findall(self.text if buffer is None else buffer)
+
+    def sentences(self, buffer: Optional[str] = None) -> List[str]:
+        buffer = self.text if buffer is None else buffer
+        return [buffer[start:end] for start, end in self.sentence_spans()]
+
+    def sentence_token_counts(self) -> List[int]:
+        """Number of tokens in each sentence (tokens never straddle a terminator)."""
+        offsets = self._token_offsets
+        if offsets is None:
+            # Matching within each sentence's bounds is cheaper than building every token offset
+            findall, text = TOKEN_PATTERN.findall, self.text
+            return [len(findall(text, start, end)) for start, end in self.sentence_spans()]
+
+        starts = offsets[::2]
+        counts = []
+        for start, end in self.sentence_spans():
+            first = bisect_left(starts, start)
+            counts.append(bisect_left(starts, end, first) - first)
+        return counts
+
+
+def segment(text: str) -> Segmentation:
+    """Segment a text into sentences; token offsets follow on demand."""
+    sentence_offsets = array('q')
+    length = len(text)
+    previous = 0
+    has_terminator = False
+    for start, end in map(_span, TERMINATOR_PATTERN.finditer(text)):
+        if not _ends_sentence(text, start, end):
+            continue
+        has_terminator = True
+        if start > previous and _NON_SPACE.search(text, previous, start):
+            sentence_offsets.extend((previous, start))
+        previous = end
+    if length > previous and _NON_SPACE.search(text, previous, length):
+        sentence_offsets.extend((previous, length))
+
+    return Segmentation(text, sentence_offsets, has_terminator)
+
+
+def _ends_sentence(text: str, start: int, end: int) -> bool:
+    """Whether the terminator run text[start:end] ends a sentence."""
+    if end < len(text) and text[end].isalnum():
+        return False
+    if end - start == 1 and text[start] == '.':
+        window = max(0, start - _ABBREVIATION_WINDOW)
+        # Cheap suffix test first; the word boundary is only checked for likely abbreviations
+        if text[window:start].lower().endswith(_ABBREVIATION_SUFFIXES):
+            word = _WORD_BEFORE_PERIOD.search(text, window, start)
+            if word is not None and word.group().lower() in ABBREVIATIONS:
+                return False
+    return True
@@ -0,0 +1,138 @@
+"""
+Sustainability Communications Framework - Streaming Analysis
+
+Bounded-memory analysis of very large regulatory documents. Text arrives in
+chunks; only running counts and a small carry-over window are kept, so memory
+stays flat however large the document grows.
+
+Author: Begoña Penón
+"""
+
+from collections import Counter
+from typing import Dict, List
+
+from complexity_stats import ComplexityStats
+
+
+class StreamingAnalysis:
+    """
+    Incremental accumulator behind ContentAnalyzer.analyze_stream.
+
+    Chunk boundaries may fall anywhere. State carried across them:
+    - the trailing partial word, so words and syllables are never split
+    - merged ComplexityStats, whose sentence state counts a straddling sentence once
+    - the last (longest term - 1) lowercased characters, so multi-word
+      keywords spanning two chunks are matched exactly once
+    - a `holdback` window of raw text for action item and deadline patterns
+    """
+
+    def __init__(self, analyzer, holdback: int = 256):
+        self.analyzer = analyzer
+        self.holdback = holdback
+        self._metrics = analyzer.metrics
+        # Stage times of every chunk, recorded as one document by finish()
+        self._stages = analyzer.metrics.document()
+        self._bytes = 0
+
+        # Readability counts, merged chunk by chunk
+        self.stats = ComplexityStats()
+        self._word_carry = ''
+
+        # Keyword scanning over the lowercased stream
+        self._automaton = analyzer.keyword_automaton()
+        self._keyword_overlap = max((len(term) for term in self._automaton.terms), default=1) - 1
+        self._keyword_tail = ''
+        self._keyword_scanned = 0
+        self._keyword_last_end: Dict[str, int] = {}
+        self.keyword_counts: Counter = Counter()
+
+        # Action items and deadlines, from the analyser's combined single-pass matcher
+        self._matcher = analyzer.pattern_matcher()
+        self._action_items: Dict[str, None] = {}
+        self._deadlines: List[str] = []
+        self._regex_buffer = ''
+
+    def feed(self, chunk: str):
+        """Consume the next piece of the document."""
+        if self._metrics.enabled:
+            self._bytes += len(chunk.encode('utf-8'))
+        text = self._word_carry + chunk
+
+        # Hold back the trailing partial word until whitespace completes it
+        cut = len(text)
+        while cut and not text[cut - 1].isspace():
+            cut -= 1
+        self._word_carry = text[cut:]
+        self._process(text[:cut], final=False)
+
+    def finish(self) -> Dict:
+        """Flush the carried state and return the document-level results."""
+        self._process(self._word_carry, final=True)
+        self._word_carry = ''
+        # The whole stream is one document, however many chunks it arrived in
+        self._metrics.count_document(self._bytes)
+        self._stages.record()
+
+        analyzer = self.analyzer
+        self.stats.legal_terms = sum(self.keyword_counts[term] for term in analyzer.complexity_indicators)
+        self.stats.epr_term_counts = {
+            priority: sum(self.keyword_counts[keyword] for keyword in keywords)
+            for priority, keywords in analyzer.epr_keywords.items()
+        }
+
+        return {
+            'complexity_analysis': analyzer.complexity_report(self.stats),
+            'action_items': list(self._action_items),
+            'critical_deadlines': self._deadlines
+        }
+
+    def _process(self, text: str, final: bool):
+        if text:
+            # Keywords are counted over the whole stream below, not per chunk
+            profile = self.analyzer._new_profile(text, self._stages)
+            self.stats += self.analyzer._readability_stats(profile)
+            lower = profile.lower
+            with self._stages.stage('keyword_scan'):
+                self._scan_keywords(lower)
+        with self._stages.stage('regex_extraction'):
+            self._scan_patterns(text, final)
+
+    def _scan_keywords(self, lower: str):
+        tail = self._keyword_tail
+        buffer = tail + lower
+        scanned = self._keyword_scanned
+        last_end = self._keyword_last_end
+
+        for start, term in self._automaton.iter_matches(buffer, scanned - len(tail)):
+            end = start + len(term)
+            # Matches lying wholly inside the tail were counted with the previous chunk
+            if end <= scanned:
+                continue
+            if start >= last_end.get(term, 0):
+                self.keyword_counts[term] += 1
+                last_end[term] = end
+
+        self._keyword_scanned = scanned + len(lower)
+        self._keyword_tail = buffer[max(0, len(buffer) - self._keyword_overlap):]
+
+    def _scan_patterns(self, text: str, final: bool):
+        buffer = self._regex_buffer + text
+        limit = len(buffer) if final else len(buffer) - self.holdback
+        matcher = self._matcher
+
+        pos = 0
+        for match in matcher.finditer(buffer, pos):
+            # Defer matches near the end: more text could still change them
+            if match.end() > limit:
+                break
+            if matcher.match_type(match) == 'action_item':
+                # Action items are reported deduplicated, so only distinct ones are kept
+                self._action_items[match.group()] = None
+            else:
+                self._deadlines.append(match.group())
+            pos = match.end()
+        else:
+            pos = max(pos, limit)
+
+        # Drop text the matcher has moved past
+        self._regex_buffer = buffer[pos:]
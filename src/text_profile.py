@@ -0,0 +1,110 @@
+"""
+Sustainability Communications Framework - Text Profile
+
+Per-document profile shared by every ContentAnalyzer analysis, so a text is
+lowercased, segmented into tokens and sentences and scanned for keywords once
+no matter how many analyses run on it.
+
+Author: Begoña Penón
+"""
+
+import re
+from functools import cached_property
+from typing import Callable, Dict, List, Tuple
+
+from analysis_metrics import NULL_STAGES
+from keyword_automaton import KeywordAutomaton, KeywordHits
+from pattern_matcher import PatternMatcher
+from segmentation import Segmentation, segment
+
+
+ACRONYM_PATTERN = re.compile(r'\b[A-Z]{2,}\b')
+
+
+class TextProfile:
+    """
+    Reusable tokenisation of a single document.
+
+    Every field is computed on first access and memoised, so analyses only pay
+    for what they use and never repeat work another analysis already did.
+    Dependencies are resolved before a stage timer starts, so `stages` never
+    counts one stage's time against another. Stage times accumulate on the
+    profile and reach the histograms once, via `record_stages`.
+    """
+
+    def __init__(self, text: str, automaton: KeywordAutomaton, syllable_batch: Callable[[List[str]], List[int]],
+                 matcher: PatternMatcher, stages=NULL_STAGES):
+        self.text = text
+        self._automaton = automaton
+        self._syllable_batch = syllable_batch
+        self._matcher = matcher
+        self.stages = stages
+
+    def record_stages(self):
+        """Record this document's stage times as one observation per stage."""
+        self.stages.record()
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased buffer used for keyword matching and phrase extraction."""
+        with self.stages.stage('tokenize'):
+            return self.text.lower()
+
+    @cached_property
+    def segmentation(self) -> Segmentation:
+        """Token and sentence offsets over the original text."""
+        with self.stages.stage('tokenize'):
+            return segment(self.text)
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Lowercased tokens, the one word definition for readability metrics and phrases."""
+        lower = self.lower
+        segmentation = self.segmentation
+        with self.stages.stage('tokenize'):
+            return segmentation.tokens(lower)
+
+    @cached_property
+    def phrase_tokens(self) -> List[str]:
+        """Tokens used for n-gram phrase extraction (the same list as `words`)."""
+        return self.words
+
+    @cached_property
+    def sentence_spans(self) -> List[Tuple[int, int]]:
+        """(start, end) offsets of non-blank sentences, excluding their terminators."""
+        segmentation = self.segmentation
+        with self.stages.stage('tokenize'):
+            return list(segmentation.sentence_spans())
+
+    @cached_property
+    def sentence_word_counts(self) -> List[int]:
+        """Number of tokens in each sentence."""
+        segmentation = self.segmentation
+        with self.stages.stage('tokenize'):
+            return segmentation.sentence_token_counts()
+
+    @cached_property
+    def syllable_counts(self) -> List[int]:
+        """Estimated syllables for each entry of `words`."""
+        words = self.words
+        with self.stages.stage('syllables'):
+            return self._syllable_batch(words)
+
+    @cached_property
+    def keyword_hits(self) -> KeywordHits:
+        """Single automaton scan over the lowercased buffer."""
+        lower = self.lower
+        with self.stages.stage('keyword_scan'):
+            return self._automaton.scan(lower)
+
+    @cached_property
+    def pattern_matches(self) -> List[Dict]:
+        """Typed action item and deadline matches with offsets, from one scan."""
+        with self.stages.stage('regex_extraction'):
+            return self._matcher.scan(self.text)
+
+    @cached_property
+    def acronym_count(self) -> int:
+        """Number of upper-case acronyms (technical terms requiring a glossary)."""
+        with self.stages.stage('regex_extraction'):
+            return len(ACRONYM_PATTERN.findall(self.text))
@@ -0,0 +1,46 @@
+from analysis_cache import AnalysisCache
+from content_analyzer import ContentAnalyzer
+
+
+TEXT = 'Producers must register packaging waste before 1 June 2026. Penalties apply.'
+
+
+def test_repeat_analysis_is_served_from_memory():
+    cache = AnalysisCache()
+    analyzer = ContentAnalyzer([], cache=cache)
+    first = analyzer.generate_communication_recommendations(TEXT)
+    second = analyzer.generate_communication_recommendations('  ' + TEXT + '\r\n')
+
+    assert first == second == ContentAnalyzer([]).generate_communication_recommendations(TEXT)
+    assert cache.stats()['memory_hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_lexicon_change_invalidates_entries():
+    cache = AnalysisCache()
+    analyzer = ContentAnalyzer([], cache=cache)
+    before = analyzer.analyze_text_complexity(TEXT)
+    analyzer.complexity_indicators.append('penalties apply')
+    after = analyzer.analyze_text_complexity(TEXT)
+
+    assert after['legal_complexity_ratio'] > before['legal_complexity_ratio']
+    assert cache.stats()['misses'] == 2
+
+
+def test_disk_tier_persists_across_instances(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    ContentAnalyzer([], cache=AnalysisCache(path=path)).extract_key_concepts(TEXT, top_n=3)
+
+    cache = AnalysisCache(path=path)
+    concepts = ContentAnalyzer([], cache=cache).extract_key_concepts(TEXT, top_n=3)
+    assert len(concepts['key_phrases']) == 3
+    assert cache.stats()['disk_hits'] == 1
+
+
+def test_size_based_eviction(tmp_path):
+    cache = AnalysisCache(max_memory_bytes=300, path=str(tmp_path / 'c.sqlite'), max_disk_bytes=500)
+    for i in range(10):
+        cache.put(str(i), {'value': 'x' * 100})
+    stats = cache.stats()
+    assert stats['memory_bytes'] <= 300 and stats['disk_bytes'] <= 500
+    assert cache.get('9') is not None and cache.get('0') is None
@@ -0,0 +1,61 @@
+from analysis_cache import AnalysisCache
+from analysis_metrics import STAGES, AnalysisMetrics
+from content_analyzer import ContentAnalyzer
+
+
+TEXT = 'Producers must register packaging waste before 1 June 2026. Penalties apply to the EPR register.'
+
+
+def test_disabled_by_default():
+    analyzer = ContentAnalyzer([])
+    analyzer.generate_communication_recommendations(TEXT)
+    assert analyzer.metrics_snapshot() == {}
+    assert analyzer.metrics_prometheus() == ''
+
+
+def test_every_stage_is_timed_once_per_document():
+    analyzer = ContentAnalyzer([], instrument=True)
+    result = analyzer.generate_communication_recommendations(TEXT)
+
+    assert result == ContentAnalyzer([]).generate_communication_recommendations(TEXT)
+    snapshot = analyzer.metrics_snapshot()
+    assert snapshot['documents_total'] == 1
+    assert snapshot['bytes_total'] == len(TEXT.encode('utf-8'))
+    assert set(STAGES) <= set(snapshot['stages'])
+    # Stages run in several pieces (tokenisation, regex extraction) are still one observation
+    for name in STAGES:
+        assert snapshot['stages'][name]['count'] == 1
+        assert snapshot['stages'][name]['buckets']['+Inf'] == 1
+
+    analyzer.analyze_text_complexity(TEXT)
+    analyzer.extract_key_concepts(TEXT)
+    stages = analyzer.metrics_snapshot()['stages']
+    assert stages['tokenize']['count'] == 3 and stages['regex_extraction']['count'] == 2
+
+
+def test_stream_counts_as_one_document():
+    analyzer = ContentAnalyzer([], instrument=True)
+    analyzer.analyze_stream([TEXT[:30], TEXT[30:]])
+    snapshot = analyzer.metrics_snapshot()
+    assert snapshot['documents_total'] == 1
+    assert all(stage['count'] == 1 for stage in snapshot['stages'].values())
+    assert snapshot['bytes_total'] == len(TEXT.encode('utf-8'))
+
+
+def test_prometheus_export_includes_cache_hit_rate():
+    analyzer = ContentAnalyzer([], cache=AnalysisCache(), instrument=True)
+    analyzer.generate_communication_recommendations(TEXT)
+    analyzer.generate_communication_recommendations(TEXT)
+
+    text = analyzer.metrics_prometheus()
+    assert '# TYPE content_analyzer_stage_seconds histogram' in text
+    assert 'content_analyzer_stage_seconds_count{stage="syllables"} 1' in text
+    assert 'content_analyzer_documents_total 1' in text
+    assert 'content_analyzer_cache_hit_ratio 0.5' in text
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = AnalysisMetrics(buckets=(0.01, 0.1))
+    for seconds in (0.005, 0.05, 0.5):
+        metrics.observe('tokenize', seconds)
+    assert metrics.snapshot()['stages']['tokenize']['buckets'] == {'0.01': 1, '0.1': 2, '+Inf': 3}
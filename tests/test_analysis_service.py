@@ -0,0 +1,204 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+from analysis_cache import AnalysisCache
+from analysis_service import AnalysisService, percentile, serve
+from content_analyzer import ContentAnalyzer
+from phrase_extractor import PhraseExtractor
+
+
+DRAFTS = [
+    'Producers must register packaging waste before 1 June 2026. Penalties apply.',
+    'Battery producers shall meet collection targets.',
+    'Sell more. Ship fast.'
+]
+
+# About 73 KB: over asyncio's default 64 KiB line limit
+LONG_TEXT = ' '.join(DRAFTS) * 500
+
+
+def test_percentile_uses_nearest_rank():
+    samples = list(range(1, 101))
+    assert [percentile(samples, q) for q in (50, 90, 99, 100)] == [50, 90, 99, 100]
+    assert percentile([], 50) == 0.0
+
+
+def test_concurrent_requests_are_batched_and_match_direct_analysis():
+    async def run():
+        async with AnalysisService(workers=0, batch_window=0.05) as service:
+            texts = DRAFTS * 4
+            records = await asyncio.gather(*(service.analyze(text) for text in texts))
+            return texts, records, service.stats()
+
+    texts, records, stats = asyncio.run(run())
+    analyzer = ContentAnalyzer([])
+    assert all(record['ok'] for record in records)
+    for text, record in zip(texts, records):
+        assert record['result'] == analyzer.generate_communication_recommendations(text)
+
+    assert stats['requests'] == 12 and stats['errors'] == 0
+    assert stats['batches'] < stats['requests']
+    # Repeated drafts are analysed once per batch
+    assert stats['analyses'] < stats['requests']
+    assert set(stats['latency_ms']) == {'p50', 'p90', 'p95', 'p99', 'max'}
+    assert stats['latency_ms']['p50'] <= stats['latency_ms']['p99'] <= stats['latency_ms']['max']
+
+
+def test_worker_processes_use_the_analyzer_configuration():
+    analyzer = ContentAnalyzer([], instrument=True)
+    analyzer.phrase_extractor = PhraseExtractor(ngram_range=(2, 2))
+    analyzer.action_patterns = [r'register\s+\w+']
+
+    async def run():
+        async with AnalysisService(analyzer, workers=1) as service:
+            return await asyncio.gather(*(service.analyze(text) for text in DRAFTS))
+
+    records = asyncio.run(run())
+    assert analyzer.metrics_snapshot()['documents_total'] == len(DRAFTS)
+    assert [record['result'] for record in records] == [
+        analyzer.generate_communication_recommendations(text) for text in DRAFTS
+    ]
+
+
+def test_batch_failures_resolve_every_request():
+    async def run():
+        async with AnalysisService(workers=0, batch_window=0.05) as service:
+            with pytest.raises(ValueError):
+                await service.analyze(DRAFTS[0], fields=[['flesch_reading_ease']])
+
+            async def broken(batch):
+                raise RuntimeError('analysis backend unavailable')
+
+            service._analyze = broken
+            return await asyncio.gather(*(service.analyze(text) for text in DRAFTS), return_exceptions=True)
+
+    outcomes = asyncio.run(run())
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+
+
+def test_worker_processes_share_the_service_cache():
+    analyzer = ContentAnalyzer([], cache=AnalysisCache())
+
+    async def run():
+        async with AnalysisService(analyzer, workers=1) as service:
+            first = await service.analyze(DRAFTS[0])
+            second = await service.analyze(DRAFTS[0])
+            partial = await service.analyze(DRAFTS[0], ['flesch_reading_ease'])
+            return first, second, partial, service.stats()
+
+    first, second, partial, stats = asyncio.run(run())
+    assert first['result'] == second['result'] == ContentAnalyzer([]).generate_communication_recommendations(DRAFTS[0])
+    assert partial['result'] == ContentAnalyzer([]).generate_communication_recommendations(
+        DRAFTS[0], fields=['flesch_reading_ease'])
+    assert stats['analyses'] == 2
+    cache = analyzer.cache.stats()
+    assert cache['memory_hits'] == 1 and cache['misses'] == 2
+
+
+def test_stop_answers_requests_still_queued():
+    async def run():
+        service = AnalysisService(workers=0, max_batch=2, batch_window=0.05)
+        await service.start()
+        futures = [await service.submit(text) for text in DRAFTS * 3]
+        await service.stop()
+        return futures
+
+    futures = asyncio.run(run())
+    assert all(future.done() and future.result()['ok'] for future in futures)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='needs Unix sockets')
+def test_unix_socket_round_trip(tmp_path):
+    socket_path = str(tmp_path / 'analyzer.sock')
+    requests = [
+        {'id': 1, 'text': DRAFTS[0], 'fields': ['flesch_reading_ease']},
+        {'id': 2, 'text': DRAFTS[1]},
+        {'id': 3},
+        {'id': 4, 'text': DRAFTS[2], 'fields': 5},
+        {'id': 5, 'text': DRAFTS[2], 'fields': [['flesch_reading_ease']]},
+        {'id': 6, 'op': 'delete', 'text': DRAFTS[2]},
+        ['not', 'an', 'object']
+    ]
+
+    async def run():
+        async with AnalysisService(workers=0, batch_window=0.05) as service:
+            server = await asyncio.start_unix_server(service.handle_connection, socket_path)
+            async with server:
+                reader, writer = await asyncio.open_unix_connection(socket_path)
+                for request in requests:
+                    writer.write((json.dumps(request) + '\n').encode('utf-8'))
+                writer.write(b'not json\n')
+                await writer.drain()
+                responses = [json.loads(await asyncio.wait_for(reader.readline(), 5))
+                             for _ in range(len(requests) + 1)]
+
+                # The connection survives malformed requests
+                writer.write(b'{"id": 7, "op": "stats"}\n')
+                await writer.drain()
+                stats = json.loads(await asyncio.wait_for(reader.readline(), 5))
+                writer.close()
+                return responses, stats
+
+    responses, stats = asyncio.run(run())
+    analyzer = ContentAnalyzer([])
+    by_id = {response['id']: response for response in responses if response['ok']}
+    assert sorted(by_id) == [1, 2]
+    assert by_id[1]['result'] == analyzer.generate_communication_recommendations(
+        DRAFTS[0], fields=['flesch_reading_ease'])
+    assert by_id[2]['result'] == analyzer.generate_communication_recommendations(DRAFTS[1])
+
+    errors = [response for response in responses if not response['ok']]
+    assert sorted(response['id'] for response in errors if response['id'] is not None) == [3, 4, 5, 6]
+    assert len(errors) == 6 and all(response['error'].startswith('Bad request') for response in errors)
+    assert stats['id'] == 7 and stats['result']['requests'] == 2
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='needs Unix sockets')
+def test_request_lines_over_the_limit_are_rejected_whole(tmp_path):
+    socket_path = str(tmp_path / 'analyzer.sock')
+
+    async def exchange(limit, request):
+        async with AnalysisService(workers=0) as service:
+            server = await asyncio.start_unix_server(service.handle_connection, socket_path, limit=limit)
+            async with server:
+                reader, writer = await asyncio.open_unix_connection(socket_path, limit=1 << 20)
+                writer.write((json.dumps(request) + '\n').encode('utf-8'))
+                writer.write((json.dumps({'id': 2, 'text': DRAFTS[2]}) + '\n').encode('utf-8'))
+                await writer.drain()
+                responses = [json.loads(await reader.readline()) for _ in range(2)]
+                writer.close()
+                return responses
+
+    too_long, after = asyncio.run(exchange(1024, {'id': 1, 'text': LONG_TEXT}))
+    assert too_long == {'id': None, 'ok': False, 'error': 'Bad request: request line too long'}
+    assert after['id'] == 2 and after['ok']
+
+    responses = asyncio.run(exchange(1 << 20, {'id': 1, 'text': LONG_TEXT, 'fields': ['total_words']}))
+    assert [response['ok'] for response in responses] == [True, True]
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='needs Unix sockets')
+def test_serve_accepts_requests_over_64_kib(tmp_path):
+    socket_path = str(tmp_path / 'analyzer.sock')
+
+    async def run():
+        server = asyncio.ensure_future(serve(AnalysisService(workers=0), socket_path))
+        while not os.path.exists(socket_path):
+            await asyncio.sleep(0.01)
+        reader, writer = await asyncio.open_unix_connection(socket_path, limit=1 << 20)
+        writer.write((json.dumps({'id': 1, 'text': LONG_TEXT, 'fields': ['total_words']}) + '\n').encode('utf-8'))
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        writer.close()
+        server.cancel()
+        await asyncio.gather(server, return_exceptions=True)
+        return response
+
+    response = asyncio.run(run())
+    assert response['ok']
+    assert response['result'] == ContentAnalyzer([]).generate_communication_recommendations(
+        LONG_TEXT, fields=['total_words'])
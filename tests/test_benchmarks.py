@@ -0,0 +1,27 @@
+from run_benchmarks import compare, parse_size, run_suite
+from synthetic_corpus import CorpusGenerator
+
+
+def test_generator_is_deterministic_and_sized():
+    generator = CorpusGenerator(keyword_density=0.2, legalese_density=0.1)
+    text = generator.text(20000)
+    assert text == CorpusGenerator(keyword_density=0.2, legalese_density=0.1).text(20000)
+    assert len(text) >= 20000
+    assert 'pursuant to' in text or 'whereas' in text
+
+
+def test_parse_size_units():
+    assert parse_size('1KB') == 1024
+    assert parse_size('1.5MB') == 1572864
+    assert parse_size('512') == 512
+
+
+def test_compare_flags_throughput_and_memory_regressions():
+    results = run_suite([2048], ['analyze_text_complexity'], 0.05, 0.01, repeat=1)
+    key = 'analyze_text_complexity@2048'
+    assert compare(results, results, threshold=0.2) == []
+
+    faster = {'results': {key: dict(results['results'][key], mb_per_second=results['results'][key]['mb_per_second'] * 2)}}
+    leaner = {'results': {key: dict(results['results'][key], peak_bytes=results['results'][key]['peak_bytes'] // 2)}}
+    assert 'throughput' in compare(results, faster, threshold=0.2)[0]
+    assert 'peak memory' in compare(results, leaner, threshold=0.2)[0]
@@ -0,0 +1,36 @@
+import json
+
+from complexity_stats import ComplexityStats
+from content_analyzer import ContentAnalyzer
+
+
+SEGMENTS = [
+    'Extended producer responsibility applies to every producer. Sellers must register',
+    'with the national packaging authority before placing packaging on the market',
+    '',
+    'pursuant to the packaging waste rules. Reports are due by March 31! Penalties apply?',
+    'Whereas compliance is mandatory'
+]
+
+
+def test_merged_segment_stats_equal_whole_document_analysis():
+    analyzer = ContentAnalyzer(SEGMENTS)
+    document = '\n'.join(SEGMENTS)
+
+    assert analyzer.analyze_segments_complexity() == analyzer.analyze_text_complexity(document)
+    merged = sum(analyzer.segment_complexity_stats(), ComplexityStats())
+    assert merged.total_sentences == analyzer.complexity_stats(document).total_sentences == 5
+
+
+def test_merge_is_associative_and_serialisable():
+    analyzer = ContentAnalyzer(SEGMENTS)
+    a, b, c, d, e = analyzer.segment_complexity_stats()
+    assert (a + b) + (c + d + e) == a + (b + (c + d) + e)
+
+    shipped = ComplexityStats.from_dict(json.loads(json.dumps((a + b).to_dict())))
+    assert shipped + c == a + b + c
+
+
+def test_empty_stats_are_the_identity():
+    stats = ContentAnalyzer([]).complexity_stats('No terminator here')
+    assert ComplexityStats() + stats == stats == stats + ComplexityStats()
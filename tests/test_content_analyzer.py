@@ -0,0 +1,212 @@
+import multiprocessing
+
+import content_analyzer
+from analysis_cache import AnalysisCache
+from content_analyzer import ContentAnalyzer
+from phrase_extractor import PhraseExtractor
+
+
+SAMPLE_TEXT = """
+Extended Producer Responsibility (EPR) requirements mandate that producers
+who first place packaging on the market must register with the national
+packaging authority and comply with recycling targets. Producers must
+submit annual reports by March 31st detailing packaging quantities and
+materials. Non-compliance may result in penalties up to €50,000.
+Registration must be completed before first market placement.
+Pursuant to the aforementioned rules, due diligence is expected.
+"""
+
+
+def test_keyword_methods_share_one_automaton():
+    first = ContentAnalyzer([])
+    second = ContentAnalyzer([])
+    assert first.keyword_automaton() is second.keyword_automaton()
+
+    first.epr_keywords['process_terms'].append('placement')
+    assert first.keyword_automaton() is not second.keyword_automaton()
+    assert first.scan_keywords(SAMPLE_TEXT).count('placement') == 1
+
+
+def test_detect_keywords_does_not_accumulate_across_calls():
+    analyzer = ContentAnalyzer([SAMPLE_TEXT])
+    first = analyzer.detect_keywords()
+    assert analyzer.detect_keywords() == first
+    assert ('penalties', 'high_priority') in first
+
+
+def test_iter_keyword_hits_streams_positions_lazily():
+    analyzer = ContentAnalyzer([])
+    pulled = []
+
+    texts = ['No keywords here.', 'Penalties apply to EPR reporting deadlines.', 'EPR fees.']
+
+    def segments():
+        for text in texts:
+            pulled.append(text)
+            yield text
+
+    hits = analyzer.iter_keyword_hits(segments())
+    assert next(hits) == (1, 0, 'penalties', 'high_priority')
+    assert len(pulled) == 2  # the first hit arrives before the last segment is read
+
+    rest = list(hits)
+    assert {position for position, _, _, _ in rest} == {1, 2}
+    for position, offset, term, category in [(1, 0, 'penalties', 'high_priority'), *rest]:
+        assert texts[position].lower()[offset:offset + len(term)] == term
+        assert term in analyzer.epr_keywords[category]
+
+
+def test_extract_key_concepts_matches_substring_counts():
+    analyzer = ContentAnalyzer([])
+    concepts = analyzer.extract_key_concepts(SAMPLE_TEXT)['epr_concepts']
+    lower = SAMPLE_TEXT.lower()
+    for level, found in concepts.items():
+        assert [c['term'] for c in found] == [kw for kw in analyzer.epr_keywords[level] if kw in lower]
+        for concept in found:
+            assert concept['frequency'] == lower.count(concept['term'])
+
+
+def test_multi_word_complexity_indicators_are_counted():
+    complexity = ContentAnalyzer([]).analyze_text_complexity('Pursuant to the rules, sellers comply.')
+    assert complexity['legal_complexity_ratio'] == round(1 / 6, 4)
+
+
+def test_translation_readiness_finds_cultural_terms():
+    readiness = ContentAnalyzer([]).assess_translation_readiness(SAMPLE_TEXT)
+    assert readiness['cultural_terms_found'] == ['due diligence']
+
+
+def test_profile_is_shared_across_analyses():
+    analyzer = ContentAnalyzer([])
+    profile = analyzer.build_profile(SAMPLE_TEXT)
+    assert analyzer.build_profile(profile) is profile
+
+    assert analyzer.analyze_text_complexity(profile) == analyzer.analyze_text_complexity(SAMPLE_TEXT)
+    assert analyzer.extract_key_concepts(profile) == analyzer.extract_key_concepts(SAMPLE_TEXT)
+    assert analyzer.assess_translation_readiness(profile) == analyzer.assess_translation_readiness(SAMPLE_TEXT)
+    # Every field was materialised once on the shared profile
+    assert {'words', 'phrase_tokens', 'segmentation', 'keyword_hits'} <= set(vars(profile))
+
+
+def test_generate_communication_recommendations_runs_end_to_end():
+    results = ContentAnalyzer([]).generate_communication_recommendations(SAMPLE_TEXT)
+    assert results['strategic_recommendations']['primary_message_focus'] == "Step-by-step guidance and procedures"
+    assert results['implementation_priority'].split(' ')[0] in {'URGENT', 'HIGH', 'MEDIUM'}
+
+
+def test_analyze_corpus_reports_failures_without_aborting():
+    analyzer = ContentAnalyzer([])
+    texts = [SAMPLE_TEXT, None, 'Sellers must register by March 31.']
+    records = list(analyzer.analyze_corpus(texts, workers=2, chunksize=1))
+
+    assert [r['index'] for r in records] == [0, 1, 2]
+    assert [r['ok'] for r in records] == [True, False, True]
+    assert records[1]['error'].startswith('AttributeError')
+    assert records[0]['result'] == analyzer.generate_communication_recommendations(SAMPLE_TEXT)
+
+
+def test_analyze_corpus_unordered_uses_custom_lexicon():
+    analyzer = ContentAnalyzer([])
+    analyzer.cultural_terms = ['market placement']
+    records = analyzer.analyze_corpus([SAMPLE_TEXT] * 4, workers=2, ordered=False)
+    found = {r['index']: r['result']['analysis_summary']['translation_readiness']['cultural_terms_found']
+             for r in records}
+    assert found == {i: ['market placement'] for i in range(4)}
+
+
+def test_analyze_corpus_matches_direct_analysis_with_custom_config():
+    analyzer = ContentAnalyzer([])
+    analyzer.phrase_extractor = PhraseExtractor(ngram_range=(2, 2))
+    texts = [SAMPLE_TEXT, 'Sellers must register packaging data by March 31.']
+    expected = [analyzer.generate_communication_recommendations(text) for text in texts]
+
+    for workers in (1, 2):
+        records = list(analyzer.analyze_corpus(texts, workers=workers))
+        assert [record['result'] for record in records] == expected
+
+
+def test_analyze_corpus_single_worker_runs_on_the_instance():
+    analyzer = ContentAnalyzer([], cache=AnalysisCache(), instrument=True)
+    list(analyzer.analyze_corpus([SAMPLE_TEXT, SAMPLE_TEXT], workers=1))
+
+    snapshot = analyzer.metrics_snapshot()
+    assert snapshot['cache']['memory_hits'] == 1 and snapshot['cache']['misses'] == 1
+    assert snapshot['stages']['recommendations']['count'] == 1
+
+
+def test_analyze_corpus_consults_the_result_cache():
+    analyzer = ContentAnalyzer([], cache=AnalysisCache())
+    texts = [SAMPLE_TEXT, 'Sellers must register packaging data by March 31.']
+    first = list(analyzer.analyze_corpus(texts, workers=2, chunksize=1))
+    second = list(analyzer.analyze_corpus(texts, workers=2, chunksize=1))
+
+    assert [record['result'] for record in second] == [record['result'] for record in first]
+    stats = analyzer.cache.stats()
+    assert stats['memory_hits'] == 2 and stats['misses'] == 2
+
+
+def test_analyze_corpus_sends_only_cache_misses_to_the_pool(monkeypatch):
+    sent = []
+
+    class RecordingPool:
+        def __init__(self, *args, **kwargs):
+            self.pool = multiprocessing.Pool(*args, **kwargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return self.pool.__exit__(*exc_info)
+
+        def imap(self, func, iterable, chunksize=1):
+            items = list(iterable)
+            sent.extend(item[0] for item in items)
+            return self.pool.imap(func, items, chunksize)
+
+        imap_unordered = imap
+
+    monkeypatch.setattr(content_analyzer, 'Pool', RecordingPool)
+    analyzer = ContentAnalyzer([], cache=AnalysisCache())
+    expected = analyzer.generate_communication_recommendations(SAMPLE_TEXT)
+    texts = ['Sellers must register packaging data by March 31.', SAMPLE_TEXT, 'Penalties apply.', SAMPLE_TEXT]
+
+    records = list(analyzer.analyze_corpus(texts, workers=2, chunksize=1))
+    assert sent == [0, 2]
+    assert [record['index'] for record in records] == [0, 1, 2, 3]
+    assert all(record['ok'] for record in records)
+    assert records[1]['result'] == records[3]['result'] == expected
+
+    # Everything is cached now, so nothing more reaches the pool
+    unordered = list(analyzer.analyze_corpus(texts, workers=2, ordered=False))
+    assert sent == [0, 2]
+    assert sorted(record['index'] for record in unordered) == [0, 1, 2, 3]
+
+
+def test_analyze_corpus_merges_worker_metrics():
+    analyzer = ContentAnalyzer([], instrument=True)
+    texts = [SAMPLE_TEXT, 'Sellers must register packaging data by March 31.']
+    list(analyzer.analyze_corpus(texts, workers=2, chunksize=1))
+
+    snapshot = analyzer.metrics_snapshot()
+    assert snapshot['documents_total'] == 2
+    assert snapshot['stages']['recommendations']['count'] == 2
+
+
+def test_analyze_stream_matches_whole_text_across_chunk_edges():
+    analyzer = ContentAnalyzer([])
+    # Cut mid-word, mid-sentence and inside 'extended producer responsibility'
+    chunks = [SAMPLE_TEXT[i:i + 7] for i in range(0, len(SAMPLE_TEXT), 7)]
+    streamed = analyzer.analyze_stream(chunks, holdback=32)
+    concepts = analyzer.extract_key_concepts(SAMPLE_TEXT)
+
+    assert streamed['complexity_analysis'] == analyzer.analyze_text_complexity(SAMPLE_TEXT)
+    assert sorted(streamed['action_items']) == sorted(concepts['action_items'])
+    assert streamed['critical_deadlines'] == concepts['critical_deadlines']
+
+
+def test_analyze_file_reads_in_chunks(tmp_path):
+    path = tmp_path / 'regulation.txt'
+    path.write_text(SAMPLE_TEXT * 50, encoding='utf-8')
+    analyzer = ContentAnalyzer([])
+    result = analyzer.analyze_file(str(path), chunk_size=100)
+    assert result['complexity_analysis'] == analyzer.analyze_text_complexity(SAMPLE_TEXT * 50)
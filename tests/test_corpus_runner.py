@@ -0,0 +1,123 @@
+import json
+import os
+import sys
+
+import pytest
+
+import corpus_runner
+from content_analyzer import ContentAnalyzer
+from corpus_runner import MANIFEST_NAME, CorpusRunner, main
+
+
+TEXTS = {
+    'regulations/packaging.txt': 'Producers must register with the national packaging authority before 1 June 2026.',
+    'regulations/batteries.txt': 'Battery producers shall meet collection targets. Penalties apply.',
+    'drafts/seller_email.md': 'Register your packaging by March 15 to keep selling.'
+}
+
+
+def write_tree(root, texts):
+    for path, text in texts.items():
+        full = root / path
+        full.parent.mkdir(parents=True, exist_ok=True)
+        full.write_text(text, encoding='utf-8')
+
+
+def test_only_new_or_changed_files_are_reanalysed(tmp_path):
+    write_tree(tmp_path, TEXTS)
+    runner = CorpusRunner(str(tmp_path), workers=1)
+    assert sorted(runner.run()['analyzed']) == sorted(TEXTS)
+    runner.save_manifest()
+
+    warm = CorpusRunner(str(tmp_path), workers=1)
+    summary = warm.run()
+    assert summary['analyzed'] == [] and summary['reused'] == 3
+
+    # Rewriting identical content is re-hashed but not re-analysed
+    write_tree(tmp_path, {'regulations/batteries.txt': TEXTS['regulations/batteries.txt']})
+    (tmp_path / 'regulations/packaging.txt').write_text('Sellers must report annually.', encoding='utf-8')
+    (tmp_path / 'drafts/seller_email.md').unlink()
+    summary = warm.run()
+    assert summary['analyzed'] == ['regulations/packaging.txt']
+    assert summary['removed'] == ['drafts/seller_email.md']
+
+    records = {record['path']: record for record in warm.records()}
+    expected = ContentAnalyzer([]).generate_communication_recommendations('Sellers must report annually.')
+    assert records['regulations/packaging.txt']['result'] == expected
+    assert sorted(records) == ['regulations/batteries.txt', 'regulations/packaging.txt']
+
+
+def test_cli_writes_combined_jsonl(tmp_path, capsys):
+    write_tree(tmp_path / 'corpus', TEXTS)
+    output = tmp_path / 'results.jsonl'
+    assert main([str(tmp_path / 'corpus'), '--output', str(output), '--workers', '1']) == 0
+
+    lines = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+    assert [line['path'] for line in lines] == sorted(TEXTS)
+    assert all(line['ok'] and line['result'] for line in lines)
+    assert os.path.exists(tmp_path / 'corpus' / MANIFEST_NAME)
+    assert json.loads(capsys.readouterr().err)['analyzed'] == 3
+
+
+def test_watch_picks_up_files_as_they_land(tmp_path):
+    write_tree(tmp_path, {'regulations/packaging.txt': TEXTS['regulations/packaging.txt']})
+    runner = CorpusRunner(str(tmp_path), workers=1)
+    runs = []
+
+    def on_run(summary):
+        runs.append(summary['analyzed'])
+        if len(runs) == 1:
+            write_tree(tmp_path, {'drafts/seller_email.md': TEXTS['drafts/seller_email.md']})
+
+    runner.watch(interval=0, on_run=on_run, max_polls=3)
+    assert runs == [['regulations/packaging.txt'], ['drafts/seller_email.md']]
+
+
+def test_changed_files_are_read_once(tmp_path, monkeypatch):
+    write_tree(tmp_path, TEXTS)
+    opened = []
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(os.path.relpath(path, tmp_path))
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(corpus_runner, 'open', counting_open, raising=False)
+    CorpusRunner(str(tmp_path), workers=1).run()
+    assert sorted(path for path in opened if path != MANIFEST_NAME) == sorted(path.replace('/', os.sep) for path in TEXTS)
+
+
+def test_manifest_without_files_is_treated_as_empty(tmp_path):
+    write_tree(tmp_path, TEXTS)
+    manifest = {'version': corpus_runner.MANIFEST_VERSION, 'config_fingerprint': ContentAnalyzer([]).config_fingerprint()}
+    (tmp_path / MANIFEST_NAME).write_text(json.dumps(manifest), encoding='utf-8')
+    assert sorted(CorpusRunner(str(tmp_path), workers=1).run()['analyzed']) == sorted(TEXTS)
+
+
+def test_files_vanishing_mid_run_are_recorded_not_fatal(tmp_path, monkeypatch):
+    write_tree(tmp_path, TEXTS)
+    runner = CorpusRunner(str(tmp_path), workers=1)
+    scan = runner.scan
+
+    def scan_then_delete():
+        found = scan()
+        (tmp_path / 'drafts/seller_email.md').unlink()
+        return found
+
+    monkeypatch.setattr(runner, 'scan', scan_then_delete)
+    summary = runner.run()
+    assert sorted(summary['analyzed']) == sorted(TEXTS) and summary['failed'] == 1
+    records = {record['path']: record for record in runner.records()}
+    assert records['drafts/seller_email.md']['error'].startswith('FileNotFoundError')
+    assert records['regulations/packaging.txt']['ok']
+    runner.save_manifest()
+
+    monkeypatch.setattr(runner, 'scan', scan)
+    summary = runner.run()
+    assert summary['removed'] == ['drafts/seller_email.md'] and summary['failed'] == 0
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='needs symlinks')
+def test_scan_skips_files_that_cannot_be_stat(tmp_path):
+    write_tree(tmp_path, TEXTS)
+    os.symlink(tmp_path / 'missing.txt', tmp_path / 'dangling.txt')
+    assert sorted(CorpusRunner(str(tmp_path), workers=1).run()['analyzed']) == sorted(TEXTS)
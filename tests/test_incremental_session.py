@@ -0,0 +1,40 @@
+from content_analyzer import ContentAnalyzer
+
+
+SEGMENTS = [
+    'Extended producer responsibility (EPR) applies to every producer of packaging.',
+    'Producers must register with the national packaging authority and',
+    'submit annual reports by March 31 detailing packaging quantities.',
+    'Due diligence is expected pursuant to the packaging waste rules.'
+]
+
+
+def test_update_recomputes_only_changed_segments():
+    analyzer = ContentAnalyzer(list(SEGMENTS))
+    session = analyzer.incremental_session()
+    assert session.segments_recomputed == 4
+
+    edited = list(SEGMENTS)
+    edited[1] = 'Producers shall register with the packaging authority before 1 June 2026 and'
+    result = session.update(edited)
+
+    assert session.segments_recomputed == 5
+    assert session.segments_reused == 3
+    assert result == analyzer.generate_communication_recommendations('\n'.join(edited))
+
+
+def test_phrases_and_sentences_straddling_segments_match_full_run():
+    analyzer = ContentAnalyzer(['packaging waste', 'rules apply to packaging', 'waste rules apply'])
+    session = analyzer.incremental_session()
+    assert session.result == analyzer.generate_communication_recommendations(session.document)
+    assert session.result['analysis_summary']['complexity_analysis']['total_sentences'] == 1
+
+
+def test_lexicon_edit_invalidates_cached_segments():
+    analyzer = ContentAnalyzer(list(SEGMENTS))
+    session = analyzer.incremental_session()
+    analyzer.cultural_terms.append('annual reports')
+
+    result = session.update(list(SEGMENTS))
+    assert session.segments_reused == 0
+    assert 'annual reports' in result['analysis_summary']['translation_readiness']['cultural_terms_found']
@@ -0,0 +1,44 @@
+from keyword_automaton import KeywordAutomaton
+
+
+def test_scan_reports_counts_categories_and_offsets():
+    automaton = KeywordAutomaton({
+        'high_priority': ['packaging waste', 'reporting deadlines'],
+        'process_terms': ['report', 'deadline', 'register'],
+        'medium_priority': ['producer register', 'waste prevention'],
+    })
+    text = 'the producer register covers packaging waste prevention and reporting deadlines.'
+    hits = automaton.scan(text)
+
+    for term in ['producer register', 'register', 'packaging waste', 'waste prevention',
+                 'reporting deadlines', 'report', 'deadline']:
+        assert hits.count(term) == text.count(term)
+        assert hits.offsets[term] == [text.index(term)]
+    assert hits.categories['register'] == ('process_terms',)
+    assert hits.category_total('process_terms') == 3
+
+
+def test_scan_counts_non_overlapping_like_str_count():
+    hits = KeywordAutomaton({'demo': ['aa']}).scan('aaaaa')
+    assert hits.count('aa') == 'aaaaa'.count('aa')
+    assert hits.offsets['aa'] == [0, 2]
+
+
+def test_empty_lexicon_scans_nothing():
+    assert KeywordAutomaton({}).scan('anything').counts == {}
+
+
+def test_hit_streams_are_in_document_order():
+    automaton = KeywordAutomaton({'demo': ['ab', 'abab', 'bab', 'b']})
+    text = 'ababab'
+    assert list(automaton.iter_matches(text)) == [
+        (0, 'ab'), (0, 'abab'), (1, 'b'), (1, 'bab'), (2, 'ab'),
+        (2, 'abab'), (3, 'b'), (3, 'bab'), (4, 'ab'), (5, 'b')
+    ]
+
+    # iter_hits keeps only what scan counts, shifted by the offset
+    hits = automaton.scan(text)
+    streamed = list(automaton.iter_hits(text, 10))
+    assert streamed == sorted(streamed)
+    assert sorted(streamed) == sorted((offset + 10, term) for term, offsets in hits.offsets.items() for offset in offsets)
+    assert all(hits.count(term) == text.count(term) for term in automaton.terms)
@@ -0,0 +1,63 @@
+from functools import cached_property
+
+import pytest
+
+from content_analyzer import ContentAnalyzer
+from lazy_result import FIELD_DEPENDENCIES, LazyResult, dependency_closure, required_stages
+from text_profile import TextProfile
+
+
+TEXT = (
+    'Producers must register with the national EPR register by March 15. '
+    'Notwithstanding the aforementioned, sellers shall submit packaging waste data before 1 June 2026. '
+    'Due diligence applies. Penalties for non-compliance apply.'
+)
+
+PROFILE_STAGES = {name for name, value in vars(TextProfile).items() if isinstance(value, cached_property)}
+
+
+def computed_fields(result: LazyResult) -> set:
+    names = set()
+    for key in result.computed():
+        value = result[key]
+        names |= computed_fields(value) if isinstance(value, LazyResult) else {key}
+    return names
+
+
+@pytest.mark.parametrize('text', [TEXT, 'Sell more. Ship fast.', ''])
+def test_lazy_result_matches_eager_analysis(text):
+    analyzer = ContentAnalyzer([])
+    assert analyzer.lazy_analysis(text).to_dict() == analyzer.generate_communication_recommendations(text)
+
+
+def test_fields_selector_keeps_nested_layout():
+    analyzer = ContentAnalyzer([])
+    full = analyzer.generate_communication_recommendations(TEXT)
+    selected = analyzer.generate_communication_recommendations(TEXT, fields=['flesch_reading_ease', 'critical_deadlines'])
+
+    summary = full['analysis_summary']
+    assert selected == {'analysis_summary': {
+        'complexity_analysis': {'flesch_reading_ease': summary['complexity_analysis']['flesch_reading_ease']},
+        'key_concepts': {'critical_deadlines': summary['key_concepts']['critical_deadlines']}
+    }}
+    assert analyzer.analyze_text_complexity(TEXT, fields=['total_words']) == {'total_words': len(TEXT.split())}
+    with pytest.raises(ValueError):
+        analyzer.extract_key_concepts(TEXT, fields=['flesch_reading_ease'])
+
+
+def test_deadlines_do_not_count_syllables_or_extract_phrases():
+    analyzer = ContentAnalyzer([])
+    profile = analyzer.build_profile(TEXT)
+    analyzer.generate_communication_recommendations(profile, fields=['critical_deadlines'])
+    assert PROFILE_STAGES & set(vars(profile)) == {'pattern_matches'}
+
+
+@pytest.mark.parametrize('field', sorted(FIELD_DEPENDENCIES))
+def test_dependency_graph_covers_every_access(field):
+    analyzer = ContentAnalyzer([])
+    profile = analyzer.build_profile(TEXT)
+    result = analyzer.lazy_analysis(profile)
+    result.select([field])
+
+    assert PROFILE_STAGES & set(vars(profile)) <= required_stages([field])
+    assert computed_fields(result) <= dependency_closure([field])
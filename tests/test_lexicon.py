@@ -0,0 +1,92 @@
+import json
+import pickle
+
+import pytest
+
+import content_analyzer
+import lexicon as lexicon_module
+from content_analyzer import ContentAnalyzer
+from lexicon import DEFAULT_LEXICON_PATH, Lexicon, activate_lexicon, active_lexicon, reload_lexicon
+
+
+def test_instances_share_one_compiled_lexicon():
+    first, second = ContentAnalyzer([]), ContentAnalyzer([])
+    assert first.lexicon is second.lexicon is active_lexicon()
+    assert first.keyword_automaton() is second.keyword_automaton()
+
+    # Instance lists are private copies
+    first.cultural_terms.append('force majeure')
+    assert 'force majeure' not in second.cultural_terms
+    assert 'force majeure' not in active_lexicon().cultural_terms
+
+
+def test_lexicon_is_read_only():
+    lexicon = active_lexicon()
+    with pytest.raises(AttributeError):
+        lexicon.version = 2
+    with pytest.raises(TypeError):
+        lexicon.epr_keywords['high_priority'] = ()
+
+
+def test_precompiled_cache_round_trip(tmp_path):
+    source = tmp_path / 'lexicon.json'
+    compiled = tmp_path / 'lexicon.compiled'
+    source.write_text(open(DEFAULT_LEXICON_PATH, encoding='utf-8').read(), encoding='utf-8')
+
+    built = Lexicon.from_file(str(source), str(compiled))
+    loaded = Lexicon.from_file(str(source), str(compiled))
+    assert loaded.fingerprint == built.fingerprint
+    assert loaded.automaton.scan('epr compliance').counts == {'epr': 1, 'compliance': 1}
+
+    # Editing the data file makes the stale compiled copy be ignored and rewritten
+    config = json.loads(source.read_text(encoding='utf-8'))
+    config['cultural_terms'].append('force majeure')
+    source.write_text(json.dumps(config), encoding='utf-8')
+    assert 'force majeure' in Lexicon.from_file(str(source), str(compiled)).cultural_terms
+    with open(compiled, 'rb') as handle:
+        assert 'force majeure' in pickle.load(handle)['lexicon'].cultural_terms
+
+
+def test_hot_swap_applies_to_new_analysers(tmp_path):
+    config = active_lexicon().to_config()
+    config['version'] = 2
+    config['cultural_terms'].append('force majeure')
+    path = tmp_path / 'lexicon.json'
+    path.write_text(json.dumps(config), encoding='utf-8')
+
+    running = ContentAnalyzer([])
+    previous = active_lexicon()
+    try:
+        assert reload_lexicon(str(path))
+        assert not reload_lexicon(str(path))
+        assert active_lexicon().version == 2
+        assert 'force majeure' in ContentAnalyzer([]).cultural_terms
+        assert 'force majeure' not in running.cultural_terms
+    finally:
+        activate_lexicon(previous)
+        lexicon_module._ACTIVE_SOURCE = (None, None)
+
+
+def test_compiled_caches_are_bounded():
+    analyzer = ContentAnalyzer([])
+    for edit in range(content_analyzer.COMPILED_CACHE_SIZE + 10):
+        analyzer.cultural_terms.append(f'term {edit}')
+        analyzer.action_patterns = [rf'term\s+{edit}']
+        analyzer.keyword_automaton()
+        analyzer.pattern_matcher()
+    assert len(content_analyzer._AUTOMATON_CACHE) <= content_analyzer.COMPILED_CACHE_SIZE
+    assert len(content_analyzer._MATCHER_CACHE) <= content_analyzer.COMPILED_CACHE_SIZE
+    # The shared default lexicon is rebuilt from its precompiled automaton after eviction
+    assert ContentAnalyzer([]).keyword_automaton() is active_lexicon().automaton
+
+
+@pytest.mark.parametrize('payload', [['not', 'a', 'dict'], {'format': None}, None])
+def test_corrupt_precompiled_cache_is_rebuilt(tmp_path, payload):
+    source = tmp_path / 'lexicon.json'
+    compiled = tmp_path / 'lexicon.compiled'
+    source.write_text(open(DEFAULT_LEXICON_PATH, encoding='utf-8').read(), encoding='utf-8')
+    with open(compiled, 'wb') as handle:
+        pickle.dump(payload, handle)
+
+    lexicon = Lexicon.from_file(str(source), str(compiled))
+    assert lexicon.automaton.scan('epr compliance').counts == {'epr': 1, 'compliance': 1}
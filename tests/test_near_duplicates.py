@@ -0,0 +1,98 @@
+import pytest
+
+from content_analyzer import ContentAnalyzer
+from near_duplicates import MinHasher, NearDuplicateIndex, estimated_jaccard, jaccard
+
+
+OBLIGATION = (
+    'Producers placing packaging on the {country} market must register with the national producer '
+    'register and shall submit annual packaging waste data before {date}. Failure to comply with '
+    'extended producer responsibility obligations may result in penalties and removal from the marketplace.'
+)
+
+OTHER = 'Sellers need to provide evidence of glass recovery through an approved take-back scheme every quarter.'
+
+
+def test_signatures_estimate_jaccard():
+    hasher = MinHasher(num_perm=128)
+    first = hasher.shingle_hashes(OBLIGATION.format(country='German', date='March 15'))
+    second = hasher.shingle_hashes(OBLIGATION.format(country='French', date='March 15'))
+    assert hasher.signature(first) == hasher.signature(set(first))
+    assert abs(estimated_jaccard(hasher.signature(first), hasher.signature(second)) - jaccard(first, second)) < 0.2
+
+
+def test_index_clusters_variants_above_threshold_only():
+    index = NearDuplicateIndex(threshold=0.7)
+    assert index.assign(0, OBLIGATION.format(country='German', date='March 15')) == (0, False)
+    assert index.assign(1, OBLIGATION.format(country='French', date='March 15')) == (0, False)
+    assert index.assign(2, OTHER) == (2, False)
+    assert index.assign(3, '  ' + OTHER) == (2, True)
+
+    strict = NearDuplicateIndex(threshold=0.99)
+    strict.assign(0, OBLIGATION.format(country='German', date='March 15'))
+    assert strict.assign(1, OBLIGATION.format(country='French', date='March 15')) == (1, False)
+
+
+def test_deduplicated_batch_reuses_representative_results():
+    segments = [
+        OBLIGATION.format(country='German', date='March 15'),
+        OBLIGATION.format(country='Spanish', date='June 30'),
+        OTHER,
+        OBLIGATION.format(country='German', date='March 15')
+    ]
+    analyzer = ContentAnalyzer(segments)
+    batch = analyzer.analyze_segments_deduplicated(threshold=0.6, workers=1)
+
+    assert batch['clusters'] == [[0, 1, 3], [2]]
+    assert batch['stats'] == {'segments': 4, 'representatives': 2, 'exact_duplicates': 1,
+                              'near_duplicates': 1, 'analyses_skipped': 2, 'skip_ratio': 0.5}
+
+    records = batch['records']
+    assert [record['representative'] for record in records] == [0, 0, 2, 0]
+    assert records[3]['result'] == records[0]['result']
+    assert records[2]['result'] == analyzer.generate_communication_recommendations(OTHER)
+
+    # The near duplicate keeps the representative's scores but gets its own deadline
+    concepts = records[1]['result']['analysis_summary']['key_concepts']
+    assert concepts['critical_deadlines'] == ['before June 30']
+    assert records[1]['result']['strategic_recommendations'] == records[0]['result']['strategic_recommendations']
+
+
+def test_near_duplicate_results_are_consistent_with_themselves():
+    representative = (
+        'Sellers must register the packaging they sell and report the weight of each kind of packaging '
+        'to the national register every year and keep the receipts and the records for the inspectors who '
+        'may ask for them before the next deadline on March 15 or the sellers will pay penalties.'
+    )
+    # Short sentences: far easier to read, so a full analysis would pick other channels
+    member = (representative.replace(' and report', '. They report').replace(' and keep', '. They keep')
+              .replace(' who may', '. They may').replace('March 15', 'June 30'))
+    analyzer = ContentAnalyzer([representative, member])
+    records = analyzer.analyze_segments_deduplicated(threshold=0.5, workers=1)['records']
+    assert records[1]['representative'] == 0
+
+    result = records[1]['result']
+    summary = result['analysis_summary']
+    concepts = summary['key_concepts']
+    assert concepts['critical_deadlines'] == analyzer.extract_key_concepts(member)['critical_deadlines']
+    assert summary['complexity_analysis'] == records[0]['result']['analysis_summary']['complexity_analysis']
+    # The representative's own result is left untouched
+    assert records[0]['result'] == analyzer.generate_communication_recommendations(representative)
+
+    # Everything derived from the member's own fields agrees with the rest of its record
+    assert concepts['communication_priorities'] == analyzer._rank_communication_priorities(
+        concepts['epr_concepts'], concepts['action_items'])
+    assert result == analyzer._recommendations(summary['complexity_analysis'], concepts,
+                                               summary['translation_readiness'])
+
+
+def test_near_duplicates_adjust_only_pattern_fields():
+    analyzer = ContentAnalyzer([OTHER])
+    with pytest.raises(ValueError, match='flesch_reading_ease'):
+        analyzer.analyze_segments_deduplicated(adjust_fields=['flesch_reading_ease'], workers=1)
+
+
+def test_whitespace_inside_text_is_not_an_exact_duplicate():
+    index = NearDuplicateIndex(threshold=0.99)
+    index.assign(0, 'Producers report packaging waste yearly.')
+    assert index.assign(1, 'Producers report packaging\nwaste yearly.') != (0, True)
@@ -0,0 +1,44 @@
+from content_analyzer import ContentAnalyzer
+from pattern_matcher import PatternMatcher
+
+
+TEXT = 'Sellers must register by March 31. Producers shall report on 12/03/2025 and must register again.'
+
+
+def test_spans_are_typed_and_in_document_order():
+    spans = ContentAnalyzer([]).find_actionable_spans(TEXT)
+    assert [(s['type'], s['text']) for s in spans] == [
+        ('action_item', 'must register'),
+        ('deadline', 'by March 31'),
+        ('action_item', 'shall report'),
+        ('deadline', '12/03/2025'),
+        ('action_item', 'must register'),
+    ]
+    for span in spans:
+        assert TEXT[span['start']:span['end']] == span['text']
+
+
+def test_action_items_deduplicate_in_document_order():
+    concepts = ContentAnalyzer([]).extract_key_concepts(TEXT)
+    assert concepts['action_items'] == ['must register', 'shall report']
+    assert concepts['critical_deadlines'] == ['by March 31', '12/03/2025']
+
+
+def test_matcher_is_shared_and_tolerates_inner_groups():
+    assert ContentAnalyzer([]).pattern_matcher() is ContentAnalyzer([]).pattern_matcher()
+
+    matcher = PatternMatcher({'fee': [r'(\d+) (eur|usd)'], 'date': [r'\d{4}']})
+    assert [(m['type'], m['text']) for m in matcher.scan('Pay 50 eur in 2026')] == [('fee', '50 eur'), ('date', '2026')]
+
+
+def test_pattern_overrides_reach_corpus_workers():
+    analyzer = ContentAnalyzer([])
+    analyzer.action_patterns = [r'register\s+\w+']
+    analyzer.deadline_patterns = [r'\d{1,2}/\d{1,2}/\d{4}']
+    text = 'Producers must register packaging and register data on 12/03/2025 or by March 31.'
+    concepts = analyzer.extract_key_concepts(text)
+    assert concepts['action_items'] == ['register packaging', 'register data']
+    assert concepts['critical_deadlines'] == ['12/03/2025']
+
+    record, = analyzer.analyze_corpus([text], workers=2)
+    assert record['result'] == analyzer.generate_communication_recommendations(text)
@@ -0,0 +1,60 @@
+import pytest
+
+import persona_matrix
+from content_analyzer import ContentAnalyzer
+from persona_matrix import SellerPersona, load_personas
+
+
+DRAFTS = [
+    'Producers must register packaging waste before 1 June 2026. Penalties apply.',
+    'Notwithstanding the aforementioned obligations, whereas the producer register thereof applies.',
+    'Sell more. Ship fast.',
+    'Extended producer responsibility compliance requires registration with the national authority.',
+    ''
+]
+
+
+def test_shipped_personas_load_and_round_trip():
+    personas = load_personas()
+    assert len(personas) >= 8
+    assert len({persona.persona_id for persona in personas}) == len(personas)
+    for persona in personas:
+        assert SellerPersona.from_dict(persona.to_dict()) == persona
+
+
+@pytest.mark.skipif(persona_matrix.np is not None, reason='numpy is installed')
+def test_scoring_requires_numpy():
+    with pytest.raises(ImportError):
+        ContentAnalyzer([]).score_personas(DRAFTS)
+
+
+def test_default_thresholds_persona_matches_scalar_rules():
+    pytest.importorskip('numpy')
+    analyzer = ContentAnalyzer([])
+    scores = analyzer.score_personas(DRAFTS, [SellerPersona.from_dict({
+        'id': 'default', 'min_reading_ease': 60, 'max_legal_ratio': 0.02,
+        'adaptation': {'high': {'reading_ease_below': 50, 'legal_ratio_above': 0.05, 'epr_density_above': 5},
+                       'medium': {'reading_ease_below': 60, 'legal_ratio_above': 0.02, 'epr_density_above': 3}}
+    })])
+
+    for index, draft in enumerate(DRAFTS):
+        complexity = analyzer.analyze_text_complexity(draft)
+        row = scores.row(index)['default']
+        assert row['fit'] == (complexity['recommended_audience'] == 'All seller segments')
+        assert row['adaptation_priority'] == complexity['adaptation_priority']
+
+
+def test_batch_scores_every_draft_against_every_persona():
+    pytest.importorskip('numpy')
+    analyzer = ContentAnalyzer([])
+    table = analyzer.analyze_complexity_batch(DRAFTS)
+    scores = analyzer.score_personas(table)
+    personas = load_personas()
+
+    assert scores.shape == (len(DRAFTS), len(personas))
+    # Compliance teams have no thresholds, so every draft fits them
+    assert all('compliance_team' in scores.fitting_personas(index) for index in range(len(DRAFTS)))
+    for index in range(len(DRAFTS)):
+        flesch = table['flesch_reading_ease'][index]
+        for persona, result in zip(personas, scores.row(index).values()):
+            assert result['reading_gap'] == round(max(0.0, persona.min_reading_ease - flesch), 2)
@@ -0,0 +1,46 @@
+from collections import Counter
+
+from content_analyzer import ContentAnalyzer
+from phrase_extractor import PhraseExtractor, SpaceSavingCounter
+
+
+TOKENS = 'the producer must register the producer must report to the authority'.split()
+
+
+def test_ngram_range_counts_every_length():
+    phrases = PhraseExtractor(ngram_range=(2, 4)).top_phrases(TOKENS, 3)
+    assert phrases == [
+        {'phrase': 'the producer', 'frequency': 2},
+        {'phrase': 'producer must', 'frequency': 2},
+        {'phrase': 'the producer must', 'frequency': 2},
+    ]
+
+
+def test_stopword_only_ngrams_are_skipped():
+    extractor = PhraseExtractor(ngram_range=(1, 2), skip_stopword_only=True)
+    phrases = {p['phrase'] for p in extractor.top_phrases(TOKENS, 50)}
+    assert 'the' not in phrases and 'to the' not in phrases
+    assert 'the authority' in phrases
+
+
+def test_default_matches_trigram_counter():
+    trigrams = Counter(' '.join(TOKENS[i:i + 3]) for i in range(len(TOKENS) - 2))
+    expected = [{'phrase': p, 'frequency': c} for p, c in trigrams.most_common(5)]
+    assert PhraseExtractor().top_phrases(TOKENS, 5) == expected
+
+
+def test_space_saving_keeps_heavy_hitters_in_bounded_memory():
+    counter = SpaceSavingCounter(capacity=10)
+    for i in range(5000):
+        counter.update('frequent' if i % 3 == 0 else f'rare-{i}')
+    assert len(counter) == 10
+    item, count, error = counter.top(1)[0]
+    assert item == 'frequent'
+    assert count - error <= 1667 <= count
+
+
+def test_rank_corpus_phrases():
+    analyzer = ContentAnalyzer([])
+    texts = ['Producers must register packaging.'] * 20 + [f'Notice number {i} applies.' for i in range(200)]
+    top = analyzer.rank_corpus_phrases(texts, top_n=2, capacity=50)
+    assert [p['phrase'] for p in top] == ['producers must register', 'must register packaging']
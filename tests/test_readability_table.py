@@ -0,0 +1,40 @@
+import pytest
+
+import readability_table
+from content_analyzer import ContentAnalyzer
+
+
+TEXTS = [
+    'Producers must register packaging waste before 1 June 2026. Penalties apply.',
+    'Notwithstanding the aforementioned obligations, whereas the producer register thereof applies.',
+    'Sell more. Ship fast.',
+    ''
+]
+
+
+@pytest.mark.skipif(readability_table.np is not None, reason='numpy is installed')
+def test_batch_mode_requires_numpy():
+    with pytest.raises(ImportError):
+        ContentAnalyzer([]).analyze_complexity_batch(TEXTS)
+
+
+def test_rows_match_scalar_analysis():
+    pytest.importorskip('numpy')
+    analyzer = ContentAnalyzer([])
+    table = analyzer.analyze_complexity_batch(TEXTS)
+
+    assert len(table) == len(TEXTS)
+    for index, text in enumerate(TEXTS):
+        assert table.row(index) == analyzer.analyze_text_complexity(text)
+    assert table.labels('adaptation_priority')[1].startswith('HIGH')
+
+
+def test_save_and_memory_mapped_load(tmp_path):
+    numpy = pytest.importorskip('numpy')
+    table = ContentAnalyzer([]).analyze_complexity_batch(TEXTS)
+    table.save(str(tmp_path))
+
+    loaded = readability_table.ReadabilityTable.load(str(tmp_path))
+    assert isinstance(loaded['flesch_reading_ease'], numpy.memmap)
+    assert numpy.array_equal(loaded['total_words'], table['total_words'])
+    assert loaded.row(2) == table.row(2)
@@ -0,0 +1,75 @@
+from datetime import date
+
+import pytest
+
+from content_analyzer import ContentAnalyzer
+from segment_index import SortedIndex, parse_deadline
+
+
+SEGMENTS = [
+    'Producers must meet reporting deadlines before March 15 or face penalties.',
+    'Notwithstanding the aforementioned provisions, whereas the reporting deadlines thereof apply, '
+    'producer obligations pursuant to national law shall be discharged by 1 September 2026.',
+    'The circular economy reduces environmental impact.',
+    'Penalties apply for missed reporting deadlines by July 1.'
+]
+
+
+def build_index():
+    return ContentAnalyzer(SEGMENTS).index_segments(default_year=2026)
+
+
+def test_parse_deadline_shapes():
+    assert parse_deadline('15/03/2026', 2026) == date(2026, 3, 15)
+    assert parse_deadline('1 June 2026', 2025) == date(2026, 6, 1)
+    assert parse_deadline('by March 15', 2027) == date(2027, 3, 15)
+    assert parse_deadline('before Friday 12', 2026) is None
+    assert parse_deadline('31/02/2026', 2026) is None
+
+
+def test_postings_keep_offsets():
+    index = build_index()
+    offsets = index.offsets('reporting deadlines')
+    assert sorted(offsets) == [0, 1, 3]
+    assert offsets[0] == [SEGMENTS[0].lower().index('reporting deadlines')]
+
+
+def test_boolean_terms_with_range_and_deadline_filters():
+    index = build_index()
+    analyzer = ContentAnalyzer([])
+    scores = [analyzer.analyze_text_complexity(segment)['flesch_reading_ease'] for segment in SEGMENTS]
+
+    assert index.search(all_terms=['reporting deadlines', 'penalties']) == [0, 3]
+    assert index.search(any_terms=['circular economy', 'producer obligations']) == [1, 2]
+    assert index.search(all_terms=['reporting deadlines'], not_terms=['penalties']) == [1]
+    assert index.search(categories=['complexity_indicators']) == [1]
+    assert index.search(all_terms=['reporting deadlines'], deadline_before=date(2026, 6, 1)) == [0]
+    assert index.search(deadline_after=date(2026, 6, 30)) == [1, 3]
+
+    threshold = sorted(scores)[2]
+    expected = [position for position, score in enumerate(scores) if score < threshold]
+    assert index.search(ranges={'flesch_reading_ease': (None, threshold)}) == expected
+
+    with pytest.raises(ValueError, match='flesch_score'):
+        index.search(ranges={'flesch_score': (None, threshold)})
+
+
+def test_incremental_add_and_remove():
+    index = build_index()
+    index.remove(0)
+    assert 0 not in index and len(index) == 3
+    assert index.search(all_terms=['penalties']) == [3]
+    assert index.search(deadline_before=date(2026, 6, 1)) == []
+
+    ContentAnalyzer([]).index_segments([('new', 'Penalties are due before April 2.')], index, default_year=2026)
+    assert index.search(all_terms=['penalties'], deadline_before=date(2026, 6, 1)) == ['new']
+
+
+def test_sorted_index_merges_and_compacts():
+    sorted_index = SortedIndex()
+    for doc in range(10000):
+        sorted_index.add(doc % 100, doc)
+    assert sorted_index.count(10, 20) == 1000
+    sorted_index.compact({doc: None for doc in range(0, 10000, 2)})
+    assert sorted_index.docs(None, 1) == set(range(0, 10000, 100))
+    assert len(sorted_index) == 5000
@@ -0,0 +1,41 @@
+from complexity_stats import ComplexityStats
+from content_analyzer import ContentAnalyzer
+from segmentation import segment
+
+
+TEXT = 'Under Art. 5 producers pay up to €50,000, e.g. for take-back gaps. Fees rose 3.5% in 2025! Why?'
+
+
+def test_abbreviations_and_decimals_do_not_end_sentences():
+    segmentation = segment(TEXT)
+    assert segmentation.sentences() == [
+        'Under Art. 5 producers pay up to €50,000, e.g. for take-back gaps', ' Fees rose 3.5% in 2025', ' Why'
+    ]
+    assert segmentation.tokens()[:8] == ['Under', 'Art', '5', 'producers', 'pay', 'up', 'to', '50,000']
+    assert 'take-back' in segmentation.tokens() and '3.5' in segmentation.tokens()
+
+
+def test_offsets_index_the_original_buffer():
+    segmentation = segment(TEXT)
+    spans = list(segmentation.token_spans())
+    assert [TEXT[start:end] for start, end in spans] == segmentation.tokens()
+    assert segmentation.token_span(-1) == (TEXT.index('Why'), TEXT.index('Why') + 3)
+    assert segmentation.sentence_token_counts() == [12, 5, 1]
+    assert segment(TEXT).sentence_token_counts() == [12, 5, 1]  # same without token offsets
+
+
+def test_every_analysis_uses_the_same_word_count():
+    analyzer = ContentAnalyzer([])
+    complexity = analyzer.analyze_text_complexity(TEXT)
+    translation = analyzer.assess_translation_readiness(TEXT)
+    assert complexity['total_words'] == segment(TEXT).token_count == 18
+    assert complexity['total_sentences'] == 3
+    assert translation['avg_sentence_length'] == 6.0
+
+
+def test_segments_split_after_abbreviations_merge_exactly():
+    segments = ['See Art.', '5 and para.', '2 before 3.5% applies.', 'Done']
+    analyzer = ContentAnalyzer(segments)
+    merged = sum(analyzer.segment_complexity_stats(), ComplexityStats())
+    assert merged == analyzer.complexity_stats('\n'.join(segments))
+    assert merged.total_sentences == 2
@@ -0,0 +1,40 @@
+import json
+
+from content_analyzer import SYLLABLE_LEXICON_PATH, ContentAnalyzer
+from syllable_counter import SyllableCounter, count_syllables, load_lexicon, save_lexicon
+
+
+WORDS = 'producers must register packaging before the compliance deadline'.split()
+
+
+def test_batch_matches_word_by_word_counts():
+    counter = SyllableCounter()
+    tokens = WORDS * 3
+    assert counter.count_batch(tokens) == [count_syllables(word) for word in tokens]
+    assert counter.total(tokens) == sum(count_syllables(word) for word in tokens)
+    # Each distinct word was computed once, then served from the memo
+    assert counter.misses == len(set(WORDS))
+
+
+def test_memo_is_bounded():
+    counter = SyllableCounter(max_entries=4)
+    counter.count_batch(WORDS)
+    assert len(counter) == 4
+    assert counter.count('deadline') == 2
+
+
+def test_lexicon_round_trip_and_precedence(tmp_path):
+    path = str(tmp_path / 'lexicon.json')
+    save_lexicon(path, WORDS)
+    assert load_lexicon(path) == {word: count_syllables(word) for word in WORDS}
+
+    counter = SyllableCounter(lexicon={'compliance': 3})
+    assert counter.count('compliance') == 3
+    assert counter.misses == 0
+
+
+def test_bundled_lexicon_agrees_with_heuristic():
+    with open(SYLLABLE_LEXICON_PATH, encoding='utf-8') as handle:
+        words = json.load(handle)['words']
+    assert words and all(count_syllables(word) == syllables for word, syllables in words.items())
+    assert ContentAnalyzer([])._count_syllables('Packaging') == 3